@@ -15,6 +15,10 @@ from logging import (
 from time import time
 from os import cpu_count
 
+from .core.cpu_slots import CpuSlots
+from .core.task_queue import FairQueue
+from .core.task_registry import TaskRegistry
+
 getLogger("requests").setLevel(WARNING)
 getLogger("urllib3").setLevel(WARNING)
 getLogger("pyrogram").setLevel(ERROR)
@@ -43,10 +47,12 @@ intervals = {"status": {}, "jd": "", "stopAll": False}
 jd_downloads = {}
 user_data = {}
 aria2_options = {}
-queued_dl = {}
-queued_up = {}
+queued_dl = FairQueue()
+queued_up = FairQueue()
+disk_reservations = {}
+queued_reservations = {}
 status_dict = {}
-task_dict = {}
+task_dict = TaskRegistry()
 rss_dict = {}
 auth_chats = {}
 excluded_extensions = ["aria2", "!qB"]
@@ -61,7 +67,7 @@ multi_tags = set()
 task_dict_lock = Lock()
 queue_dict_lock = Lock()
 jd_listener_lock = Lock()
-cpu_eater_lock = Lock()
+cpu_slots = CpuSlots(cpu_no)
 same_directory_lock = Lock()
 
 scheduler = AsyncIOScheduler(event_loop=bot_loop)
@@ -21,7 +21,9 @@ async def main():
     await gather(load_configurations(), update_variables())
 
     from .core.torrent_manager import TorrentManager
+    from .helper.ext_utils.system_stats import SystemStats
 
+    SystemStats.start()
     await TorrentManager.initiate()
     await gather(
         update_aria2_options(),
@@ -15,6 +15,7 @@ class Config:
     DATABASE_URL = ""
     IBB_URL = ""
     DEFAULT_UPLOAD = "rc"
+    DIRECT_DOWNLOAD_WORKERS = 4
     EQUAL_SPLITS = False
     EXCLUDED_EXTENSIONS = ""
     INCLUDED_EXTENSIONS = ""
@@ -29,6 +30,8 @@ class Config:
     LEECH_DUMP_CHAT = ""
     LEECH_FILENAME_PREFIX = ""
     LEECH_SPLIT_SIZE = 2097152000
+    LEECH_UPLOAD_WORKERS = 3
+    LEECH_VIRTUAL_SPLIT = True
     MEDIA_GROUP = False
     HYBRID_LEECH = False
     HYDRA_IP = ""
@@ -38,6 +41,7 @@ class Config:
     QUEUE_ALL = 0
     QUEUE_DOWNLOAD = 0
     QUEUE_UPLOAD = 0
+    QUEUE_USER_LIMIT = 0
     RCLONE_FLAGS = ""
     RCLONE_PATH = ""
     RCLONE_SERVE_URL = ""
@@ -57,6 +61,7 @@ class Config:
     SUDO_USERS = ""
     TELEGRAM_API = 0
     TELEGRAM_HASH = ""
+    TG_DOWNLOAD_CONNECTIONS = 4
     TG_PROXY = {}
     THUMBNAIL_LAYOUT = ""
     TORRENT_TIMEOUT = 0
@@ -69,6 +74,7 @@ class Config:
     USE_SERVICE_ACCOUNTS = False
     WEB_PINCODE = False
     YT_DLP_OPTIONS = {}
+    YT_DLP_WORKERS = 2
     TMDB_API_KEY = ""
     IMGBB_API_KEY = ""
     
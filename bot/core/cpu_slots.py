@@ -0,0 +1,88 @@
+from asyncio import get_running_loop
+from collections import deque
+from contextlib import asynccontextmanager
+
+
+# Weighted semaphore of CPU slots, one slot per core. Jobs running at the same
+# time are pinned to disjoint core sets and waiters are served in FIFO order.
+class CpuSlots:
+    def __init__(self, total):
+        self.total = max(1, total)
+        self.weights = {
+            "ffmpeg": max(2, self.total // 4),
+            "convert": max(2, self.total // 4),
+            "sample": max(1, self.total // 8),
+            "merge": 1,
+            "split": 1,
+            "extract": 2,
+            "zip": 1,
+        }
+        self._free = list(reversed(range(self.total)))
+        self._waiters = deque()
+        self.jobs = {}
+        self._owners = {}
+
+    @property
+    def used(self):
+        return self.total - len(self._free)
+
+    @property
+    def waiting(self):
+        return len(self._waiters)
+
+    def weight(self, kind):
+        return min(self.weights.get(kind, 1), self.total)
+
+    def _take(self, kind, weight):
+        core_ids = self._free[-weight:]
+        del self._free[-weight:]
+        self.jobs[kind] = self.jobs.get(kind, 0) + 1
+        self._owners[core_ids[0]] = kind
+        return core_ids
+
+    async def acquire(self, kind):
+        weight = self.weight(kind)
+        if not self._waiters and len(self._free) >= weight:
+            return self._take(kind, weight)
+        future = get_running_loop().create_future()
+        waiter = (kind, weight, future)
+        self._waiters.append(waiter)
+        try:
+            return await future
+        except BaseException:
+            if future.done() and not future.cancelled():
+                self.release(future.result())
+            elif waiter in self._waiters:
+                self._waiters.remove(waiter)
+                self._wake()
+            raise
+
+    @asynccontextmanager
+    async def hold(self, kind):
+        core_ids = await self.acquire(kind)
+        try:
+            yield core_ids
+        finally:
+            self.release(core_ids)
+
+    def release(self, core_ids):
+        if not core_ids:
+            return
+        kind = self._owners.pop(core_ids[0])
+        self._free.extend(core_ids)
+        self._free.sort(reverse=True)
+        self.jobs[kind] -= 1
+        if not self.jobs[kind]:
+            del self.jobs[kind]
+        self._wake()
+
+    def _wake(self):
+        while self._waiters:
+            kind, weight, future = self._waiters[0]
+            if future.done():
+                self._waiters.popleft()
+                continue
+            if len(self._free) < weight:
+                break
+            self._waiters.popleft()
+            future.set_result(self._take(kind, weight))
@@ -0,0 +1,81 @@
+from collections import deque
+
+
+# Waiting tasks served round-robin between users, owner/sudo ring first.
+class FairQueue:
+    def __init__(self):
+        self._events = {}
+        self._owners = {}
+        self._users = {}
+        self._rings = (deque(), deque())
+
+    def __contains__(self, mid):
+        return mid in self._events
+
+    def __len__(self):
+        return len(self._events)
+
+    def __bool__(self):
+        return bool(self._events)
+
+    def __getitem__(self, mid):
+        return self._events[mid]
+
+    def __delitem__(self, mid):
+        del self._events[mid]
+        user_id, tier = self._owners.pop(mid)
+        tasks = self._users[user_id]
+        tasks.remove(mid)
+        if not tasks:
+            del self._users[user_id]
+            self._rings[tier].remove(user_id)
+
+    def keys(self):
+        return self._events.keys()
+
+    def add(self, mid, user_id, event, priority=False):
+        tier = 0 if priority else 1
+        self._events[mid] = event
+        self._owners[mid] = (user_id, tier)
+        if user_id not in self._users:
+            self._users[user_id] = deque()
+            self._rings[tier].append(user_id)
+        self._users[user_id].append(mid)
+
+    def pop(self, is_capped=None, can_start=None):
+        for ring in self._rings:
+            for _ in range(len(ring)):
+                user_id = ring[0]
+                tasks = self._users[user_id]
+                if (is_capped is not None and is_capped(user_id)) or (
+                    can_start is not None and not can_start(tasks[0])
+                ):
+                    ring.rotate(-1)
+                    continue
+                mid = tasks.popleft()
+                if tasks:
+                    ring.rotate(-1)
+                else:
+                    ring.popleft()
+                    del self._users[user_id]
+                del self._owners[mid]
+                return mid, self._events.pop(mid)
+        return None, None
+
+    def position(self, mid):
+        if mid not in self._owners:
+            return 0
+        user_id, tier = self._owners[mid]
+        index = self._users[user_id].index(mid)
+        position = sum(
+            len(self._users[uid]) for ring in self._rings[:tier] for uid in ring
+        )
+        ahead = True
+        for uid in self._rings[tier]:
+            if uid == user_id:
+                position += index
+                ahead = False
+                continue
+            count = len(self._users[uid])
+            position += min(count, index) + (1 if ahead and count > index else 0)
+        return position + 1
@@ -0,0 +1,105 @@
+from inspect import iscoroutinefunction
+from time import time
+
+
+# task_dict keeps an immutable tuple of its tasks, rebuilt lazily after any
+# change, so readers can iterate across awaits without holding task_dict_lock.
+# The last seen status of every task is tracked too, with per-status counts
+# updated on each transition instead of recounting all tasks. Plain statuses
+# are cheap and always re-read; statuses that have to be awaited are re-read
+# once they are older than STATUS_TTL.
+class TaskRegistry(dict):
+    STATUS_TTL = 5
+
+    def __init__(self):
+        super().__init__()
+        self.version = 0
+        self._snapshot = None
+        self.statuses = {}
+        self.status_counts = {}
+        self.status_times = {}
+
+    def _changed(self):
+        self.version += 1
+        self._snapshot = None
+
+    def _count(self, status, step):
+        count = self.status_counts.get(status, 0) + step
+        if count:
+            self.status_counts[status] = count
+        else:
+            self.status_counts.pop(status, None)
+
+    def _forget_status(self, key):
+        self.status_times.pop(key, None)
+        if (old := self.statuses.pop(key, None)) is not None:
+            self._count(old, -1)
+
+    def is_stale(self, task):
+        key = task.listener.mid
+        return (
+            not iscoroutinefunction(task.status)
+            or key not in self.statuses
+            or time() - self.status_times.get(key, 0) > self.STATUS_TTL
+        )
+
+    def record_status(self, task, status):
+        key = task.listener.mid
+        if self.get(key) is not task:
+            return
+        self.status_times[key] = time()
+        old = self.statuses.get(key)
+        if old == status:
+            return
+        if old is not None:
+            self._count(old, -1)
+        self.statuses[key] = status
+        self._count(status, 1)
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._changed()
+        self._forget_status(key)
+        if not iscoroutinefunction(value.status):
+            try:
+                self.record_status(value, value.status())
+            except Exception:
+                pass
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._changed()
+        self._forget_status(key)
+
+    def pop(self, key, *args):
+        value = super().pop(key, *args)
+        self._changed()
+        self._forget_status(key)
+        return value
+
+    def popitem(self):
+        key, value = super().popitem()
+        self._changed()
+        self._forget_status(key)
+        return key, value
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def clear(self):
+        super().clear()
+        self._changed()
+        self.statuses.clear()
+        self.status_counts.clear()
+        self.status_times.clear()
+
+    def snapshot(self):
+        if self._snapshot is None:
+            self._snapshot = tuple(self.values())
+        return self._snapshot
@@ -1,8 +1,10 @@
 from pyrogram import Client, enums, utils as pyroutils
 from asyncio import Lock
+from inspect import signature
 
 from .. import LOGGER
 from .config_manager import Config
+from .upload_resume import ResumableClient
 
 pyroutils.MIN_CHAT_ID = -999999999999
 pyroutils.MIN_CHANNEL_ID = -100999999999999
@@ -15,18 +17,34 @@ class TgClient:
     ID = 0
     IS_PREMIUM_USER = False
     MAX_SPLIT_SIZE = 2097152000
+    MAX_TRANSMISSIONS = 10
+
+    # Newer pyrofork releases cap get_file/stream_media per client with a
+    # semaphore sized by max_concurrent_transmissions, which would serialize
+    # the parallel download streams. 2.2.11 has neither the cap nor the
+    # argument, so it is only passed when the Client accepts it.
+    @classmethod
+    def _transmission_kwargs(cls):
+        if "max_concurrent_transmissions" not in signature(Client).parameters:
+            return {}
+        return {
+            "max_concurrent_transmissions": max(
+                cls.MAX_TRANSMISSIONS, Config.TG_DOWNLOAD_CONNECTIONS or 1
+            )
+        }
 
     @classmethod
     async def start_bot(cls):
         LOGGER.info("Creating client from BOT_TOKEN")
         cls.ID = Config.BOT_TOKEN.split(":", 1)[0]
-        cls.bot = Client(
+        cls.bot = ResumableClient(
             cls.ID,
             Config.TELEGRAM_API,
             Config.TELEGRAM_HASH,
             proxy=Config.TG_PROXY,
             bot_token=Config.BOT_TOKEN,
             parse_mode=enums.ParseMode.HTML,
+            **cls._transmission_kwargs(),
         )
         await cls.bot.start()
         cls.NAME = cls.bot.me.username
@@ -36,7 +54,7 @@ class TgClient:
         if Config.USER_SESSION_STRING:
             LOGGER.info("Creating client from USER_SESSION_STRING")
             try:
-                cls.user = Client(
+                cls.user = ResumableClient(
                     "user",
                     Config.TELEGRAM_API,
                     Config.TELEGRAM_HASH,
@@ -44,6 +62,7 @@ class TgClient:
                     session_string=Config.USER_SESSION_STRING,
                     parse_mode=enums.ParseMode.HTML,
                     sleep_threshold=60,
+                    **cls._transmission_kwargs(),
                 )
                 await cls.user.start()
                 cls.IS_PREMIUM_USER = cls.user.me.is_premium
@@ -1,8 +1,9 @@
 from aioaria2 import Aria2WebsocketClient
-from asyncio import gather, TimeoutError
+from asyncio import gather, sleep, wait_for, TimeoutError
 from aiohttp import ClientError
 from pathlib import Path
 from inspect import iscoroutinefunction
+from time import time
 from tenacity import (
     retry,
     stop_after_attempt,
@@ -10,7 +11,7 @@ from tenacity import (
     retry_if_exception_type,
 )
 
-from .. import LOGGER, aria2_options
+from .. import LOGGER, aria2_options, bot_loop
 
 
 def wrap_with_retry(obj, max_retries=3):
@@ -34,13 +35,117 @@ def wrap_with_retry(obj, max_retries=3):
 
 class TorrentManager:
     aria2 = None
+    POLL_INTERVAL = 1
+    # Only the fields the status classes and aria2_name read.
+    POLL_KEYS = [
+        "gid",
+        "status",
+        "totalLength",
+        "completedLength",
+        "downloadSpeed",
+        "uploadSpeed",
+        "uploadLength",
+        "numSeeders",
+        "connections",
+        "seeder",
+        "errorMessage",
+        "followedBy",
+        "dir",
+        "files",
+        "bittorrent",
+    ]
+    downloads = {}
+    global_stat = {}
+    polled_at = 0
+    _poller = None
+    _watchers = {}
 
     @classmethod
     async def initiate(cls):
         cls.aria2 = await Aria2WebsocketClient.new("http://localhost:6800/jsonrpc")
+        if cls._poller is None:
+            cls._poller = bot_loop.create_task(cls._poll_loop())
+
+    @classmethod
+    async def poll(cls):
+        results = await cls.aria2.multicall(
+            [
+                {"methodName": "aria2.tellActive", "params": [cls.POLL_KEYS]},
+                {
+                    "methodName": "aria2.tellWaiting",
+                    "params": [0, 1000, cls.POLL_KEYS],
+                },
+                {
+                    "methodName": "aria2.tellStopped",
+                    "params": [0, 1000, cls.POLL_KEYS],
+                },
+                {"methodName": "aria2.getGlobalStat", "params": []},
+            ]
+        )
+        values = [
+            res[0] if isinstance(res, list) and res else None for res in results
+        ]
+        downloads = {}
+        for res in values[:3]:
+            if isinstance(res, list):
+                downloads.update((d["gid"], d) for d in res if "gid" in d)
+        cls.downloads = downloads
+        if isinstance(values[3], dict):
+            cls.global_stat = values[3]
+        cls.polled_at = time()
+
+    @classmethod
+    async def _poll_loop(cls):
+        while True:
+            try:
+                await cls.poll()
+            except Exception as e:
+                LOGGER.error(f"{e}: Aria2c, Error while polling downloads")
+            await sleep(cls.POLL_INTERVAL)
+
+    @classmethod
+    def is_fresh(cls):
+        return time() - cls.polled_at < cls.POLL_INTERVAL * 3
+
+    @classmethod
+    def get_cached(cls, gid):
+        if cls.is_fresh():
+            return cls.downloads.get(gid)
+        return None
+
+    @classmethod
+    def watch(cls, gid):
+        future = bot_loop.create_future()
+        cls._watchers.setdefault(gid, set()).add(future)
+        return future
+
+    @classmethod
+    def notify(cls, gid, event):
+        for future in cls._watchers.pop(gid, ()):
+            if not future.done():
+                future.set_result(event)
+
+    @classmethod
+    async def wait_event(cls, gid, future, timeout=None):
+        try:
+            return await wait_for(future, timeout)
+        except TimeoutError:
+            return None
+        finally:
+            cls.unwatch(gid, future)
+
+    @classmethod
+    def unwatch(cls, gid, future):
+        if (watchers := cls._watchers.get(gid)) is not None:
+            watchers.discard(future)
+            if not watchers:
+                del cls._watchers[gid]
 
     @classmethod
     async def close_all(cls):
+        if cls._poller is not None:
+            cls._poller.cancel()
+            cls._poller = None
         await cls.aria2.close()
 
     @classmethod
@@ -72,7 +177,7 @@ class TorrentManager:
 
     @classmethod
     async def overall_speed(cls):
-        s2 = await cls.aria2.getGlobalStat()
+        s2 = cls.global_stat if cls.is_fresh() else await cls.aria2.getGlobalStat()
         download_speed = int(s2.get("downloadSpeed", "0"))
         upload_speed = int(s2.get("uploadSpeed", "0"))
         return download_speed, upload_speed
@@ -0,0 +1,237 @@
+from aiofiles import open as aiopen
+from aiofiles.os import path as aiopath
+from asyncio import Lock, Semaphore, create_task, gather
+from hashlib import md5
+from inspect import isawaitable
+from io import IOBase
+from json import dumps, loads
+from math import ceil
+from os import SEEK_END, path as ospath
+from pathlib import PurePath
+from pyrogram import Client, raw
+from pyrogram.session import Session
+from time import time
+
+from .. import LOGGER, DOWNLOAD_DIR
+from .config_manager import Config
+
+
+# Acknowledged saveBigFilePart parts per uploaded file, keyed by session and a
+# fingerprint of the file content, so a retried or restarted upload only sends
+# the parts Telegram hasn't stored yet. Entries stay until the uploader has sent
+# the media message, so a failed send reuses the completed file_id.
+class UploadResume:
+    STATE_FILE = ospath.join(DOWNLOAD_DIR, ".upload_resume.json")
+    PART_SIZE = 512 * 1024
+    BIG_FILE_SIZE = 10 * 1024 * 1024
+    WORKERS = 4
+    SESSIONS = 2
+    TTL = 6 * 3600
+    SAVES_PER_FILE = 4
+    uploads = None
+    _lock = Lock()
+
+    @classmethod
+    async def _load(cls):
+        async with cls._lock:
+            if cls.uploads is not None:
+                return
+            cls.uploads = {}
+            if not await aiopath.isfile(cls.STATE_FILE):
+                return
+            try:
+                async with aiopen(cls.STATE_FILE) as f:
+                    cls.uploads = {
+                        key: entry
+                        for key, entry in loads(await f.read()).items()
+                        if time() - entry["time"] < cls.TTL
+                    }
+            except Exception as e:
+                LOGGER.error(f"Unable to load upload resume state: {e}")
+
+    @classmethod
+    async def save(cls):
+        async with cls._lock:
+            cls.uploads = {
+                key: entry
+                for key, entry in cls.uploads.items()
+                if time() - entry["time"] < cls.TTL
+            }
+            async with aiopen(cls.STATE_FILE, "w") as f:
+                await f.write(dumps(cls.uploads))
+
+    @classmethod
+    async def upload(cls, client, fp, file_size, progress, progress_args):
+        if cls.uploads is None:
+            await cls._load()
+        total_parts = ceil(file_size / cls.PART_SIZE)
+        name = ospath.basename(getattr(fp, "name", "file"))
+        fp.seek(0)
+        key = md5(
+            f"{client.name}:{name}:{file_size}:".encode() + fp.read(cls.PART_SIZE)
+        ).hexdigest()
+        entry = cls.uploads.get(key)
+        if entry is None or time() - entry["time"] >= cls.TTL:
+            entry = {
+                "file_id": client.rnd_id(),
+                "parts": [],
+                "time": time(),
+                "session": client.name,
+                "name": name,
+                "size": file_size,
+            }
+            cls.uploads[key] = entry
+        file = raw.types.InputFileBig(
+            id=entry["file_id"], parts=total_parts, name=name
+        )
+        done = set(entry["parts"])
+        if len(done) >= total_parts:
+            LOGGER.info(f"Reusing uploaded parts of {name}")
+            if progress:
+                res = progress(file_size, file_size, *progress_args)
+                if isawaitable(res):
+                    await res
+            return file
+        if done:
+            LOGGER.info(
+                f"Resuming upload of {name} from {len(done)}/{total_parts} parts"
+            )
+        missing = iter([part for part in range(total_parts) if part not in done])
+        uploaded = min(len(done) * cls.PART_SIZE, file_size)
+        save_every = ceil(total_parts / cls.SAVES_PER_FILE)
+
+        async def _worker(session):
+            nonlocal uploaded
+            for part in missing:
+                fp.seek(part * cls.PART_SIZE)
+                chunk = fp.read(cls.PART_SIZE)
+                await session.invoke(
+                    raw.functions.upload.SaveBigFilePart(
+                        file_id=entry["file_id"],
+                        file_part=part,
+                        file_total_parts=total_parts,
+                        bytes=chunk,
+                    )
+                )
+                entry["parts"].append(part)
+                entry["time"] = time()
+                uploaded += len(chunk)
+                if progress:
+                    res = progress(min(uploaded, file_size), file_size, *progress_args)
+                    if isawaitable(res):
+                        await res
+                if len(entry["parts"]) % save_every == 0:
+                    await cls.save()
+
+        async with client.upload_slots():
+            sessions = await client.upload_sessions()
+            workers = [
+                create_task(_worker(sessions[index % len(sessions)]))
+                for index in range(cls.WORKERS)
+            ]
+            try:
+                await gather(*workers)
+            except BaseException:
+                for worker in workers:
+                    worker.cancel()
+                raise
+            finally:
+                await cls.save()
+        return file
+
+    @classmethod
+    async def finish(cls, client, name, file_size):
+        if not cls.uploads:
+            return
+        keys = [
+            key
+            for key, entry in cls.uploads.items()
+            if entry.get("session") == client.name
+            and entry.get("name") == name
+            and entry.get("size") == file_size
+        ]
+        if not keys:
+            return
+        for key in keys:
+            cls.uploads.pop(key, None)
+        await cls.save()
+
+
+# Big file parts go through dedicated media sessions, like Client.save_file
+# does, so bulk uploads don't share a connection with sends and edits.
+class ResumableClient(Client):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._upload_sessions = []
+        self._upload_lock = Lock()
+        self._upload_slots = None
+        self._preuploaded = {}
+
+    def upload_slots(self):
+        if self._upload_slots is None:
+            self._upload_slots = Semaphore(max(1, Config.LEECH_UPLOAD_WORKERS or 1))
+        return self._upload_slots
+
+    async def upload_sessions(self):
+        async with self._upload_lock:
+            if not self._upload_sessions:
+                dc_id = await self.storage.dc_id()
+                auth_key = await self.storage.auth_key()
+                test_mode = await self.storage.test_mode()
+                for _ in range(UploadResume.SESSIONS):
+                    session = Session(self, dc_id, auth_key, test_mode, is_media=True)
+                    await session.start()
+                    self._upload_sessions.append(session)
+            return self._upload_sessions
+
+    async def stop(self, *args, **kwargs):
+        async with self._upload_lock:
+            for session in self._upload_sessions:
+                try:
+                    await session.stop()
+                except Exception as e:
+                    LOGGER.error(f"Error while stopping media session: {e}")
+            self._upload_sessions.clear()
+        return await super().stop(*args, **kwargs)
+
+    # Uploads a file's bytes ahead of the message that sends it. The next
+    # save_file call for the same path or file object returns the stored input
+    # file, so sends can go out in order while their uploads run concurrently.
+    @staticmethod
+    def _preupload_key(path):
+        return str(path) if isinstance(path, (str, PurePath)) else path
+
+    async def preupload(self, path, progress=None, progress_args=()):
+        file = await self.save_file(
+            path, progress=progress, progress_args=progress_args
+        )
+        self._preuploaded[self._preupload_key(path)] = file
+
+    def forget_preupload(self, path):
+        self._preuploaded.pop(self._preupload_key(path), None)
+
+    async def save_file(
+        self, path, file_id=None, file_part=0, progress=None, progress_args=()
+    ):
+        if file_id is None and (
+            file := self._preuploaded.pop(self._preupload_key(path), None)
+        ):
+            return file
+        if file_id is not None or not isinstance(path, (str, PurePath, IOBase)):
+            return await super().save_file(
+                path, file_id, file_part, progress, progress_args
+            )
+        fp = path if isinstance(path, IOBase) else open(path, "rb")
+        try:
+            file_size = fp.seek(0, SEEK_END)
+            if file_size <= UploadResume.BIG_FILE_SIZE:
+                fp.seek(0)
+                return await super().save_file(
+                    path, file_id, file_part, progress, progress_args
+                )
+            return await UploadResume.upload(
+                self, fp, file_size, progress, progress_args
+            )
+        finally:
+            if fp is not path:
+                fp.close()
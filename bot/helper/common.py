@@ -17,10 +17,9 @@ from .. import (
     task_dict,
     excluded_extensions,
     included_extensions,
-    cpu_eater_lock,
+    cpu_slots,
     intervals,
     DOWNLOAD_DIR,
-    cores,
 )
 from ..core.config_manager import Config
 from ..core.telegram_manager import TgClient
@@ -50,6 +49,7 @@ from .ext_utils.media_utils import (
     create_thumb,
     take_ss,
     get_document_type,
+    invalidate_media_info,
     FFMpeg,
 )
 from .telegram_helper.message_utils import (
@@ -79,6 +79,7 @@ class TaskConfig:
         self.folder_name = ""
         self.split_size = 0
         self.max_split_size = 0
+        self.virtual_splits = {}
         self.multi = 0
         self.size = 0
         self.subsize = 0
@@ -118,6 +119,7 @@ class TaskConfig:
         self.ffmpeg_cmds = None
         self.chat_thread_id = None
         self.subproc = None
+        self.pipelined = False
         self.thumb = None
         self.excluded_extensions = []
         self.included_extensions = []
@@ -668,7 +670,9 @@ class TaskConfig:
                     t_path = get_base_name(f_path) if self.is_file else dirpath
                     if not self.is_file:
                         self.subname = file_
-                    code = await sevenz.extract(f_path, t_path, pswd)
+                    async with cpu_slots.hold("extract") as core_ids:
+                        sevenz.use_cores(core_ids)
+                        code = await sevenz.extract(f_path, t_path, pswd)
             if self.is_cancelled:
                 return code
             if code == 0:
@@ -697,7 +701,7 @@ class TaskConfig:
                 cmd = [
                     "taskset",
                     "-c",
-                    f"{cores}",
+                    ffmpeg.cores,
                     "ffmpeg",
                     "-hide_banner",
                     "-loglevel",
@@ -754,14 +758,15 @@ class TaskConfig:
                     if not checked:
                         checked = True
                         async with task_dict_lock:
-                            task_dict[self.mid] = FFmpegStatus(
-                                self, ffmpeg, gid, "FFmpeg"
+                            self.set_stage_status(
+                                FFmpegStatus(self, ffmpeg, gid, "FFmpeg")
                             )
                         self.progress = False
-                        await cpu_eater_lock.acquire()
+                        ffmpeg.use_cores(await cpu_slots.acquire("ffmpeg"))
                         self.progress = True
                     LOGGER.info(f"Running ffmpeg cmd for: {file_path}")
                     var_cmd = cmd.copy()
+                    var_cmd[2] = ffmpeg.cores
                     for index in input_indexes:
                         if cmd[index + 1].startswith("mltb"):
                             var_cmd[index + 1] = file_path
@@ -775,6 +780,7 @@ class TaskConfig:
                     if res:
                         if delete_files:
                             await remove(file_path)
+                            invalidate_media_info(file_path)
                             if len(await listdir(new_folder)) == 1:
                                 folder = new_folder.rsplit("/", 1)[0]
                                 self.name = ospath.basename(res[0])
@@ -826,18 +832,20 @@ class TaskConfig:
                             if not checked:
                                 checked = True
                                 async with task_dict_lock:
-                                    task_dict[self.mid] = FFmpegStatus(
-                                        self, ffmpeg, gid, "FFmpeg"
+                                    self.set_stage_status(
+                                        FFmpegStatus(self, ffmpeg, gid, "FFmpeg")
                                     )
                                 self.progress = False
-                                await cpu_eater_lock.acquire()
+                                ffmpeg.use_cores(await cpu_slots.acquire("ffmpeg"))
                                 self.progress = True
+                            var_cmd[2] = ffmpeg.cores
                             LOGGER.info(f"Running ffmpeg cmd for: {f_path}")
                             self.subsize = await get_path_size(f_path)
                             self.subname = file_
                             res = await ffmpeg.ffmpeg_cmds(var_cmd, f_path)
                             if res and delete_files:
                                 await remove(f_path)
+                                invalidate_media_info(f_path)
                                 if len(res) == 1:
                                     file_name = ospath.basename(res[0])
                                     if file_name.startswith("ffmpeg"):
@@ -849,7 +857,7 @@ class TaskConfig:
                         await remove(inp)
         finally:
             if checked:
-                cpu_eater_lock.release()
+                cpu_slots.release(ffmpeg.core_ids)
         return dl_path
 
     async def substitute(self, dl_path):
@@ -1002,9 +1010,10 @@ class TaskConfig:
         if self.files_to_proceed:
             ffmpeg = FFMpeg(self)
             async with task_dict_lock:
-                task_dict[self.mid] = FFmpegStatus(self, ffmpeg, gid, "Convert")
+                self.set_stage_status(FFmpegStatus(self, ffmpeg, gid, "Convert"))
             self.progress = False
-            async with cpu_eater_lock:
+            async with cpu_slots.hold("convert") as core_ids:
+                ffmpeg.use_cores(core_ids)
                 self.progress = True
                 for f_path, f_type in self.files_to_proceed.items():
                     self.proceed_count += 1
@@ -1021,6 +1030,7 @@ class TaskConfig:
                     if res:
                         try:
                             await remove(f_path)
+                            invalidate_media_info(f_path)
                         except:
                             self.is_cancelled = True
                             return False
@@ -1052,9 +1062,12 @@ class TaskConfig:
         if self.files_to_proceed:
             ffmpeg = FFMpeg(self)
             async with task_dict_lock:
-                task_dict[self.mid] = FFmpegStatus(self, ffmpeg, gid, "Sample Video")
+                self.set_stage_status(
+                    FFmpegStatus(self, ffmpeg, gid, "Sample Video")
+                )
             self.progress = False
-            async with cpu_eater_lock:
+            async with cpu_slots.hold("sample") as core_ids:
+                ffmpeg.use_cores(core_ids)
                 self.progress = True
                 LOGGER.info(f"Creating Sample video: {self.name}")
                 for f_path, file_ in self.files_to_proceed.items():
@@ -1093,7 +1106,15 @@ class TaskConfig:
         sevenz = SevenZ(self)
         async with task_dict_lock:
             task_dict[self.mid] = SevenZStatus(self, sevenz, gid, "Zip")
-        return await sevenz.zip(dl_path, up_path, pswd)
+        async with cpu_slots.hold("zip") as core_ids:
+            sevenz.use_cores(core_ids)
+            return await sevenz.zip(dl_path, up_path, pswd)
+
+    def set_stage_status(self, status):
+        # Pipelined leeches keep their TelegramStatus while per-file stages
+        # run, so the upload progress stays visible. Call with task_dict_lock.
+        if not self.pipelined:
+            task_dict[self.mid] = status
 
     async def proceed_split(self, dl_path, gid):
         self.files_to_proceed = {}
@@ -1111,7 +1132,7 @@ class TaskConfig:
         if self.files_to_proceed:
             ffmpeg = FFMpeg(self)
             async with task_dict_lock:
-                task_dict[self.mid] = FFmpegStatus(self, ffmpeg, gid, "Split")
+                self.set_stage_status(FFmpegStatus(self, ffmpeg, gid, "Split"))
             LOGGER.info(f"Splitting: {self.name}")
             for f_path, (f_size, file_) in self.files_to_proceed.items():
                 self.proceed_count += 1
@@ -1127,7 +1148,12 @@ class TaskConfig:
                     split_size = self.split_size
                 if not self.as_doc and (await get_document_type(f_path))[0]:
                     self.progress = True
-                    res = await ffmpeg.split(f_path, file_, parts, split_size)
+                    async with cpu_slots.hold("split") as core_ids:
+                        ffmpeg.use_cores(core_ids)
+                        res = await ffmpeg.split(f_path, file_, parts, split_size)
+                elif Config.LEECH_VIRTUAL_SPLIT:
+                    self.virtual_splits[f_path] = (f_size, split_size)
+                    continue
                 else:
                     self.progress = False
                     res = await split_file(f_path, split_size, self)
@@ -1136,6 +1162,7 @@ class TaskConfig:
                 if res or f_size >= self.max_split_size:
                     try:
                         await remove(f_path)
+                        invalidate_media_info(f_path)
                     except:
                         self.is_cancelled = True
 
@@ -1149,14 +1176,16 @@ class TaskConfig:
             if not checked:
                 checked = True
                 async with task_dict_lock:
-                    task_dict[self.mid] = FFmpegStatus(
-                     self,
-                        ffmpeg,
-                        gid,
-                        "FFmpeg",
+                    self.set_stage_status(
+                        FFmpegStatus(
+                            self,
+                            ffmpeg,
+                            gid,
+                            "FFmpeg",
+                        )
                     )
                 self.progress = False
-                await cpu_eater_lock.acquire()
+                ffmpeg.use_cores(await cpu_slots.acquire("merge"))
                 self.progress = True
             LOGGER.info(f"Running ffmpeg cmd for: {dl_path}")
             self.subsize = await get_path_size(dl_path)
@@ -1164,5 +1193,5 @@ class TaskConfig:
             await ffmpeg.merge_videos(dl_path, output_path)
         finally:
             if checked:
-                    cpu_eater_lock.release()
+                    cpu_slots.release(ffmpeg.core_ids)
                     return output_path
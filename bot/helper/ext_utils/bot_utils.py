@@ -1,4 +1,3 @@
-from httpx import AsyncClient
 from asyncio.subprocess import PIPE
 from functools import partial, wraps
 from concurrent.futures import ThreadPoolExecutor
@@ -13,6 +12,7 @@ from ... import user_data, bot_loop
 from ...core.config_manager import Config
 from ..telegram_helper.button_build import ButtonMaker
 from .telegraph_helper import telegraph
+from .http_clients import HttpClients
 from .help_messages import (
     YT_HELP_DICT,
     MIRROR_HELP_DICT,
@@ -21,7 +21,6 @@ from .help_messages import (
 from aiofiles.os import path as aiopath, mkdir
 from os import path as ospath
 from aiofiles import open as aiopen
-from aiohttp import ClientSession as aioClientSession
 from logging import getLogger
 
 LOGGER = getLogger(__name__)
@@ -204,12 +203,7 @@ def get_size_bytes(size):
 
 
 async def get_content_type(url):
-    try:
-        async with AsyncClient() as client:
-            response = await client.get(url, allow_redirects=True, verify=False)
-            return response.headers.get("Content-Type")
-    except:
-        return None
+    return await HttpClients.probe(url)
 
 
 def update_user_ldata(id_, key, value):
@@ -281,13 +275,12 @@ async def download_image_url(url):
         await mkdir(path)
     image_name = url.split('/')[-1]
     des_dir = ospath.join(path, image_name)
-    async with aioClientSession() as session:
-        async with session.get(url) as response:
-            if response.status == 200:
-                async with aiopen(des_dir, 'wb') as file:
-                    async for chunk in response.content.iter_chunked(1024):
-                        await file.write(chunk)
-                LOGGER.info(f"Image Downloaded Successfully as {image_name}")
-            else:
-                LOGGER.error(f"Failed to Download Image from {url}")
+    async with HttpClients.get("images").stream("GET", url) as response:
+        if response.status_code == 200:
+            async with aiopen(des_dir, 'wb') as file:
+                async for chunk in response.aiter_bytes(65536):
+                    await file.write(chunk)
+            LOGGER.info(f"Image Downloaded Successfully as {image_name}")
+        else:
+            LOGGER.error(f"Failed to Download Image from {url}")
     return des_dir
\ No newline at end of file
@@ -1,6 +1,6 @@
 import re
-import aiohttp
 from ...core.config_manager import Config
+from .http_clients import HttpClients
 from logging import getLogger
 
 LOGGER = getLogger(__name__)
@@ -63,15 +63,14 @@ async def get_movie_poster(movie_name, release_year=None):
     try:
         if release_year:
             tmdb_search_url += f'&year={release_year}'
-        async with aiohttp.ClientSession() as session:
-            async with session.get(tmdb_search_url) as search_response:
-                search_data = await search_response.json()
-                if search_data.get('results'):
-                    results = search_data['results']
-                    if results:
-                        result = results[0]
-                        poster_path = result.get('poster_path', None)
-                        return f"https://image.tmdb.org/t/p/original{poster_path}"
+        search_response = await HttpClients.get("tmdb").get(tmdb_search_url)
+        search_data = search_response.json()
+        if search_data.get('results'):
+            results = search_data['results']
+            if results:
+                result = results[0]
+                poster_path = result.get('poster_path', None)
+                return f"https://image.tmdb.org/t/p/original{poster_path}"
         return None
     except Exception as e:
         LOGGER.error(f"Error fetching TMDb movie by name: {e}")
@@ -82,15 +81,14 @@ async def get_tv_poster(tv_name, first_air_year=None):
     try:
         if first_air_year:
             tmdb_search_url += f'&first_air_date_year={first_air_year}'
-        async with aiohttp.ClientSession() as session:
-            async with session.get(tmdb_search_url) as search_response:
-                search_data = await search_response.json()
-                if search_data.get('results'):
-                    results = search_data['results']
-                    if results:
-                        result = results[0]
-                        poster_path = result.get('poster_path', None)
-                        return f"https://image.tmdb.org/t/p/original{poster_path}"
+        search_response = await HttpClients.get("tmdb").get(tmdb_search_url)
+        search_data = search_response.json()
+        if search_data.get('results'):
+            results = search_data['results']
+            if results:
+                result = results[0]
+                poster_path = result.get('poster_path', None)
+                return f"https://image.tmdb.org/t/p/original{poster_path}"
         return None
     except Exception as e:
         LOGGER.error(f"Error fetching TMDb TV by name: {e}")
@@ -1,8 +1,9 @@
 from aioshutil import rmtree as aiormtree, move
 from asyncio import create_subprocess_exec, wait_for
 from asyncio.subprocess import PIPE
+from io import RawIOBase, SEEK_CUR, SEEK_END
 from magic import Magic
-from os import walk, path as ospath, readlink
+from os import walk, path as ospath, readlink, open as osopen, close as osclose, preadv, O_RDONLY
 from re import split as re_split, I, search as re_search, escape
 from aiofiles.os import (
     remove,
@@ -14,7 +15,7 @@ from aiofiles.os import (
     makedirs as aiomakedirs,
 )
 
-from ... import LOGGER, DOWNLOAD_DIR
+from ... import LOGGER, DOWNLOAD_DIR, disk_reservations, queued_reservations
 from ...core.torrent_manager import TorrentManager
 from .bot_utils import sync_to_async, cmd_exec
 from .exceptions import NotSupportedExtractionArchive
@@ -134,6 +135,8 @@ async def clean_target(opath):
 
 
 async def clean_download(opath):
+    disk_reservations.pop(opath, None)
+    queued_reservations.pop(opath, None)
     if await aiopath.exists(opath):
         LOGGER.info(f"Cleaning Download: {opath}")
         try:
@@ -332,11 +335,70 @@ async def split_file(f_path, split_size, listener):
     return True
 
 
+# A byte range of a file exposed as a readable file so it can be uploaded as
+# a split part without writing the part to disk.
+class FilePart(RawIOBase):
+    def __init__(self, path, name, offset, length):
+        super().__init__()
+        self.path = path
+        self.name = name
+        self.length = length
+        self._offset = offset
+        self._pos = 0
+        self._fd = None
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self._pos
+
+    def seek(self, pos, whence=0):
+        if whence == SEEK_CUR:
+            pos += self._pos
+        elif whence == SEEK_END:
+            pos += self.length
+        self._pos = min(max(pos, 0), self.length)
+        return self._pos
+
+    def readinto(self, buffer):
+        size = min(len(buffer), self.length - self._pos)
+        if size <= 0:
+            return 0
+        if self._fd is None:
+            self._fd = osopen(self.path, O_RDONLY)
+        read = preadv(
+            self._fd, [memoryview(buffer)[:size]], self._offset + self._pos
+        )
+        self._pos += read
+        return read
+
+    def close(self):
+        if self._fd is not None:
+            osclose(self._fd)
+            self._fd = None
+        super().close()
+
+
+def get_file_parts(f_path, f_size, split_size):
+    name = ospath.basename(f_path)
+    return [
+        FilePart(
+            f_path, f"{name}.{index:03}", offset, min(split_size, f_size - offset)
+        )
+        for index, offset in enumerate(range(0, f_size, split_size), 1)
+    ]
+
+
 class SevenZ:
     def __init__(self, listener):
         self._listener = listener
         self._processed_bytes = 0
         self._percentage = "0%"
+        self._cores = None
 
     @property
     def processed_bytes(self):
@@ -346,6 +408,9 @@ class SevenZ:
     def progress(self):
         return self._percentage
 
+    def use_cores(self, core_ids):
+        self._cores = ",".join(str(i) for i in core_ids)
+
     async def _sevenz_progress(self):
         pattern = (
             r"(\d+)\s+bytes|Total Physical Size\s*=\s*(\d+)|Physical Size\s*=\s*(\d+)"
@@ -412,6 +477,8 @@ class SevenZ:
         ]
         if not pswd:
             del cmd[2]
+        if self._cores:
+            cmd = ["taskset", "-c", self._cores] + cmd
         if self._listener.is_cancelled:
             return False
         self._listener.subproc = await create_subprocess_exec(
@@ -463,6 +530,8 @@ class SevenZ:
             if not pswd:
                 del cmd[3]
             LOGGER.info(f"Zip: orig_path: {dl_path}, zip_path: {up_path}")
+        if self._cores:
+            cmd = ["taskset", "-c", self._cores] + cmd
         if self._listener.is_cancelled:
             return False
         self._listener.subproc = await create_subprocess_exec(
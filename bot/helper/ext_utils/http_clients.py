@@ -0,0 +1,106 @@
+from functools import partial
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from httpx import AsyncClient, Limits, Timeout
+from importlib.util import find_spec
+from time import time
+
+from ... import LOGGER
+
+HTTP2 = find_spec("h2") is not None
+
+
+# One keep-alive pool per subsystem, shared by every caller in the process so
+# repeated requests reuse connections instead of paying a TLS handshake each.
+# The pools never store cookies, so one user's requests can't leak into another's.
+class HttpClients:
+    LIMITS = {
+        "probe": 32,
+        "rss": 8,
+        "images": 8,
+        "tmdb": 4,
+        "ytdlp": 4,
+    }
+    TIMEOUTS = {
+        "probe": 15,
+        "rss": 60,
+    }
+    _clients = {}
+    metrics = {}
+
+    @classmethod
+    def get(cls, name, verify=True):
+        key = (name, verify)
+        if (client := cls._clients.get(key)) is None or client.is_closed:
+            limit = cls.LIMITS.get(name, 8)
+            client = AsyncClient(
+                http2=HTTP2,
+                verify=verify,
+                follow_redirects=True,
+                cookies=CookieJar(DefaultCookiePolicy(allowed_domains=[])),
+                timeout=Timeout(cls.TIMEOUTS.get(name, 30)),
+                limits=Limits(
+                    max_connections=limit,
+                    max_keepalive_connections=limit,
+                    keepalive_expiry=60,
+                ),
+                event_hooks={
+                    "request": [cls._on_request],
+                    "response": [partial(cls._on_response, name)],
+                },
+            )
+            cls._clients[key] = client
+        return client
+
+    @classmethod
+    def _stats(cls, name):
+        return cls.metrics.setdefault(
+            name, {"requests": 0, "errors": 0, "elapsed": 0.0}
+        )
+
+    @classmethod
+    async def _on_request(cls, request):
+        request.extensions["started"] = time()
+
+    @classmethod
+    async def _on_response(cls, name, response):
+        stats = cls._stats(name)
+        stats["requests"] += 1
+        if response.status_code >= 400:
+            stats["errors"] += 1
+        stats["elapsed"] += time() - response.request.extensions.get("started", time())
+
+    @classmethod
+    async def probe(cls, url):
+        # Probed links are arbitrary user links to mirror sources, many with
+        # self-signed or broken certificates; they were never verified.
+        client = cls.get("probe", verify=False)
+        try:
+            response = await client.head(url)
+            if response.status_code < 400 and (
+                content_type := response.headers.get("Content-Type")
+            ):
+                return content_type
+            async with client.stream(
+                "GET", url, headers={"Range": "bytes=0-0"}
+            ) as response:
+                return response.headers.get("Content-Type")
+        except Exception:
+            cls._stats("probe")["errors"] += 1
+            return None
+
+    @classmethod
+    def summary(cls):
+        return " | ".join(
+            f"{name}: {stats['requests']} req, {stats['errors']} err, "
+            f"{round(stats['elapsed'] / max(stats['requests'], 1) * 1000)}ms avg"
+            for name, stats in cls.metrics.items()
+        )
+
+    @classmethod
+    async def close_all(cls):
+        for client in list(cls._clients.values()):
+            try:
+                await client.aclose()
+            except Exception as e:
+                LOGGER.error(f"Error while closing http client: {e}")
+        cls._clients.clear()
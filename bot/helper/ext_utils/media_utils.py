@@ -8,6 +8,7 @@ from asyncio import (
     wait_for,
 )
 from asyncio.subprocess import PIPE
+from json import loads
 from os import path as ospath
 from re import search as re_search, escape
 from time import gmtime, strftime, time
@@ -18,6 +19,10 @@ from .bot_utils import cmd_exec, sync_to_async
 from .files_utils import get_mime_type, is_archive, is_archive_split
 from .status_utils import time_to_seconds
 
+PROBE_CACHE_LIMIT = 2000
+SEGMENT_SPLIT_EXTS = (".mkv", ".mp4", ".m4v", ".mov", ".ts", ".webm")
+_probe_cache = {}
+
 
 async def create_thumb(msg, _id=""):
     if not _id:
@@ -33,27 +38,52 @@ async def create_thumb(msg, _id=""):
     return output
 
 
+async def probe_media(path):
+    st = await aiopath.stat(path)
+    key = (st.st_size, st.st_mtime_ns)
+    if (cached := _probe_cache.get(path)) and cached[0] == key:
+        return cached[1], cached[2]
+    stdout, stderr, code = await cmd_exec(
+        [
+            "ffprobe",
+            "-hide_banner",
+            "-loglevel",
+            "error",
+            "-print_format",
+            "json",
+            "-show_format",
+            "-show_streams",
+            path,
+        ]
+    )
+    data = None
+    if stdout and code == 0:
+        try:
+            data = loads(stdout)
+        except ValueError:
+            LOGGER.error(f"probe_media: Unable to parse ffprobe output! - File: {path}")
+    _probe_cache.pop(path, None)
+    if len(_probe_cache) >= PROBE_CACHE_LIMIT:
+        del _probe_cache[next(iter(_probe_cache))]
+    _probe_cache[path] = (key, data, stderr)
+    return data, stderr
+
+
+def invalidate_media_info(*paths):
+    for path in paths:
+        _probe_cache.pop(path, None)
+
+
 async def get_media_info(path):
     try:
-        result = await cmd_exec(
-            [
-                "ffprobe",
-                "-hide_banner",
-                "-loglevel",
-                "error",
-                "-print_format",
-                "json",
-                "-show_format",
-                path,
-            ]
-        )
+        data, stderr = await probe_media(path)
     except Exception as e:
         LOGGER.error(f"Get Media Info: {e}. Mostly File not found! - File: {path}")
         return 0, None, None
-    if result[0] and result[2] == 0:
-        fields = eval(result[0]).get("format")
+    if data is not None:
+        fields = data.get("format")
         if fields is None:
-            LOGGER.error(f"get_media_info: {result}")
+            LOGGER.error(f"get_media_info: {stderr}")
             return 0, None, None
         duration = round(float(fields.get("duration", 0)))
         tags = fields.get("tags", {})
@@ -75,19 +105,8 @@ async def get_document_type(path):
     if mime_type.startswith("image"):
         return False, False, True
     try:
-        result = await cmd_exec(
-            [
-                "ffprobe",
-                "-hide_banner",
-                "-loglevel",
-                "error",
-                "-print_format",
-                "json",
-                "-show_streams",
-                path,
-            ]
-        )
-        if result[1] and mime_type.startswith("video"):
+        data, stderr = await probe_media(path)
+        if stderr and mime_type.startswith("video"):
             is_video = True
     except Exception as e:
         LOGGER.error(f"Get Document Type: {e}. Mostly File not found! - File: {path}")
@@ -98,10 +117,10 @@ async def get_document_type(path):
         if mime_type.startswith("video"):
             is_video = True
         return is_video, is_audio, is_image
-    if result[0] and result[2] == 0:
-        fields = eval(result[0]).get("streams")
+    if data is not None:
+        fields = data.get("streams")
         if fields is None:
-            LOGGER.error(f"get_document_type: {result}")
+            LOGGER.error(f"get_document_type: {stderr}")
             return is_video, is_audio, is_image
         is_video = False
         for stream in fields:
@@ -311,6 +330,14 @@ class FFMpeg:
         self._eta_raw = 0
         self._time_rate = 0.1
         self._start_time = 0
+        self.core_ids = []
+        self.cores = cores
+        self._threads = threads
+
+    def use_cores(self, core_ids):
+        self.core_ids = core_ids
+        self.cores = ",".join(str(i) for i in core_ids)
+        self._threads = len(core_ids)
 
     @property
     def processed_bytes(self):
@@ -416,6 +443,7 @@ class FFMpeg:
         if self._listener.is_cancelled:
             return False
         if code == 0:
+            invalidate_media_info(*outputs)
             return outputs
         elif code == -9:
             self._listener.is_cancelled = True
@@ -442,7 +470,7 @@ class FFMpeg:
             cmd = [
                 "taskset",
                 "-c",
-                f"{cores}",
+                self.cores,
                 "ffmpeg",
                 "-hide_banner",
                 "-loglevel",
@@ -458,7 +486,7 @@ class FFMpeg:
                 "-c:a",
                 "aac",
                 "-threads",
-                f"{threads}",
+                f"{self._threads}",
                 output,
             ]
             if ext == "mp4":
@@ -471,7 +499,7 @@ class FFMpeg:
             cmd = [
                 "taskset",
                 "-c",
-                f"{cores}",
+                self.cores,
                 "ffmpeg",
                 "-hide_banner",
                 "-loglevel",
@@ -485,7 +513,7 @@ class FFMpeg:
                 "-c",
                 "copy",
                 "-threads",
-                f"{threads}",
+                f"{self._threads}",
                 output,
             ]
         if self._listener.is_cancelled:
@@ -499,6 +527,7 @@ class FFMpeg:
         if self._listener.is_cancelled:
             return False
         if code == 0:
+            invalidate_media_info(output)
             return output
         elif code == -9:
             self._listener.is_cancelled = True
@@ -525,7 +554,7 @@ class FFMpeg:
         cmd = [
             "taskset",
             "-c",
-            f"{cores}",
+            self.cores,
             "ffmpeg",
             "-hide_banner",
             "-loglevel",
@@ -535,7 +564,7 @@ class FFMpeg:
             "-i",
             audio_file,
             "-threads",
-            f"{threads}",
+            f"{self._threads}",
             output,
         ]
         if self._listener.is_cancelled:
@@ -549,6 +578,7 @@ class FFMpeg:
         if self._listener.is_cancelled:
             return False
         if code == 0:
+            invalidate_media_info(output)
             return output
         elif code == -9:
             self._listener.is_cancelled = True
@@ -598,7 +628,7 @@ class FFMpeg:
         cmd = [
             "taskset",
             "-c",
-            f"{cores}",
+            self.cores,
             "ffmpeg",
             "-hide_banner",
             "-loglevel",
@@ -618,7 +648,7 @@ class FFMpeg:
             "-c:a",
             "aac",
             "-threads",
-            f"{threads}",
+            f"{self._threads}",
             output_file,
         ]
 
@@ -636,6 +666,7 @@ class FFMpeg:
             self._listener.is_cancelled = True
             return False
         elif code == 0:
+            invalidate_media_info(output_file)
             return output_file
         else:
             try:
@@ -649,12 +680,99 @@ class FFMpeg:
                 await remove(output_file)
             return False
 
+    async def _segment_split(self, f_path, file_, duration, split_size):
+        base_name, extension = ospath.splitext(file_)
+        f_size = await aiopath.getsize(f_path)
+        segment_time = int(duration * split_size * 0.95 / f_size)
+        if segment_time < 10:
+            return None
+        out_pattern = f_path.replace(
+            file_, f"{base_name.replace('%', '%%')}.part%03d{extension}"
+        )
+        cmd = [
+            "taskset",
+            "-c",
+            self.cores,
+            "ffmpeg",
+            "-hide_banner",
+            "-loglevel",
+            "error",
+            "-progress",
+            "pipe:1",
+            "-i",
+            f_path,
+            "-map",
+            "0",
+            "-map_chapters",
+            "-1",
+            "-c",
+            "copy",
+            "-f",
+            "segment",
+            "-segment_time",
+            str(segment_time),
+            "-segment_start_number",
+            "1",
+            "-reset_timestamps",
+            "1",
+            "-threads",
+            f"{self._threads}",
+            out_pattern,
+        ]
+        if self._listener.is_cancelled:
+            return False
+        self._listener.subproc = await create_subprocess_exec(
+            *cmd, stdout=PIPE, stderr=PIPE
+        )
+        await self._ffmpeg_progress()
+        _, stderr = await self._listener.subproc.communicate()
+        code = self._listener.subproc.returncode
+        if self._listener.is_cancelled:
+            return False
+        if code == -9:
+            self._listener.is_cancelled = True
+            return False
+        outputs = []
+        i = 1
+        while await aiopath.exists(
+            out_path := f_path.replace(file_, f"{base_name}.part{i:03}{extension}")
+        ):
+            outputs.append(out_path)
+            i += 1
+        if code == 0 and outputs:
+            for out_path in outputs:
+                if await aiopath.getsize(out_path) > self._listener.max_split_size:
+                    LOGGER.warning(
+                        f"Segment muxer produced a part bigger than {self._listener.max_split_size}. Splitting again part by part. Path: {f_path}"
+                    )
+                    break
+            else:
+                invalidate_media_info(*outputs)
+                return True
+        else:
+            try:
+                stderr = stderr.decode().strip()
+            except:
+                stderr = "Unable to decode the error!"
+            LOGGER.warning(
+                f"{stderr}. Segment muxer unable to split this video. Splitting again part by part. Path: {f_path}"
+            )
+        for out_path in outputs:
+            await remove(out_path)
+        return None
+
     async def split(self, f_path, file_, parts, split_size):
         self.clear()
         multi_streams = True
         self._total_time = duration = (await get_media_info(f_path))[0]
         base_name, extension = ospath.splitext(file_)
         split_size -= 3000000
+        if duration and extension.lower() in SEGMENT_SPLIT_EXTS:
+            res = await self._segment_split(f_path, file_, duration, split_size)
+            if res is not None:
+                return res
+            self.clear()
+            self._total_time = duration
         start_time = 0
         i = 1
         while i <= parts or start_time < duration - 4:
@@ -662,7 +780,7 @@ class FFMpeg:
             cmd = [
                 "taskset",
                 "-c",
-                f"{cores}",
+                self.cores,
                 "ffmpeg",
                 "-hide_banner",
                 "-loglevel",
@@ -686,7 +804,7 @@ class FFMpeg:
                 "-c",
                 "copy",
                 "-threads",
-                f"{threads}",
+                f"{self._threads}",
                 out_path,
             ]
             if not multi_streams:
@@ -725,6 +843,7 @@ class FFMpeg:
                         f"{stderr}. Unable to split this video, if it's size less than {self._listener.max_split_size} will be uploaded as it is. Path: {f_path}"
                     )
                 return False
+            invalidate_media_info(out_path)
             out_size = await aiopath.getsize(out_path)
             if out_size > self._listener.max_split_size:
                 split_size -= (out_size - self._listener.max_split_size) + 5000000
@@ -854,6 +973,7 @@ class FFMpeg:
         if self._listener.is_cancelled:
             return False
         if code == 0:
+            invalidate_media_info(output_path)
             return output_path
         if code == -9:
             self._listener.is_cancelled = True
@@ -885,7 +1005,7 @@ class FFMpeg:
             "-c:s",
             "srt",
             "-threads",
-            f"{threads}",
+            f"{self._threads}",
             output_srt,
         ]
         if self._listener.is_cancelled:
@@ -1,12 +1,12 @@
 from html import escape
-from psutil import virtual_memory, cpu_percent, disk_usage
 from time import time
 from asyncio import iscoroutinefunction, gather
 
-from ... import task_dict, task_dict_lock, bot_start_time, status_dict, DOWNLOAD_DIR
+from ... import task_dict, bot_start_time, status_dict
 from ...core.config_manager import Config
 from ..telegram_helper.button_build import ButtonMaker
 from ..telegram_helper.bot_commands import BotCommands
+from .system_stats import SystemStats
 
 SIZE_UNITS = ["B", "KB", "MB", "GB", "TB", "PB"]
 
@@ -48,37 +48,48 @@ STATUSES = {
 
 
 async def get_task_by_gid(gid: str):
-    async with task_dict_lock:
-        for tk in task_dict.values():
-            if hasattr(tk, "seeding"):
-                await tk.update()
-            if tk.gid() == gid:
-                return tk
-        return None
+    tasks = task_dict.snapshot()
+    await gather(*(tk.update() for tk in tasks if hasattr(tk, "seeding")))
+    for tk in tasks:
+        if tk.gid() == gid:
+            return tk
+    return None
 
 
-async def get_specific_tasks(status, user_id):
+async def get_task_status(task):
+    if iscoroutinefunction(task.status):
+        status = await task.status()
+    else:
+        status = task.status()
+    task_dict.record_status(task, status)
+    return status
+
+
+async def get_specific_tasks(status, user_id, lazy=False):
+    tasks = task_dict.snapshot()
     if status == "All":
         if user_id:
-            return [tk for tk in task_dict.values() if tk.listener.user_id == user_id]
+            return [tk for tk in tasks if tk.listener.user_id == user_id]
         else:
-            return list(task_dict.values())
+            return list(tasks)
     tasks_to_check = (
-        [tk for tk in task_dict.values() if tk.listener.user_id == user_id]
+        [tk for tk in tasks if tk.listener.user_id == user_id]
         if user_id
-        else list(task_dict.values())
+        else list(tasks)
+    )
+    to_update = [
+        tk
+        for tk in tasks_to_check
+        if not lazy
+        or not iscoroutinefunction(tk.status)
+        or task_dict.is_stale(tk)
+    ]
+    statuses = dict(
+        zip(map(id, to_update), await gather(*map(get_task_status, to_update)))
     )
-    coro_tasks = []
-    coro_tasks.extend(tk for tk in tasks_to_check if iscoroutinefunction(tk.status))
-    coro_statuses = await gather(*[tk.status() for tk in coro_tasks])
     result = []
-    coro_index = 0
     for tk in tasks_to_check:
-        if tk in coro_tasks:
-            st = coro_statuses[coro_index]
-            coro_index += 1
-        else:
-            st = tk.status()
+        st = statuses.get(id(tk), task_dict.statuses.get(tk.listener.mid))
         if (st == status) or (
             status == MirrorStatus.STATUS_DOWNLOAD and st not in STATUSES.values()
         ):
@@ -87,8 +98,7 @@ async def get_specific_tasks(status, user_id):
 
 
 async def get_all_tasks(req_status: str, user_id):
-    async with task_dict_lock:
-        return await get_specific_tasks(req_status, user_id)
+    return await get_specific_tasks(req_status, user_id)
 
 
 def get_readable_file_size(size_in_bytes):
@@ -161,28 +171,25 @@ async def get_readable_message(sid, is_user, page_no=1, status="All", page_step=
     msg = ""
     button = None
 
-    tasks = await get_specific_tasks(status, sid if is_user else None)
+    tasks = await get_specific_tasks(status, sid if is_user else None, True)
 
     STATUS_LIMIT = Config.STATUS_LIMIT
     tasks_no = len(tasks)
     pages = (max(tasks_no, 1) + STATUS_LIMIT - 1) // STATUS_LIMIT
     if page_no > pages:
         page_no = (page_no - 1) % pages + 1
-        status_dict[sid]["page_no"] = page_no
+        if sid in status_dict:
+            status_dict[sid]["page_no"] = page_no
     elif page_no < 1:
         page_no = pages - (abs(page_no) % pages)
-        status_dict[sid]["page_no"] = page_no
+        if sid in status_dict:
+            status_dict[sid]["page_no"] = page_no
     start_position = (page_no - 1) * STATUS_LIMIT
 
     for index, task in enumerate(
         tasks[start_position : STATUS_LIMIT + start_position], start=1
     ):
-        if status != "All":
-            tstatus = status
-        elif iscoroutinefunction(task.status):
-            tstatus = await task.status()
-        else:
-            tstatus = task.status()
+        tstatus = await get_task_status(task)
         if task.listener.is_super_chat:
             msg += f"<b>{index + start_position}.<a href='{task.listener.message.link}'>{tstatus}</a>: </b>"
         else:
@@ -190,6 +197,8 @@ async def get_readable_message(sid, is_user, page_no=1, status="All", page_step=
         msg += f"<code>{escape(f'{task.name()}')}</code>"
         if task.listener.subname:
             msg += f"\n<i>{task.listener.subname}</i>"
+        if hasattr(task, "queue_position") and (position := task.queue_position()):
+            msg += f"\n<b>Position:</b> {position}"
         if (
             tstatus not in [MirrorStatus.STATUS_SEED, MirrorStatus.STATUS_QUEUEUP]
             and task.listener.progress
@@ -248,6 +257,7 @@ async def get_readable_message(sid, is_user, page_no=1, status="All", page_step=
                 buttons.data_button(label, f"status {sid} st {status_value}")
     buttons.data_button("♻️", f"status {sid} ref", position="header")
     button = buttons.build_menu(8)
-    msg += f"<b>CPU:</b> {cpu_percent()}% | <b>FREE:</b> {get_readable_file_size(disk_usage(DOWNLOAD_DIR).free)}"
-    msg += f"\n<b>RAM:</b> {virtual_memory().percent}% | <b>UPTIME:</b> {get_readable_time(time() - bot_start_time)}"
+    stats = SystemStats.get()
+    msg += f"<b>CPU:</b> {stats['cpu']}% | <b>FREE:</b> {get_readable_file_size(SystemStats.free())}"
+    msg += f"\n<b>RAM:</b> {stats['memory'].percent}% | <b>UPTIME:</b> {get_readable_time(time() - bot_start_time)}"
     return msg, button
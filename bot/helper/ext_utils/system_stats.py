@@ -0,0 +1,86 @@
+from asyncio import sleep
+from collections import deque
+from psutil import (
+    cpu_percent,
+    disk_partitions,
+    disk_usage,
+    net_io_counters,
+    swap_memory,
+    virtual_memory,
+)
+from time import time
+
+from ... import LOGGER, DOWNLOAD_DIR, bot_loop
+from .bot_utils import sync_to_async
+
+
+class SystemStats:
+    INTERVAL = 5
+    samples = deque(maxlen=15 * 60 // INTERVAL)
+    latest = None
+    _sampler = None
+
+    @classmethod
+    def start(cls):
+        if cls._sampler is None:
+            cpu_percent(percpu=True)
+            cls._sample()
+            cls._sampler = bot_loop.create_task(cls._sample_loop())
+
+    @classmethod
+    def _sample(cls):
+        disks = {}
+        for path in ["/", DOWNLOAD_DIR] + [
+            part.mountpoint for part in disk_partitions()
+        ]:
+            if path in disks:
+                continue
+            try:
+                disks[path] = disk_usage(path)
+            except Exception:
+                continue
+        per_cpu = cpu_percent(percpu=True)
+        cls.latest = {
+            "time": time(),
+            "cpu": round(sum(per_cpu) / max(len(per_cpu), 1), 1),
+            "per_cpu": per_cpu,
+            "memory": virtual_memory(),
+            "swap": swap_memory(),
+            "net": net_io_counters(),
+            "disks": disks,
+        }
+        cls.samples.append(cls.latest)
+
+    @classmethod
+    async def _sample_loop(cls):
+        while True:
+            await sleep(cls.INTERVAL)
+            try:
+                await sync_to_async(cls._sample)
+            except Exception as e:
+                LOGGER.error(f"Error while sampling system stats: {e}")
+
+    @classmethod
+    def get(cls):
+        if cls.latest is None:
+            cls._sample()
+        return cls.latest
+
+    @classmethod
+    def free(cls, path=DOWNLOAD_DIR):
+        disks = cls.get()["disks"]
+        if path not in disks:
+            return disk_usage(path).free
+        return disks[path].free
+
+    @classmethod
+    def average(cls, minutes, key="cpu"):
+        since = time() - minutes * 60
+        values = [
+            sample["memory"].percent if key == "memory" else sample[key]
+            for sample in cls.samples
+            if sample["time"] >= since
+        ]
+        if not values:
+            return 0
+        return round(sum(values) / len(values), 1)
@@ -1,4 +1,7 @@
+from aiofiles.os import path as aiopath
 from asyncio import Event
+from psutil import disk_usage
+from time import time
 
 from ... import (
     queued_dl,
@@ -6,12 +9,18 @@ from ... import (
     non_queued_up,
     non_queued_dl,
     queue_dict_lock,
+    task_dict,
+    user_data,
+    sudo_users,
+    disk_reservations,
+    queued_reservations,
+    DOWNLOAD_DIR,
     LOGGER,
 )
 from ...core.config_manager import Config
 from ..mirror_leech_utils.gdrive_utils.search import GoogleDriveSearch
 from .bot_utils import sync_to_async, get_telegraph_list
-from .files_utils import get_base_name
+from .files_utils import get_base_name, get_path_size
 from .links_utils import is_gdrive_id
 
 
@@ -51,17 +60,92 @@ async def stop_duplicate_check(listener):
     return False, None
 
 
+def is_privileged(user_id):
+    return (
+        user_id == Config.OWNER_ID
+        or user_id in sudo_users
+        or user_data.get(user_id, {}).get("SUDO", False)
+    )
+
+
+def _user_running(user_id):
+    return sum(
+        1
+        for mid in non_queued_dl | non_queued_up
+        if (tk := task_dict.get(mid)) is not None and tk.listener.user_id == user_id
+    )
+
+
+def _is_capped(user_id):
+    return (
+        bool(user_limit := Config.QUEUE_USER_LIMIT)
+        and not is_privileged(user_id)
+        and _user_running(user_id) >= user_limit
+    )
+
+
+def estimate_peak_size(listener):
+    multiplier = 1
+    if listener.extract:
+        multiplier += 1
+    if (
+        listener.ffmpeg_cmds
+        or listener.convert_audio
+        or listener.convert_video
+        or listener.sample_video
+    ):
+        multiplier += 1
+    if listener.compress or listener.is_leech:
+        multiplier += 1
+    return int(listener.size * multiplier)
+
+
+# Bytes already written into each reserved download directory. Sampled
+# outside queue_dict_lock at most every INTERVAL seconds, so admission checks
+# under the lock only do arithmetic. Unsampled directories count as empty,
+# which keeps their whole reservation.
+class ReservedUsage:
+    INTERVAL = 10
+    used = {}
+    _sampled = 0
+    _sampling = False
+
+    @classmethod
+    async def sample(cls):
+        if cls._sampling or time() - cls._sampled < cls.INTERVAL:
+            return
+        cls._sampling = True
+        try:
+            used = {}
+            for path in list(disk_reservations):
+                used[path] = (
+                    await get_path_size(path) if await aiopath.exists(path) else 0
+                )
+            cls.used = used
+            cls._sampled = time()
+        finally:
+            cls._sampling = False
+
+
+def get_available_space():
+    free = disk_usage(DOWNLOAD_DIR).free
+    for path, reserved in disk_reservations.items():
+        free -= max(reserved - ReservedUsage.used.get(path, 0), 0)
+    return free
+
+
 async def check_running_tasks(listener, state="dl"):
     all_limit = Config.QUEUE_ALL
     state_limit = Config.QUEUE_DOWNLOAD if state == "dl" else Config.QUEUE_UPLOAD
     event = None
     is_over_limit = False
+    if state == "dl" and disk_reservations:
+        await ReservedUsage.sample()
     async with queue_dict_lock:
         if state == "up" and listener.mid in non_queued_dl:
             non_queued_dl.remove(listener.mid)
         if (
-            (all_limit or state_limit)
-            and not listener.force_run
+            not listener.force_run
             and not (listener.force_upload and state == "up")
             and not (listener.force_download and state == "dl")
         ):
@@ -69,29 +153,57 @@ async def check_running_tasks(listener, state="dl"):
             up_count = len(non_queued_up)
             t_count = dl_count if state == "dl" else up_count
             is_over_limit = (
-                all_limit
-                and dl_count + up_count >= all_limit
-                and (not state_limit or t_count >= state_limit)
-            ) or (state_limit and t_count >= state_limit)
+                (
+                    all_limit
+                    and dl_count + up_count >= all_limit
+                    and (not state_limit or t_count >= state_limit)
+                )
+                or (state_limit and t_count >= state_limit)
+                or _is_capped(listener.user_id)
+            )
+            reserve = estimate_peak_size(listener) if state == "dl" else 0
+            if (
+                not is_over_limit
+                and reserve
+                and disk_reservations
+                and reserve > get_available_space()
+            ):
+                LOGGER.info(
+                    f"Not enough free space for {listener.name}, it needs around {reserve} bytes. Added to queue!"
+                )
+                is_over_limit = True
             if is_over_limit:
+                if reserve:
+                    queued_reservations[listener.dir] = reserve
                 event = Event()
-                if state == "dl":
-                    queued_dl[listener.mid] = event
-                else:
-                    queued_up[listener.mid] = event
+                (queued_dl if state == "dl" else queued_up).add(
+                    listener.mid,
+                    listener.user_id,
+                    event,
+                    is_privileged(listener.user_id),
+                )
         if not is_over_limit:
             if state == "up":
                 non_queued_up.add(listener.mid)
             else:
                 non_queued_dl.add(listener.mid)
+                if reserve := estimate_peak_size(listener):
+                    disk_reservations[listener.dir] = reserve
 
     return is_over_limit, event
 
 
+def _admit_reservation(mid):
+    path = f"{DOWNLOAD_DIR}{mid}"
+    if reserve := queued_reservations.pop(path, 0):
+        disk_reservations[path] = reserve
+
+
 async def start_dl_from_queued(mid: int):
     queued_dl[mid].set()
     del queued_dl[mid]
     non_queued_dl.add(mid)
+    _admit_reservation(mid)
 
 
 async def start_up_from_queued(mid: int):
@@ -100,55 +212,72 @@ async def start_up_from_queued(mid: int):
     non_queued_up.add(mid)
 
 
+def _start_queued(queue, running, count, can_start=None):
+    started = 0
+    while started < count:
+        mid, event = queue.pop(_is_capped, can_start)
+        if mid is None:
+            break
+        event.set()
+        running.add(mid)
+        _admit_reservation(mid)
+        started += 1
+    return started
+
+
+def _disk_admission():
+    if not queued_reservations:
+        return None
+    available = get_available_space()
+
+    def can_start(mid):
+        nonlocal available
+        reserve = queued_reservations.get(f"{DOWNLOAD_DIR}{mid}", 0)
+        if reserve > available and (disk_reservations or started):
+            return False
+        available -= reserve
+        started.append(mid)
+        return True
+
+    started = []
+    return can_start
+
+
 async def start_from_queued():
-    if all_limit := Config.QUEUE_ALL:
-        dl_limit = Config.QUEUE_DOWNLOAD
-        up_limit = Config.QUEUE_UPLOAD
-        async with queue_dict_lock:
-            dl = len(non_queued_dl)
-            up = len(non_queued_up)
-            all_ = dl + up
-            if all_ < all_limit:
-                f_tasks = all_limit - all_
-                if queued_up and (not up_limit or up < up_limit):
-                    for index, mid in enumerate(list(queued_up.keys()), start=1):
-                        await start_up_from_queued(mid)
-                        f_tasks -= 1
-                        if f_tasks == 0 or (up_limit and index >= up_limit - up):
-                            break
-                if queued_dl and (not dl_limit or dl < dl_limit) and f_tasks != 0:
-                    for index, mid in enumerate(list(queued_dl.keys()), start=1):
-                        await start_dl_from_queued(mid)
-                        if (dl_limit and index >= dl_limit - dl) or index == f_tasks:
-                            break
-        return
-
-    if up_limit := Config.QUEUE_UPLOAD:
-        async with queue_dict_lock:
-            up = len(non_queued_up)
-            if queued_up and up < up_limit:
-                f_tasks = up_limit - up
-                for index, mid in enumerate(list(queued_up.keys()), start=1):
-                    await start_up_from_queued(mid)
-                    if index == f_tasks:
-                        break
-    else:
-        async with queue_dict_lock:
-            if queued_up:
-                for mid in list(queued_up.keys()):
-                    await start_up_from_queued(mid)
-
-    if dl_limit := Config.QUEUE_DOWNLOAD:
-        async with queue_dict_lock:
-            dl = len(non_queued_dl)
-            if queued_dl and dl < dl_limit:
-                f_tasks = dl_limit - dl
-                for index, mid in enumerate(list(queued_dl.keys()), start=1):
-                    await start_dl_from_queued(mid)
-                    if index == f_tasks:
-                        break
-    else:
-        async with queue_dict_lock:
-            if queued_dl:
-                for mid in list(queued_dl.keys()):
-                    await start_dl_from_queued(mid)
+    dl_limit = Config.QUEUE_DOWNLOAD
+    up_limit = Config.QUEUE_UPLOAD
+    if queued_reservations and disk_reservations:
+        await ReservedUsage.sample()
+    async with queue_dict_lock:
+        dl = len(non_queued_dl)
+        up = len(non_queued_up)
+        if all_limit := Config.QUEUE_ALL:
+            f_tasks = all_limit - dl - up
+            if f_tasks <= 0:
+                return
+            if queued_up and (not up_limit or up < up_limit):
+                f_tasks -= _start_queued(
+                    queued_up,
+                    non_queued_up,
+                    min(f_tasks, up_limit - up) if up_limit else f_tasks,
+                )
+            if queued_dl and (not dl_limit or dl < dl_limit) and f_tasks > 0:
+                _start_queued(
+                    queued_dl,
+                    non_queued_dl,
+                    min(f_tasks, dl_limit - dl) if dl_limit else f_tasks,
+                    _disk_admission(),
+                )
+            return
+
+        if queued_up and (not up_limit or up < up_limit):
+            _start_queued(
+                queued_up, non_queued_up, up_limit - up if up_limit else len(queued_up)
+            )
+        if queued_dl and (not dl_limit or dl < dl_limit):
+            _start_queued(
+                queued_dl,
+                non_queued_dl,
+                dl_limit - dl if dl_limit else len(queued_dl),
+                _disk_admission(),
+            )
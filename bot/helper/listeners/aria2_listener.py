@@ -38,13 +38,19 @@ async def _on_download_started(api, data):
                 metamsg = "Downloading Metadata, wait then you can select files. Use torrent file to avoid this wait."
                 meta = await send_message(task.listener.message, metamsg)
                 while True:
-                    await sleep(0.5)
-                    if download.get("status", "") == "removed" or download.get(
-                        "followedBy", []
-                    ):
+                    future = TorrentManager.watch(gid)
+                    try:
+                        download = await api.tellStatus(gid)
+                    except Aria2rpcException:
+                        download = {"status": "removed"}
+                    if download.get("status", "") in [
+                        "removed",
+                        "error",
+                    ] or download.get("followedBy", []):
+                        TorrentManager.unwatch(gid, future)
                         await delete_message(meta)
                         break
-                    download = await api.tellStatus(gid)
+                    await TorrentManager.wait_event(gid, future, 30)
         return
     else:
         LOGGER.info(f"onDownloadStarted: {aria2_name(download)} - Gid: {gid}")
@@ -65,6 +71,7 @@ async def _on_download_started(api, data):
 async def _on_download_complete(api, data):
     try:
         gid = data["params"][0]["gid"]
+        TorrentManager.notify(gid, "complete")
         download = await api.tellStatus(gid)
         options = await api.getOption(gid)
     except (TimeoutError, ClientError, Exception) as e:
@@ -105,6 +112,7 @@ async def _on_download_complete(api, data):
 
 async def _on_bt_download_complete(api, data):
     gid = data["params"][0]["gid"]
+    TorrentManager.notify(gid, "complete")
     await sleep(1)
     download = await api.tellStatus(gid)
     LOGGER.info(f"onBtDownloadComplete: {aria2_name(download)} - Gid: {gid}")
@@ -169,6 +177,7 @@ async def _on_bt_download_complete(api, data):
 
 async def _on_download_stopped(_, data):
     gid = data["params"][0]["gid"]
+    TorrentManager.notify(gid, "stop")
     await sleep(4)
     if task := await get_task_by_gid(gid):
         await task.listener.on_download_error("Dead torrent!")
@@ -176,6 +185,7 @@ async def _on_download_stopped(_, data):
 
 async def _on_download_error(api, data):
     gid = data["params"][0]["gid"]
+    TorrentManager.notify(gid, "error")
     await sleep(1)
     LOGGER.info(f"onDownloadError: {gid}")
     error = "None"
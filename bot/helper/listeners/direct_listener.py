@@ -1,8 +1,10 @@
-from asyncio import sleep, TimeoutError
+from asyncio import gather, TimeoutError
 from aiohttp.client_exceptions import ClientError
 
 from ... import LOGGER
+from ...core.config_manager import Config
 from ...core.torrent_manager import TorrentManager, aria2_name
+from ..mirror_leech_utils.status_utils.aria2_status import get_download
 
 
 class DirectListener:
@@ -12,64 +14,46 @@ class DirectListener:
         self._a2c_opt = a2c_opt
         self._proc_bytes = 0
         self._failed = 0
-        self.download_task = None
+        self._downloads = {}
         self.name = self.listener.name
 
+    def _current(self):
+        return [
+            TorrentManager.get_cached(gid) or download
+            for gid, download in list(self._downloads.items())
+        ]
+
     @property
     def processed_bytes(self):
-        if self.download_task:
-            return self._proc_bytes + int(
-                self.download_task.get("completedLength", "0")
-            )
-        return self._proc_bytes
+        return self._proc_bytes + sum(
+            int(download.get("completedLength", "0")) for download in self._current()
+        )
 
     @property
     def speed(self):
-        return (
-            int(self.download_task.get("downloadSpeed", "0"))
-            if self.download_task
-            else 0
+        return sum(
+            int(download.get("downloadSpeed", "0")) for download in self._current()
+        )
+
+    @property
+    def is_waiting(self):
+        downloads = self._current()
+        return bool(downloads) and all(
+            download.get("status", "") == "waiting" for download in downloads
         )
 
     async def download(self, contents):
         self.is_downloading = True
-        for content in contents:
-            if self.listener.is_cancelled:
-                break
-            if content["path"]:
-                self._a2c_opt["dir"] = f"{self._path}/{content['path']}"
-            else:
-                self._a2c_opt["dir"] = self._path
-            filename = content["filename"]
-            self._a2c_opt["out"] = filename
-            try:
-                gid = await TorrentManager.aria2.addUri(
-                    uris=[content["url"]], options=self._a2c_opt, position=0
-                )
-            except (TimeoutError, ClientError, Exception) as e:
-                self._failed += 1
-                LOGGER.error(f"Unable to download {filename} due to: {e}")
-                continue
-            self.download_task = await TorrentManager.aria2.tellStatus(gid)
-            while True:
+        pending = iter(contents)
+
+        async def _worker():
+            for content in pending:
                 if self.listener.is_cancelled:
-                    if self.download_task:
-                        await TorrentManager.aria2_remove(self.download_task)
-                    break
-                self.download_task = await TorrentManager.aria2.tellStatus(gid)
-                if error_message := self.download_task.get("errorMessage"):
-                    self._failed += 1
-                    LOGGER.error(
-                        f"Unable to download {aria2_name(self.download_task)} due to: {error_message}"
-                    )
-                    await TorrentManager.aria2_remove(self.download_task)
-                    break
-                elif self.download_task.get("status", "") == "complete":
-                    self._proc_bytes += int(self.download_task.get("totalLength", "0"))
-                    await TorrentManager.aria2_remove(self.download_task)
                     break
-                await sleep(1)
-            self.download_task = None
+                await self._download_one(content)
+
+        workers = min(Config.DIRECT_DOWNLOAD_WORKERS or 1, len(contents))
+        await gather(*(_worker() for _ in range(workers)))
         if self.listener.is_cancelled:
             return
         if self._failed == len(contents):
@@ -78,9 +62,53 @@ class DirectListener:
         await self.listener.on_download_complete()
         return
 
+    async def _download_one(self, content):
+        options = self._a2c_opt.copy()
+        if content["path"]:
+            options["dir"] = f"{self._path}/{content['path']}"
+        else:
+            options["dir"] = self._path
+        filename = content["filename"]
+        options["out"] = filename
+        try:
+            gid = await TorrentManager.aria2.addUri(
+                uris=[content["url"]], options=options, position=0
+            )
+        except (TimeoutError, ClientError, Exception) as e:
+            self._failed += 1
+            LOGGER.error(f"Unable to download {filename} due to: {e}")
+            return
+        download = {}
+        future = None
+        try:
+            while True:
+                future = TorrentManager.watch(gid)
+                download = await get_download(gid, download, True)
+                self._downloads[gid] = download
+                if self.listener.is_cancelled:
+                    if download:
+                        await TorrentManager.aria2_remove(download)
+                    break
+                if error_message := download.get("errorMessage"):
+                    self._failed += 1
+                    LOGGER.error(
+                        f"Unable to download {aria2_name(download)} due to: {error_message}"
+                    )
+                    await TorrentManager.aria2_remove(download)
+                    break
+                elif download.get("status", "") == "complete":
+                    self._proc_bytes += int(download.get("totalLength", "0"))
+                    await TorrentManager.aria2_remove(download)
+                    break
+                await TorrentManager.wait_event(gid, future, 30)
+        finally:
+            TorrentManager.unwatch(gid, future)
+            self._downloads.pop(gid, None)
+
     async def cancel_task(self):
         self.listener.is_cancelled = True
         LOGGER.info(f"Cancelling Download: {self.listener.name}")
         await self.listener.on_download_error("Download Cancelled by User!")
-        if self.download_task:
-            await TorrentManager.aria2_remove(self.download_task)
+        for download in list(self._downloads.values()):
+            if download:
+                await TorrentManager.aria2_remove(download)
@@ -2,8 +2,9 @@ import os
 from aiofiles.os import path as aiopath, listdir, remove, makedirs
 from os import path as ospath
 from aioshutil import move
-from asyncio import sleep, gather
+from asyncio import Queue, sleep, gather
 from html import escape
+from natsort import natsorted
 from requests import utils as rutils
 
 from ... import (
@@ -18,6 +19,8 @@ from ... import (
     queue_dict_lock,
     same_directory_lock,
     DOWNLOAD_DIR,
+    disk_reservations,
+    queued_reservations,
 )
 from ...core.config_manager import Config
 from ...core.torrent_manager import TorrentManager
@@ -207,101 +210,119 @@ class TaskListener(TaskConfig):
             else:
                 await remove_non_included_files(up_dir, self.included_extensions)
 
-        if self.ffmpeg_cmds:
-            up_path = await self.proceed_ffmpeg(
-                up_path,
-                gid,
+        pipelined = self.pipelined = (
+            self.is_leech
+            and not self.is_file
+            and not self.compress
+            and not self.merge
+            and bool(
+                self.ffmpeg_cmds
+                or self.extract_subtitle
+                or self.name_sub
+                or self.screen_shots
+                or self.convert_audio
+                or self.convert_video
+                or self.sample_video
             )
-            if self.is_cancelled:
-                return
-            self.is_file = await aiopath.isfile(up_path)
-            self.name = up_path.replace(f"{up_dir}/", "").split("/", 1)[0]
-            self.size = await get_path_size(up_dir)
-            self.clear()
-
-        if self.extract_subtitle:
-            up_path = await self.proceed_extract_subtitle(up_path, gid)
-            if self.is_cancelled:
-                return
-            self.is_file = await aiopath.isfile(up_path)
-            self.name = up_path.replace(f"{up_dir}/", "").split("/", 1)[0]
-            self.size = await get_path_size(up_dir)
-            self.clear()
-
-        if self.merge:
-            output_name = self.merge
-            up_path = await self.proceed_merge(
-                up_path,
-                gid,
-                output_name
-            )
-            if self.is_cancelled:
-                return
-            self.is_file = await aiopath.isfile(up_path)
-            up_dir, self.name = up_path.rsplit("/", 1)
-            self.size = await get_path_size(up_dir)
-            self.subname = ""
-            self.subsize = 0
-            self.files_to_proceed = []
-            self.proceed_count = 0
-            self.progress = True
-
-
-
-        if self.name_sub:
-            up_path = await self.substitute(up_path)
-            if self.is_cancelled:
-                return
-            self.is_file = await aiopath.isfile(up_path)
-            self.name = up_path.replace(f"{up_dir}/", "").split("/", 1)[0]
-
-        if self.screen_shots:
-            up_path = await self.generate_screenshots(up_path)
-            if self.is_cancelled:
-                return
-            self.is_file = await aiopath.isfile(up_path)
-            self.name = up_path.replace(f"{up_dir}/", "").split("/", 1)[0]
-            self.size = await get_path_size(up_dir)
-
-        if self.convert_audio or self.convert_video:
-            up_path = await self.convert_media(
-                up_path,
-                gid,
-            )
-            if self.is_cancelled:
-                return
-            self.is_file = await aiopath.isfile(up_path)
-            self.name = up_path.replace(f"{up_dir}/", "").split("/", 1)[0]
-            self.size = await get_path_size(up_dir)
-            self.clear()
-
-        if self.sample_video:
-            up_path = await self.generate_sample_video(up_path, gid)
-            if self.is_cancelled:
-                return
-            self.is_file = await aiopath.isfile(up_path)
-            self.name = up_path.replace(f"{up_dir}/", "").split("/", 1)[0]
-            self.size = await get_path_size(up_dir)
-            self.clear()
-
-        if self.compress:
-            up_path = await self.proceed_compress(
-                up_path,
-                gid,
-            )
-            self.is_file = await aiopath.isfile(up_path)
-            if self.is_cancelled:
-                return
-            self.clear()
+        )
+
+        if not pipelined:
+            if self.ffmpeg_cmds:
+                up_path = await self.proceed_ffmpeg(
+                    up_path,
+                    gid,
+                )
+                if self.is_cancelled:
+                    return
+                self.is_file = await aiopath.isfile(up_path)
+                self.name = up_path.replace(f"{up_dir}/", "").split("/", 1)[0]
+                self.size = await get_path_size(up_dir)
+                self.clear()
+
+            if self.extract_subtitle:
+                up_path = await self.proceed_extract_subtitle(up_path, gid)
+                if self.is_cancelled:
+                    return
+                self.is_file = await aiopath.isfile(up_path)
+                self.name = up_path.replace(f"{up_dir}/", "").split("/", 1)[0]
+                self.size = await get_path_size(up_dir)
+                self.clear()
+
+            if self.merge:
+                output_name = self.merge
+                up_path = await self.proceed_merge(
+                    up_path,
+                    gid,
+                    output_name
+                )
+                if self.is_cancelled:
+                    return
+                self.is_file = await aiopath.isfile(up_path)
+                up_dir, self.name = up_path.rsplit("/", 1)
+                self.size = await get_path_size(up_dir)
+                self.subname = ""
+                self.subsize = 0
+                self.files_to_proceed = []
+                self.proceed_count = 0
+                self.progress = True
+
+
+
+            if self.name_sub:
+                up_path = await self.substitute(up_path)
+                if self.is_cancelled:
+                    return
+                self.is_file = await aiopath.isfile(up_path)
+                self.name = up_path.replace(f"{up_dir}/", "").split("/", 1)[0]
+
+            if self.screen_shots:
+                up_path = await self.generate_screenshots(up_path)
+                if self.is_cancelled:
+                    return
+                self.is_file = await aiopath.isfile(up_path)
+                self.name = up_path.replace(f"{up_dir}/", "").split("/", 1)[0]
+                self.size = await get_path_size(up_dir)
+
+            if self.convert_audio or self.convert_video:
+                up_path = await self.convert_media(
+                    up_path,
+                    gid,
+                )
+                if self.is_cancelled:
+                    return
+                self.is_file = await aiopath.isfile(up_path)
+                self.name = up_path.replace(f"{up_dir}/", "").split("/", 1)[0]
+                self.size = await get_path_size(up_dir)
+                self.clear()
+
+            if self.sample_video:
+                up_path = await self.generate_sample_video(up_path, gid)
+                if self.is_cancelled:
+                    return
+                self.is_file = await aiopath.isfile(up_path)
+                self.name = up_path.replace(f"{up_dir}/", "").split("/", 1)[0]
+                self.size = await get_path_size(up_dir)
+                self.clear()
+
+            if self.compress:
+                up_path = await self.proceed_compress(
+                    up_path,
+                    gid,
+                )
+                self.is_file = await aiopath.isfile(up_path)
+                if self.is_cancelled:
+                    return
+                self.clear()
 
         self.name = up_path.replace(f"{up_dir}/", "").split("/", 1)[0]
         self.size = await get_path_size(up_dir)
 
-        if self.is_leech and not self.compress:
-            await self.proceed_split(up_path, gid)
-            if self.is_cancelled:
-                return
-            self.clear()
+        if not pipelined:
+            if self.is_leech and not self.compress:
+                await self.proceed_split(up_path, gid)
+                if self.is_cancelled:
+                    return
+                self.clear()
 
         self.subproc = None
 
@@ -323,10 +344,18 @@ class TaskListener(TaskConfig):
             tg = TelegramUploader(self, up_dir)
             async with task_dict_lock:
                 task_dict[self.mid] = TelegramStatus(self, tg, gid, "up")
-            await gather(
-                update_status_message(self.message.chat.id),
-                tg.upload(),
-            )
+            if pipelined:
+                feed = Queue()
+                await gather(
+                    update_status_message(self.message.chat.id),
+                    tg.upload(feed),
+                    self.proceed_pipeline(up_path, gid, tg, feed),
+                )
+            else:
+                await gather(
+                    update_status_message(self.message.chat.id),
+                    tg.upload(),
+                )
             del tg
         elif is_gdrive_id(self.up_dest):
             LOGGER.info(f"Gdrive Upload Name: {self.name}")
@@ -424,6 +453,7 @@ class TaskListener(TaskConfig):
             async with queue_dict_lock:
                 if self.mid in non_queued_up:
                     non_queued_up.remove(self.mid)
+                disk_reservations.pop(self.dir, None)
             await start_from_queued()
             return
         await clean_download(self.dir)
@@ -473,6 +503,8 @@ class TaskListener(TaskConfig):
                 non_queued_dl.remove(self.mid)
             if self.mid in non_queued_up:
                 non_queued_up.remove(self.mid)
+            disk_reservations.pop(self.dir, None)
+            queued_reservations.pop(self.dir, None)
 
         await start_from_queued()
         await sleep(3)
@@ -486,12 +518,79 @@ class TaskListener(TaskConfig):
         for root, dirs, files in await sync_to_async(os.walk, path):
             yield root, dirs, files
 
+    async def proceed_pipeline(self, path, gid, tg, feed):
+        try:
+            files = [
+                ospath.join(dirpath, file_)
+                for dirpath, _, files_ in natsorted(await sync_to_async(os.walk, path))
+                if not dirpath.strip().endswith("/yt-dlp-thumb")
+                for file_ in natsorted(files_)
+            ]
+            for index, f_path in enumerate(files):
+                if self.is_cancelled:
+                    return
+                stage_dir = ospath.join(ospath.dirname(f_path), f".pipe{index}")
+                await makedirs(stage_dir, exist_ok=True)
+                await move(f_path, stage_dir)
+                if self.ffmpeg_cmds:
+                    await self.proceed_ffmpeg(stage_dir, gid)
+                    if self.is_cancelled:
+                        return
+                    self.clear()
+                if self.extract_subtitle:
+                    await self.proceed_extract_subtitle(stage_dir, gid)
+                    if self.is_cancelled:
+                        return
+                if self.name_sub:
+                    await self.substitute(stage_dir)
+                if self.screen_shots:
+                    await self.generate_screenshots(stage_dir)
+                if self.convert_audio or self.convert_video:
+                    await self.convert_media(stage_dir, gid)
+                    if self.is_cancelled:
+                        return
+                    self.clear()
+                if self.sample_video:
+                    await self.generate_sample_video(stage_dir, gid)
+                    if self.is_cancelled:
+                        return
+                    self.clear()
+                await self.proceed_split(stage_dir, gid)
+                if self.is_cancelled:
+                    return
+                self.clear()
+                await self._unstage(stage_dir, feed)
+        finally:
+            self.subproc = None
+            feed.put_nowait(None)
+
+    # Moves a file's stage outputs back next to where it was, so every file of
+    # a release is uploaded from the same directory and grouped together.
+    async def _unstage(self, stage_dir, feed):
+        parent = ospath.dirname(stage_dir)
+        for dirpath, _, files_ in natsorted(await sync_to_async(os.walk, stage_dir)):
+            dest_dir = ospath.join(parent, ospath.relpath(dirpath, stage_dir))
+            await makedirs(dest_dir, exist_ok=True)
+            moved = []
+            for file_ in files_:
+                dest = ospath.join(dest_dir, file_)
+                if await aiopath.exists(dest):
+                    dest = ospath.join(dest_dir, f"{self.mid}-{file_}")
+                src = ospath.join(dirpath, file_)
+                await move(src, dest)
+                if split := self.virtual_splits.pop(src, None):
+                    self.virtual_splits[dest] = split
+                moved.append(ospath.basename(dest))
+            if moved:
+                feed.put_nowait((ospath.normpath(dest_dir), moved))
+        await clean_target(stage_dir)
+
     async def proceed_extract_subtitle(self, path, gid):
         LOGGER.info(f"Extracting subtitles from: {self.name}")
         async with task_dict_lock:
             if self.is_cancelled:
                 return
-            task_dict[self.mid] = TelegramStatus(self, None, gid, "st")
+            self.set_stage_status(TelegramStatus(self, None, gid, "st"))
         if self.is_file:
             ffmpeg = FFMpeg(self)
             if await ffmpeg.extract_subtitles(path) and self.se_only:
@@ -539,6 +638,8 @@ class TaskListener(TaskConfig):
                 non_queued_dl.remove(self.mid)
             if self.mid in non_queued_up:
                 non_queued_up.remove(self.mid)
+            disk_reservations.pop(self.dir, None)
+            queued_reservations.pop(self.dir, None)
 
         await start_from_queued()
         await sleep(3)
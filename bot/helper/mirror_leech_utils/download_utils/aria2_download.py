@@ -96,8 +96,8 @@ async def add_aria2_download(listener, dpath, header, ratio, seed_time):
         async with task_dict_lock:
             task = task_dict[listener.mid]
             task.queued = False
-            await task.update()
-            new_gid = task.gid()
+        await task.update(True)
+        new_gid = task.gid()
 
         await TorrentManager.aria2.unpause(new_gid)
         LOGGER.info(f"Start Queued Download from Aria2c: {name}. Gid: {new_gid}")
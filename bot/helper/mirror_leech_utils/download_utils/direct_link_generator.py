@@ -1,13 +1,18 @@
-from cloudscraper import create_scraper
+from asyncio import Semaphore, TimeoutError, get_running_loop, shield, wait_for
+from collections import OrderedDict, deque
+from copy import deepcopy
+from cloudscraper import create_scraper as _create_scraper
+from concurrent.futures import ThreadPoolExecutor
 from hashlib import sha256
 from http.cookiejar import MozillaCookieJar
 from json import loads
 from lxml.etree import HTML
 from os import path as ospath
 from re import findall, match, search
-from requests import Session, post, get
+from requests import Session
 from requests.adapters import HTTPAdapter
-from time import sleep
+from threading import BoundedSemaphore
+from time import sleep, time
 from urllib.parse import parse_qs, urlparse, quote
 from urllib3.util.retry import Retry
 from uuid import uuid4
@@ -23,6 +28,187 @@ user_agent = (
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:122.0) Gecko/20100101 Firefox/122.0"
 )
 
+RESOLVE_WORKERS = 32
+HOST_CONCURRENCY = 4
+RESOLVE_TIMEOUT = 180
+REQUEST_TIMEOUT = 30
+DEAD_HOSTS = [
+    "anonfiles.com",
+    "zippyshare.com",
+    "letsupload.io",
+    "hotfile.io",
+    "bayfiles.com",
+    "megaupload.nz",
+    "letsupload.cc",
+    "filechan.org",
+    "myfile.is",
+    "vshare.is",
+    "rapidshare.nu",
+    "lolabits.se",
+    "openload.cc",
+    "share-online.is",
+    "upvid.cc",
+    "uptobox.com",
+    "uptobox.fr",
+]
+
+_resolvers = {}
+_host_limits = {}
+_resolving = {}
+_crawl_limits = {}
+_resolve_pool = ThreadPoolExecutor(
+    max_workers=RESOLVE_WORKERS, thread_name_prefix="direct_link"
+)
+_crawl_pool = ThreadPoolExecutor(max_workers=16, thread_name_prefix="folder_crawl")
+_pooled_adapter = HTTPAdapter(pool_connections=64, pool_maxsize=HOST_CONCURRENCY * 2)
+
+
+# Plain sessions share one adapter, so connections to a host are reused across
+# resolver calls while cookies stay per session.
+class PooledSession(Session):
+    def __init__(self):
+        super().__init__()
+        self.mount("https://", _pooled_adapter)
+        self.mount("http://", _pooled_adapter)
+
+    def request(self, method, url, *args, **kwargs):
+        kwargs.setdefault("timeout", REQUEST_TIMEOUT)
+        return super().request(method, url, *args, **kwargs)
+
+    def close(self):
+        for prefix, adapter in list(self.adapters.items()):
+            if adapter is _pooled_adapter:
+                del self.adapters[prefix]
+        super().close()
+
+
+def create_scraper():
+    scraper = _create_scraper()
+    request = scraper.request
+
+    def _request(method, url, *args, **kwargs):
+        kwargs.setdefault("timeout", REQUEST_TIMEOUT)
+        return request(method, url, *args, **kwargs)
+
+    scraper.request = _request
+    return scraper
+
+
+# Resolved links shared across tasks and evicted in LRU order once the cache
+# is full. Links are not cached by default since most hosts hand out signed or
+# session bound URLs; only hosts with stable links or stable folder listings
+# are kept.
+class ResolveCache:
+    SIZE = 512
+    DEFAULT_TTL = 0
+    FOLDER_TTL = 600
+    HOST_TTL = {
+        "github.com": 3600,
+        "pixeldrain.com": 3600,
+    }
+    FOLDER_HOSTS = {
+        "gofile.io",
+        "linkbox.to",
+        "lbx.to",
+        "teltobx.net",
+        "telbx.net",
+        "linkbox.cloud",
+    }
+    _entries = OrderedDict()
+
+    @staticmethod
+    def key(link):
+        url, _, password = link.partition("::")
+        parsed = urlparse(url.strip())
+        path = parsed.path.rstrip("/") or "/"
+        return (
+            f"{parsed.scheme.lower()}://{(parsed.netloc or '').lower()}{path}"
+            f"{'?' + parsed.query if parsed.query else ''}",
+            password,
+        )
+
+    @staticmethod
+    def _domains(host):
+        labels = host.split(".")
+        return [".".join(labels[index:]) for index in range(len(labels) - 1)]
+
+    @classmethod
+    def ttl(cls, host, result=None):
+        domains = cls._domains(host)
+        if isinstance(result, dict) and any(
+            domain in cls.FOLDER_HOSTS for domain in domains
+        ):
+            return cls.FOLDER_TTL
+        for domain in domains:
+            if (ttl := cls.HOST_TTL.get(domain)) is not None:
+                return ttl
+        return cls.DEFAULT_TTL
+
+    @classmethod
+    def get(cls, key):
+        if (entry := cls._entries.get(key)) is None:
+            return None
+        if entry[0] < time():
+            del cls._entries[key]
+            return None
+        cls._entries.move_to_end(key)
+        return deepcopy(entry[1])
+
+    @classmethod
+    def put(cls, key, host, result):
+        ttl = cls.ttl(host, result)
+        if ttl <= 0:
+            return
+        cls._entries[key] = (time() + ttl, deepcopy(result))
+        cls._entries.move_to_end(key)
+        while len(cls._entries) > cls.SIZE:
+            cls._entries.popitem(last=False)
+
+
+def _crawl_limit(host):
+    return _crawl_limits.setdefault(host, BoundedSemaphore(HOST_CONCURRENCY))
+
+
+def crawl_folders(host, roots, list_folder):
+    """Breadth-first folder crawl with at most HOST_CONCURRENCY listings in flight
+    per host. list_folder(node) returns (files, subfolders) and files are
+    yielded in listing order as soon as their folder is listed."""
+    limit = _crawl_limit(host)
+
+    def _list(node):
+        with limit:
+            return list_folder(node)
+
+    pending = deque(_crawl_pool.submit(_list, node) for node in roots)
+    try:
+        while pending:
+            files, folders = pending.popleft().result()
+            pending.extend(_crawl_pool.submit(_list, node) for node in folders)
+            yield from files
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def crawl_map(host, func, items):
+    limit = _crawl_limit(host)
+
+    def _call(item):
+        with limit:
+            return func(item)
+
+    return _crawl_pool.map(_call, items)
+
+
+def get(url, **kwargs):
+    with PooledSession() as session:
+        return session.get(url, **kwargs)
+
+
+def post(url, **kwargs):
+    with PooledSession() as session:
+        return session.post(url, **kwargs)
+
 
 def direct_link_generator(link):
     """direct links generator"""
@@ -31,193 +217,70 @@ def direct_link_generator(link):
         raise DirectDownloadLinkException("ERROR: Invalid URL")
     elif "yadi.sk" in link or "disk.yandex." in link:
         return yandex_disk(link)
-    elif "buzzheavier.com" in domain:
-        return buzzheavier(link)
-    elif "devuploads" in domain:
-        return devuploads(link)
-    elif "lulacloud.com" in domain:
-        return lulacloud(link)
-    elif "uploadhaven" in domain:
-        return uploadhaven(link)
-    elif "fuckingfast.co" in domain:
-        return fuckingfast_dl(link)
-    elif "mediafile.cc" in domain:
-        return mediafile(link)
-    elif "mediafire.com" in domain:
-        return mediafire(link)
-    elif "osdn.net" in domain:
-        return osdn(link)
-    elif "github.com" in domain:
-        return github(link)
-    elif "transfer.it" in domain:
-        return transfer_it(link)
-    elif "hxfile.co" in domain:
-        return hxfile(link)
-    elif "1drv.ms" in domain:
-        return onedrive(link)
-    elif any(x in domain for x in ["pixeldrain.com", "pixeldra.in"]):
-        return pixeldrain(link)
-    elif "racaty" in domain:
-        return racaty(link)
-    elif "1fichier.com" in domain:
-        return fichier(link)
-    elif "solidfiles.com" in domain:
-        return solidfiles(link)
-    elif "krakenfiles.com" in domain:
-        return krakenfiles(link)
-    elif "upload.ee" in domain:
-        return uploadee(link)
-    elif "gofile.io" in domain:
-        return gofile(link)
-    elif "send.cm" in domain:
-        return send_cm(link)
-    elif "tmpsend.com" in domain:
-        return tmpsend(link)
-    elif "easyupload.io" in domain:
-        return easyupload(link)
-    elif "streamvid.net" in domain:
-        return streamvid(link)
-    elif "shrdsk.me" in domain:
-        return shrdsk(link)
-    elif "u.pcloud.link" in domain:
-        return pcloud(link)
-    elif "qiwi.gg" in domain:
-        return qiwi(link)
-    elif "mp4upload.com" in domain:
-        return mp4upload(link)
-    elif "berkasdrive.com" in domain:
-        return berkasdrive(link)
-    elif "swisstransfer.com" in domain:
-        return swisstransfer(link)
-    elif any(x in domain for x in ["akmfiles.com", "akmfls.xyz"]):
-        return akmfiles(link)
-    elif any(
-        x in domain
-        for x in [
-            "dood.watch",
-            "doodstream.com",
-            "dood.to",
-            "dood.so",
-            "dood.cx",
-            "dood.la",
-            "dood.ws",
-            "dood.sh",
-            "doodstream.co",
-            "dood.pm",
-            "dood.wf",
-            "dood.re",
-            "dood.video",
-            "dooood.com",
-            "dood.yt",
-            "doods.yt",
-            "dood.stream",
-            "doods.pro",
-            "ds2play.com",
-            "d0o0d.com",
-            "ds2video.com",
-            "do0od.com",
-            "d000d.com",
-        ]
-    ):
-        return doods(link)
-    elif any(
-        x in domain
-        for x in [
-            "streamtape.com",
-            "streamtape.co",
-            "streamtape.cc",
-            "streamtape.to",
-            "streamtape.net",
-            "streamta.pe",
-            "streamtape.xyz",
-        ]
-    ):
-        return streamtape(link)
-    elif any(x in domain for x in ["wetransfer.com", "we.tl"]):
-        return wetransfer(link)
-    elif any(
-        x in domain
-        for x in [
-            "terabox.com",
-            "nephobox.com",
-            "4funbox.com",
-            "mirrobox.com",
-            "momerybox.com",
-            "teraboxapp.com",
-            "1024tera.com",
-            "terabox.app",
-            "gibibox.com",
-            "goaibox.com",
-            "terasharelink.com",
-            "teraboxlink.com",
-            "freeterabox.com",
-            "1024terabox.com",
-            "teraboxshare.com",
-            "terafileshare.com",
-            "terabox.club",
-        ]
-    ):
-        return terabox(link)
-    elif any(
-        x in domain
-        for x in [
-            "filelions.co",
-            "filelions.site",
-            "filelions.live",
-            "filelions.to",
-            "mycloudz.cc",
-            "cabecabean.lol",
-            "filelions.online",
-            "embedwish.com",
-            "kitabmarkaz.xyz",
-            "wishfast.top",
-            "streamwish.to",
-            "kissmovies.net",
-        ]
-    ):
-        return filelions_and_streamwish(link)
-    elif any(x in domain for x in ["streamhub.ink", "streamhub.to"]):
-        return streamhub(link)
-    elif any(
-        x in domain
-        for x in [
-            "linkbox.to",
-            "lbx.to",
-            "teltobx.net",
-            "telbx.net",
-            "linkbox.cloud",
-        ]
-    ):
-        return linkBox(link)
+    elif resolver := get_resolver(domain):
+        return resolver(link)
     elif is_share_link(link):
         return filepress(link) if "filepress" in domain else sharer_scraper(link)
-    elif any(
-        x in domain
-        for x in [
-            "anonfiles.com",
-            "zippyshare.com",
-            "letsupload.io",
-            "hotfile.io",
-            "bayfiles.com",
-            "megaupload.nz",
-            "letsupload.cc",
-            "filechan.org",
-            "myfile.is",
-            "vshare.is",
-            "rapidshare.nu",
-            "lolabits.se",
-            "openload.cc",
-            "share-online.is",
-            "upvid.cc",
-            "uptobox.com",
-            "uptobox.fr",
-        ]
-    ):
+    elif any(x in domain for x in DEAD_HOSTS):
         raise DirectDownloadLinkException(f"ERROR: R.I.P {domain}")
     else:
         raise DirectDownloadLinkException(f"No Direct link function found for {link}")
 
 
+def register_resolver(resolver, *domains):
+    for domain in domains:
+        _resolvers[domain] = resolver
+
+
+def get_resolver(domain):
+    labels = domain.split(".")
+    for index in range(len(labels) - 1):
+        if resolver := _resolvers.get(".".join(labels[index:])):
+            return resolver
+    for key, resolver in _resolvers.items():
+        if key in domain:
+            return resolver
+    return None
+
+
+async def resolve_direct_link(link):
+    key = ResolveCache.key(link)
+    if (result := ResolveCache.get(key)) is not None:
+        return result
+    if key not in _resolving:
+        _resolving[key] = get_running_loop().create_task(_resolve(link, key))
+        _resolving[key].add_done_callback(lambda _: _resolving.pop(key, None))
+    return deepcopy(await shield(_resolving[key]))
+
+
+async def _resolve(link, key):
+    host = urlparse(link).hostname or ""
+    if host not in _host_limits:
+        _host_limits[host] = Semaphore(HOST_CONCURRENCY)
+    limit = _host_limits[host]
+    await limit.acquire()
+    future = get_running_loop().run_in_executor(
+        _resolve_pool, direct_link_generator, link
+    )
+
+    # The host slot is held until the resolver thread really returns, even
+    # after the wait below gives up on it.
+    def _release(done):
+        limit.release()
+        if not done.cancelled():
+            done.exception()
+
+    future.add_done_callback(_release)
+    try:
+        result = await wait_for(shield(future), RESOLVE_TIMEOUT)
+    except TimeoutError:
+        raise DirectDownloadLinkException(
+            f"ERROR: Timed out while generating direct link for {host}"
+        )
+    ResolveCache.put(key, host, result)
+    return result
+
+
 def get_captcha_token(session, params):
     recaptcha_api = "https://www.google.com/recaptcha/api2"
     res = session.get(f"{recaptcha_api}/anchor", params=params)
@@ -249,7 +312,7 @@ def buzzheavier(url):
         return url
 
     def _bhscraper(url, folder=False):
-        session = Session()
+        session = PooledSession()
         if "/download" not in url:
             url += "/download"
         url = url.strip()
@@ -272,7 +335,7 @@ def buzzheavier(url):
         except Exception as e:
             raise DirectDownloadLinkException(f"ERROR: {str(e)}") from e
 
-    with Session() as session:
+    with PooledSession() as session:
         tree = HTML(session.get(url).text)
         if link := tree.xpath(
             "//a[contains(@class, 'link-button') and contains(@class, 'gay-button')]/@hx-get"
@@ -344,7 +407,7 @@ def devuploads(url):
     @param url: URL from devuploads.com
     @return: Direct download link
     """
-    with Session() as session:
+    with PooledSession() as session:
         res = session.get(url)
         html = HTML(res.text)
         if not html.xpath("//input[@name]"):
@@ -741,7 +804,7 @@ def solidfiles(url):
 
 
 def krakenfiles(url):
-    with Session() as session:
+    with PooledSession() as session:
         try:
             _res = session.get(url)
         except Exception as e:
@@ -785,7 +848,7 @@ def terabox(url):
         return url
     api_url = f"https://wdzone-terabox-api.vercel.app/api?url={quote(url)}"
     try:
-        with Session() as session:
+        with PooledSession() as session:
             req = session.get(api_url, headers={"User-Agent": user_agent}).json()
     except Exception as e:
         raise DirectDownloadLinkException(f"ERROR: {e.__class__.__name__}") from e
@@ -1002,7 +1065,8 @@ def linkBox(url: str):
             details["total_size"] += size
         details["contents"].append(item)
 
-    def __fetch_links(session, _id=0, folderPath=""):
+    def __list_folder(session, node):
+        _id, folderPath = node
         params = {
             "shareToken": shareToken,
             "pageSize": 1000,
@@ -1022,14 +1086,16 @@ def linkBox(url: str):
             raise DirectDownloadLinkException("ERROR: data not found")
         try:
             if data["shareType"] == "singleItem":
-                return __singleItem(session, data["itemId"])
+                __singleItem(session, data["itemId"])
+                return [], []
         except:
             pass
         if not details["title"]:
             details["title"] = data["dirName"]
         contents = data["list"]
+        files, folders = [], []
         if not contents:
-            return None
+            return files, folders
         for content in contents:
             if content["type"] == "dir" and "url" not in content:
                 if not folderPath:
@@ -1038,7 +1104,7 @@ def linkBox(url: str):
                     newFolderPath = ospath.join(folderPath, content["name"])
                 if not details["title"]:
                     details["title"] = content["name"]
-                __fetch_links(session, content["id"], newFolderPath)
+                folders.append((content["id"], newFolderPath))
             elif "url" in content:
                 if not folderPath:
                     folderPath = details["title"]
@@ -1052,18 +1118,18 @@ def linkBox(url: str):
                     "filename": filename,
                     "url": content["url"],
                 }
-                if "size" in content:
-                    size = content["size"]
-                    if isinstance(size, str) and size.isdigit():
-                        size = float(size)
-                    details["total_size"] += size
-                details["contents"].append(item)
-
-    try:
-        with Session() as session:
-            __fetch_links(session)
-    except DirectDownloadLinkException as e:
-        raise e
+                size = content.get("size", 0)
+                if isinstance(size, str) and size.isdigit():
+                    size = float(size)
+                files.append((item, size))
+        return files, folders
+
+    with PooledSession() as session:
+        for item, size in crawl_folders(
+            "linkbox.to", [(0, "")], lambda node: __list_folder(session, node)
+        ):
+            details["total_size"] += size
+            details["contents"].append(item)
     return details
 
 
@@ -1095,7 +1161,8 @@ def gofile(url):
         except Exception as e:
             raise e
 
-    def __fetch_links(session, _id, folderPath=""):
+    def __list_folder(session, node):
+        _id, folderPath = node
         _url = f"https://api.gofile.io/contents/{_id}?cache=true"
         headers = {
             "User-Agent": user_agent,
@@ -1130,6 +1197,7 @@ def gofile(url):
             details["title"] = data["name"] if data["type"] == "folder" else _id
 
         contents = data["children"]
+        files, folders = [], []
         for content in contents.values():
             if content["type"] == "folder":
                 if not content["public"]:
@@ -1138,7 +1206,7 @@ def gofile(url):
                     newFolderPath = ospath.join(details["title"], content["name"])
                 else:
                     newFolderPath = ospath.join(folderPath, content["name"])
-                __fetch_links(session, content["id"], newFolderPath)
+                folders.append((content["id"], newFolderPath))
             else:
                 if not folderPath:
                     folderPath = details["title"]
@@ -1147,22 +1215,25 @@ def gofile(url):
                     "filename": content["name"],
                     "url": content["link"],
                 }
-                if "size" in content:
-                    size = content["size"]
-                    if isinstance(size, str) and size.isdigit():
-                        size = float(size)
-                    details["total_size"] += size
-                details["contents"].append(item)
+                size = content.get("size", 0)
+                if isinstance(size, str) and size.isdigit():
+                    size = float(size)
+                files.append((item, size))
+        return files, folders
 
     details = {"contents": [], "title": "", "total_size": 0}
-    with Session() as session:
+    with PooledSession() as session:
         try:
             token = __get_token(session)
         except Exception as e:
             raise DirectDownloadLinkException(f"ERROR: {e.__class__.__name__}")
         details["header"] = f"Cookie: accountToken={token}"
         try:
-            __fetch_links(session, _id)
+            for item, size in crawl_folders(
+                "gofile.io", [(_id, "")], lambda node: __list_folder(session, node)
+            ):
+                details["total_size"] += size
+                details["contents"].append(item)
         except Exception as e:
             raise DirectDownloadLinkException(e)
 
@@ -1278,7 +1349,7 @@ def mediafireFolder(url):
         else:
             return None
 
-    def __get_content(folderKey, folderPath="", content_type="folders"):
+    def __get_content(folderKey, content_type):
         try:
             params = {
                 "content_type": content_type,
@@ -1296,37 +1367,49 @@ def mediafireFolder(url):
         _res = _json["response"]
         if "message" in _res:
             raise DirectDownloadLinkException(f"ERROR: {_res['message']}")
-        _folder_content = _res["folder_content"]
-        if content_type == "folders":
-            folders = _folder_content["folders"]
-            for folder in folders:
-                if folderPath:
-                    newFolderPath = ospath.join(folderPath, folder["name"])
-                else:
-                    newFolderPath = ospath.join(folder["name"])
-                __get_content(folder["folderkey"], newFolderPath)
-            __get_content(folderKey, folderPath, "files")
-        else:
-            files = _folder_content["files"]
-            for file in files:
-                item = {}
-                if not (_url := __scraper(file["links"]["normal_download"])):
-                    continue
-                item["filename"] = file["filename"]
-                if not folderPath:
-                    folderPath = details["title"]
-                item["path"] = ospath.join(folderPath)
-                item["url"] = _url
-                if "size" in file:
-                    size = file["size"]
-                    if isinstance(size, str) and size.isdigit():
-                        size = float(size)
-                    details["total_size"] += size
-                details["contents"].append(item)
+        return _res["folder_content"][content_type]
+
+    def __list_folder(node):
+        folderKey, folderPath = node
+        folders = []
+        for folder in __get_content(folderKey, "folders"):
+            if folderPath:
+                newFolderPath = ospath.join(folderPath, folder["name"])
+            else:
+                newFolderPath = ospath.join(folder["name"])
+            folders.append((folder["folderkey"], newFolderPath))
+        files = [
+            (file, folderPath or details["title"])
+            for file in __get_content(folderKey, "files")
+        ]
+        return files, folders
 
     try:
-        for folder in folder_infos:
-            __get_content(folder["folderkey"], folder["name"])
+        files = list(
+            crawl_folders(
+                "mediafire.com",
+                [(folder["folderkey"], folder["name"]) for folder in folder_infos],
+                __list_folder,
+            )
+        )
+        links = crawl_map(
+            "mediafire.com",
+            __scraper,
+            [file["links"]["normal_download"] for file, _ in files],
+        )
+        for (file, folderPath), _url in zip(files, links):
+            if not _url:
+                continue
+            item = {
+                "filename": file["filename"],
+                "path": ospath.join(folderPath),
+                "url": _url,
+            }
+            size = file.get("size", 0)
+            if isinstance(size, str) and size.isdigit():
+                size = float(size)
+            details["total_size"] += size
+            details["contents"].append(item)
     except Exception as e:
         raise DirectDownloadLinkException(e)
     finally:
@@ -1407,7 +1490,7 @@ def send_cm(url):
         details["title"] = splitted_url[5]
     else:
         details["title"] = splitted_url[-1]
-    session = Session()
+    session = PooledSession()
 
     def __collectFolders(html):
         folders = []
@@ -1770,7 +1853,7 @@ def qiwi(url):
 
 
 def mp4upload(url):
-    with Session() as session:
+    with PooledSession() as session:
         try:
             url = url.replace("embed-", "")
             req = session.get(url).text
@@ -1912,3 +1995,116 @@ def swisstransfer(link):
         "total_size": total_size,
         "header": "User-Agent:Mozilla/5.0",
     }
+
+
+register_resolver(buzzheavier, "buzzheavier.com")
+register_resolver(devuploads, "devuploads")
+register_resolver(lulacloud, "lulacloud.com")
+register_resolver(uploadhaven, "uploadhaven")
+register_resolver(fuckingfast_dl, "fuckingfast.co")
+register_resolver(mediafile, "mediafile.cc")
+register_resolver(mediafire, "mediafire.com")
+register_resolver(osdn, "osdn.net")
+register_resolver(github, "github.com")
+register_resolver(transfer_it, "transfer.it")
+register_resolver(hxfile, "hxfile.co")
+register_resolver(onedrive, "1drv.ms")
+register_resolver(pixeldrain, "pixeldrain.com", "pixeldra.in")
+register_resolver(racaty, "racaty")
+register_resolver(fichier, "1fichier.com")
+register_resolver(solidfiles, "solidfiles.com")
+register_resolver(krakenfiles, "krakenfiles.com")
+register_resolver(uploadee, "upload.ee")
+register_resolver(gofile, "gofile.io")
+register_resolver(send_cm, "send.cm")
+register_resolver(tmpsend, "tmpsend.com")
+register_resolver(easyupload, "easyupload.io")
+register_resolver(streamvid, "streamvid.net")
+register_resolver(shrdsk, "shrdsk.me")
+register_resolver(pcloud, "u.pcloud.link")
+register_resolver(qiwi, "qiwi.gg")
+register_resolver(mp4upload, "mp4upload.com")
+register_resolver(berkasdrive, "berkasdrive.com")
+register_resolver(swisstransfer, "swisstransfer.com")
+register_resolver(akmfiles, "akmfiles.com", "akmfls.xyz")
+register_resolver(
+    doods,
+    "dood.watch",
+    "doodstream.com",
+    "dood.to",
+    "dood.so",
+    "dood.cx",
+    "dood.la",
+    "dood.ws",
+    "dood.sh",
+    "doodstream.co",
+    "dood.pm",
+    "dood.wf",
+    "dood.re",
+    "dood.video",
+    "dooood.com",
+    "dood.yt",
+    "doods.yt",
+    "dood.stream",
+    "doods.pro",
+    "ds2play.com",
+    "d0o0d.com",
+    "ds2video.com",
+    "do0od.com",
+    "d000d.com",
+)
+register_resolver(
+    streamtape,
+    "streamtape.com",
+    "streamtape.co",
+    "streamtape.cc",
+    "streamtape.to",
+    "streamtape.net",
+    "streamta.pe",
+    "streamtape.xyz",
+)
+register_resolver(wetransfer, "wetransfer.com", "we.tl")
+register_resolver(
+    terabox,
+    "terabox.com",
+    "nephobox.com",
+    "4funbox.com",
+    "mirrobox.com",
+    "momerybox.com",
+    "teraboxapp.com",
+    "1024tera.com",
+    "terabox.app",
+    "gibibox.com",
+    "goaibox.com",
+    "terasharelink.com",
+    "teraboxlink.com",
+    "freeterabox.com",
+    "1024terabox.com",
+    "teraboxshare.com",
+    "terafileshare.com",
+    "terabox.club",
+)
+register_resolver(
+    filelions_and_streamwish,
+    "filelions.co",
+    "filelions.site",
+    "filelions.live",
+    "filelions.to",
+    "mycloudz.cc",
+    "cabecabean.lol",
+    "filelions.online",
+    "embedwish.com",
+    "kitabmarkaz.xyz",
+    "wishfast.top",
+    "streamwish.to",
+    "kissmovies.net",
+)
+register_resolver(streamhub, "streamhub.ink", "streamhub.to")
+register_resolver(
+    linkBox,
+    "linkbox.to",
+    "lbx.to",
+    "teltobx.net",
+    "telbx.net",
+    "linkbox.cloud",
+)
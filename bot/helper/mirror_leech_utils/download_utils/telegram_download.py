@@ -1,4 +1,8 @@
-from asyncio import Lock, sleep
+from aiofiles.os import makedirs
+from asyncio import Lock, gather, sleep
+from collections import deque
+from os import O_CREAT, O_TRUNC, O_WRONLY, close, ftruncate, open as osopen, pwrite
+from os import path as ospath
 from time import time
 from pyrogram.errors import FloodWait
 
@@ -7,7 +11,9 @@ from .... import (
     task_dict,
     task_dict_lock,
 )
+from ....core.config_manager import Config
 from ....core.telegram_manager import TgClient
+from ...ext_utils.bot_utils import sync_to_async
 from ...ext_utils.task_manager import check_running_tasks, stop_duplicate_check
 from ...mirror_leech_utils.status_utils.queue_status import QueueStatus
 from ...mirror_leech_utils.status_utils.telegram_status import TelegramStatus
@@ -16,6 +22,9 @@ from ...telegram_helper.message_utils import send_status_message
 global_lock = Lock()
 GLOBAL_GID = set()
 
+CHUNK_SIZE = 1024 * 1024
+PART_CHUNKS = 32
+
 
 class TelegramDownloadHelper:
     def __init__(self, listener):
@@ -69,16 +78,118 @@ class TelegramDownloadHelper:
                 GLOBAL_GID.remove(self._id)
         await self._listener.on_download_complete()
 
-    async def _download(self, message, path):
+    @staticmethod
+    def _get_media(message):
+        return (
+            message.document
+            or message.photo
+            or message.video
+            or message.audio
+            or message.voice
+            or message.video_note
+            or message.sticker
+            or message.animation
+            or None
+        )
+
+    async def _get_sources(self, message):
+        if self.session == "user":
+            sources = [(TgClient.user, message)]
+            other = self._listener.client
+        else:
+            sources = [(self._listener.client, message)]
+            other = TgClient.user if self._listener.user_transmission else None
+        if other is None or not self._listener.is_super_chat:
+            return sources
+        try:
+            msg = await other.get_messages(
+                chat_id=message.chat.id, message_ids=message.id
+            )
+            media = self._get_media(msg) if msg else None
+            if media is not None and media.file_unique_id == self._id:
+                sources.append((other, msg))
+        except Exception as e:
+            LOGGER.warning(f"Second session can't access the file, {e}")
+        return sources
+
+    async def _download_parallel(self, message, path, size):
+        if path.endswith("/"):
+            path = f"{path}{self._listener.name}"
+        await makedirs(ospath.dirname(path), exist_ok=True)
+        total_chunks = -(-size // CHUNK_SIZE)
+        parts = deque(
+            (start, min(PART_CHUNKS, total_chunks - start), 0)
+            for start in range(0, total_chunks, PART_CHUNKS)
+        )
+        errors = []
+
+        async def _worker(client, msg, fd):
+            while parts and not errors and not self._listener.is_cancelled:
+                start, limit, retries = parts.popleft()
+                done = 0
+                try:
+                    async for chunk in client.stream_media(
+                        msg, limit=limit, offset=start
+                    ):
+                        if self._listener.is_cancelled or errors:
+                            return
+                        await sync_to_async(
+                            pwrite, fd, chunk, (start + done) * CHUNK_SIZE
+                        )
+                        self._processed_bytes += len(chunk)
+                        done += 1
+                    if done < limit:
+                        raise ValueError(f"Got {done}/{limit} chunks of this part")
+                except FloodWait as f:
+                    LOGGER.warning(str(f))
+                    parts.append((start + done, limit - done, retries))
+                    await sleep(f.value)
+                except Exception as e:
+                    if retries >= 3:
+                        errors.append(e)
+                        return
+                    LOGGER.warning(f"{e}. Retrying part from chunk {start + done}")
+                    parts.append((start + done, limit - done, retries + 1))
+
+        sources = await self._get_sources(message)
+        connections = Config.TG_DOWNLOAD_CONNECTIONS or 1
+        fd = await sync_to_async(osopen, path, O_WRONLY | O_CREAT | O_TRUNC, 0o644)
         try:
-            download = await message.download(
-                file_name=path, progress=self._on_download_progress
+            await sync_to_async(ftruncate, fd, size)
+            await gather(
+                *(
+                    _worker(client, msg, fd)
+                    for client, msg in sources
+                    for _ in range(connections)
+                )
             )
+        finally:
+            await sync_to_async(close, fd)
+        if errors:
+            raise errors[0]
+        if self._listener.is_cancelled:
+            return None
+        return path
+
+    async def _download(self, message, path):
+        try:
+            size = self._listener.size
+            if (
+                Config.TG_DOWNLOAD_CONNECTIONS > 1
+                and size
+                and size > 2 * PART_CHUNKS * CHUNK_SIZE
+            ):
+                download = await self._download_parallel(message, path, size)
+            else:
+                download = await message.download(
+                    file_name=path, progress=self._on_download_progress
+                )
             if self._listener.is_cancelled:
                 return
         except (FloodWait) as f:
             LOGGER.warning(str(f))
             await sleep(f.value)
+            self._processed_bytes = 0
             await self._download(message, path)
             return
         except Exception as e:
@@ -100,17 +211,7 @@ class TelegramDownloadHelper:
                 )
             else:
                 self.session = "bot"
-        media = (
-            message.document
-            or message.photo
-            or message.video
-            or message.audio
-            or message.voice
-            or message.video_note
-            or message.sticker
-            or message.animation
-            or None
-        )
+        media = self._get_media(message)
 
         if media is not None:
             async with global_lock:
@@ -1,16 +1,22 @@
+from asyncio import shield
+from collections import OrderedDict
+from copy import deepcopy
+from hashlib import md5
 from logging import getLogger
 from os import path as ospath, listdir
 from re import search as re_search
 from secrets import token_urlsafe
-from yt_dlp import YoutubeDL, DownloadError
+from time import time
+from yt_dlp import YoutubeDL
 
 
-from .... import task_dict_lock, task_dict
+from .... import bot_loop, task_dict_lock, task_dict
 from ...ext_utils.bot_utils import sync_to_async, async_to_sync
 from ...ext_utils.task_manager import check_running_tasks, stop_duplicate_check
 from ...mirror_leech_utils.status_utils.queue_status import QueueStatus
 from ...telegram_helper.message_utils import send_status_message
 from ..status_utils.yt_dlp_status import YtDlpStatus
+from .yt_dlp_pool import YtDlpJob, YtDlpPool
 
 LOGGER = getLogger(__name__)
 
@@ -41,6 +47,92 @@ class MyLogger:
             LOGGER.error(msg)
 
 
+# Extracted info dicts shared by the quality menu, the metadata lookup and the
+# download, keyed by link and the options that change what gets extracted.
+# Format selection and output options are left out since they are re-applied
+# by process_ie_result, and so is ignoreerrors: an info dict extracted without
+# it is just as valid for a download that sets it.
+class YtInfoCache:
+    SIZE = 32
+    TTL = 300
+    IGNORED_OPTIONS = {
+        "allow_multiple_audio_streams",
+        "allow_multiple_video_streams",
+        "allow_playlist_files",
+        "download_ranges",
+        "external_downloader",
+        "external_downloader_args",
+        "format",
+        "fragment_retries",
+        "ignoreerrors",
+        "logger",
+        "merge_output_format",
+        "noprogress",
+        "outtmpl",
+        "overwrites",
+        "playlist_items",
+        "postprocessors",
+        "progress_hooks",
+        "retries",
+        "retry_sleep_functions",
+        "trim_file_name",
+        "writethumbnail",
+    }
+    _entries = OrderedDict()
+    _extracting = {}
+
+    @classmethod
+    def key(cls, link, options):
+        params = sorted(
+            (key, repr(value))
+            for key, value in options.items()
+            if key not in cls.IGNORED_OPTIONS
+        )
+        return link, md5(repr(params).encode()).hexdigest()
+
+    @classmethod
+    def get(cls, link, options):
+        key = cls.key(link, options)
+        if (entry := cls._entries.get(key)) is None:
+            return None
+        expires, playlist_items, info = entry
+        if expires < time():
+            del cls._entries[key]
+            return None
+        if "entries" in info and playlist_items != options.get("playlist_items"):
+            return None
+        cls._entries.move_to_end(key)
+        return deepcopy(info)
+
+    @classmethod
+    def put(cls, link, options, info):
+        key = cls.key(link, options)
+        cls._entries[key] = (time() + cls.TTL, options.get("playlist_items"), info)
+        cls._entries.move_to_end(key)
+        while len(cls._entries) > cls.SIZE:
+            cls._entries.popitem(last=False)
+
+    @classmethod
+    async def extract(cls, link, options):
+        if (info := cls.get(link, options)) is not None:
+            return info
+        key = (*cls.key(link, options), options.get("playlist_items"))
+        if key not in cls._extracting:
+            cls._extracting[key] = bot_loop.create_task(
+                cls._extract(link, dict(options))
+            )
+            cls._extracting[key].add_done_callback(
+                lambda _: cls._extracting.pop(key, None)
+            )
+        return deepcopy(await shield(cls._extracting[key]))
+
+    @classmethod
+    async def _extract(cls, link, options):
+        info = await YtDlpPool.run(YtDlpJob("extract", link, options))
+        cls.put(link, options, info)
+        return info
+
+
 class YoutubeDLHelper:
     def __init__(self, listener):
         self._last_downloaded = 0
@@ -53,6 +145,7 @@ class YoutubeDLHelper:
         self._ext = ""
         self.is_playlist = False
         self.keep_thumb = False
+        self._job = None
         self.opts = {
             "progress_hooks": [self._on_download_progress],
             "logger": MyLogger(self, self._listener),
@@ -132,14 +225,10 @@ class YoutubeDLHelper:
         self._listener.is_cancelled = True
         async_to_sync(self._listener.on_download_error, error)
 
-    def _extract_meta_data(self):
-        if self._listener.link.startswith(("rtmp", "mms", "rstp", "rtmps")):
-            self.opts["external_downloader"] = "ffmpeg"
+    def _extract_meta_data(self, result):
         with YoutubeDL(self.opts) as ydl:
             try:
-                result = ydl.extract_info(self._listener.link, download=False)
-                if result is None:
-                    raise ValueError("Info result is None")
+                result = ydl.process_ie_result(result, download=False)
             except Exception as e:
                 return self._on_download_error(str(e))
             if "entries" in result:
@@ -167,29 +256,55 @@ class YoutubeDLHelper:
                 if not self._ext:
                     self._ext = ext
 
-    def _download(self, path):
-        try:
-            with YoutubeDL(self.opts) as ydl:
-                try:
-                    ydl.download([self._listener.link])
-                except DownloadError as e:
-                    if not self._listener.is_cancelled:
-                        self._on_download_error(str(e))
-                    return
-            if self.is_playlist and (
-                not ospath.exists(path) or len(listdir(path)) == 0
-            ):
-                self._on_download_error(
-                    "No video available to download from this playlist. Check logs for more details"
+    def _on_worker_message(self, message):
+        if message["type"] == "progress":
+            self._on_download_progress(message)
+        elif message["type"] == "log":
+            getattr(self.opts["logger"], message["level"])(message["msg"])
+
+    async def _on_worker_start(self):
+        if self._listener.is_cancelled:
+            self._job.cancelled = True
+            return
+        async with task_dict_lock:
+            if isinstance(task_dict.get(self._listener.mid), QueueStatus):
+                task_dict[self._listener.mid] = YtDlpStatus(
+                    self._listener, self, self._gid
                 )
-                return
-            if self._listener.is_cancelled:
-                return
-            async_to_sync(self._listener.on_download_complete)
+
+    async def _download(self, path):
+        self._job = YtDlpJob(
+            "download",
+            self._listener.link,
+            self.opts,
+            YtInfoCache.get(self._listener.link, self.opts),
+            self._on_worker_message,
+            self._on_worker_start,
+        )
+        if YtDlpPool.is_full("download"):
+            LOGGER.info(f"Waiting for a yt-dlp worker: {self._listener.name}")
+            async with task_dict_lock:
+                task_dict[self._listener.mid] = QueueStatus(
+                    self._listener, self._gid, "dl"
+                )
+        try:
+            await YtDlpPool.run(self._job)
         except Exception as e:
-            LOGGER.error(str(e))
-            self._on_download_error(str(e))
-        return
+            if not self._listener.is_cancelled:
+                self._listener.is_cancelled = True
+                await self._listener.on_download_error(str(e))
+            return
+        finally:
+            self._job = None
+        if self.is_playlist and (not ospath.exists(path) or len(listdir(path)) == 0):
+            self._listener.is_cancelled = True
+            await self._listener.on_download_error(
+                "No video available to download from this playlist. Check logs for more details"
+            )
+            return
+        if self._listener.is_cancelled:
+            return
+        await self._listener.on_download_complete()
 
     async def add_download(self, path, qual, playlist, options):
         if playlist:
@@ -236,7 +351,16 @@ class YoutubeDLHelper:
 
         self.opts["format"] = qual
 
-        await sync_to_async(self._extract_meta_data)
+        if self._listener.link.startswith(("rtmp", "mms", "rstp", "rtmps")):
+            self.opts["external_downloader"] = "ffmpeg"
+        try:
+            result = await YtInfoCache.extract(self._listener.link, self.opts)
+        except Exception as e:
+            self._listener.is_cancelled = True
+            await self._listener.on_download_error(str(e))
+            return
+
+        await sync_to_async(self._extract_meta_data, result)
         if self._listener.is_cancelled:
             return
 
@@ -336,11 +460,13 @@ class YoutubeDLHelper:
         if not add_to_queue:
             LOGGER.info(f"Download with YT_DLP: {self._listener.name}")
 
-        await sync_to_async(self._download, path)
+        await self._download(path)
 
     async def cancel_task(self):
         self._listener.is_cancelled = True
         LOGGER.info(f"Cancelling Download: {self._listener.name}")
+        if self._job is not None:
+            await self._job.cancel()
         await self._listener.on_download_error("Stopped by User!")
 
     def _set_options(self, options):
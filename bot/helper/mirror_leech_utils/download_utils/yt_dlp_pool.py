@@ -0,0 +1,214 @@
+from asyncio import Condition, create_subprocess_exec, sleep
+from asyncio.subprocess import PIPE
+from contextlib import asynccontextmanager
+from json import dumps, loads
+from os import path as ospath
+from sys import executable
+
+from .... import LOGGER, bot_loop
+from ....core.config_manager import Config
+
+WORKER_SCRIPT = ospath.join(ospath.dirname(__file__), "yt_dlp_worker.py")
+
+
+def _portable(opts):
+    opts = {
+        key: value
+        for key, value in opts.items()
+        if key not in ("logger", "progress_hooks")
+    }
+    if retry := opts.get("retry_sleep_functions"):
+        opts["retry_sleep_functions"] = {
+            key: func(1) if callable(func) else func for key, func in retry.items()
+        }
+    if callable(ranges := opts.get("download_ranges")):
+        opts["download_ranges"] = ranges(None, None)
+    return opts
+
+
+class YtDlpJob:
+    def __init__(
+        self, action, link, opts, info=None, on_message=None, on_start=None
+    ):
+        self.payload = {
+            "action": action,
+            "link": link,
+            "opts": _portable(opts),
+            "info": info,
+        }
+        self.on_message = on_message
+        self.on_start = on_start
+        self.cancelled = False
+        self.worker = None
+
+    async def cancel(self):
+        self.cancelled = True
+        if self.worker is not None:
+            await self.worker.cancel(self)
+
+
+class _Worker:
+    def __init__(self):
+        self.proc = None
+        self.job = None
+
+    @property
+    def alive(self):
+        return self.proc is not None and self.proc.returncode is None
+
+    async def start(self):
+        self.proc = await create_subprocess_exec(
+            executable,
+            WORKER_SCRIPT,
+            stdin=PIPE,
+            stdout=PIPE,
+            limit=YtDlpPool.LINE_LIMIT,
+        )
+
+    async def _send(self, message):
+        self.proc.stdin.write(f"{dumps(message, default=repr)}\n".encode())
+        await self.proc.stdin.drain()
+
+    async def run(self, job):
+        self.job = job
+        await self._send(job.payload)
+        while line := await self.proc.stdout.readline():
+            message = loads(line)
+            if message["type"] == "result":
+                self.job = None
+                return message["info"]
+            if message["type"] == "error":
+                self.job = None
+                raise ValueError(message["msg"])
+            if job.on_message is None:
+                continue
+            try:
+                job.on_message(message)
+            except Exception:
+                if not job.cancelled:
+                    await job.cancel()
+        raise ValueError("yt-dlp worker exited unexpectedly")
+
+    async def cancel(self, job):
+        if self.job is not job or not self.alive:
+            return
+        try:
+            await self._send({"action": "cancel"})
+        except Exception:
+            pass
+        bot_loop.create_task(self._kill_after(job, YtDlpPool.CANCEL_GRACE))
+
+    async def _kill_after(self, job, delay):
+        await sleep(delay)
+        if self.job is job:
+            LOGGER.warning("yt-dlp worker ignored cancel, killing it")
+            self.kill()
+
+    def kill(self):
+        if self.alive:
+            self.proc.kill()
+
+
+# Persistent yt-dlp worker processes, so extraction and downloads don't hold
+# the GIL of the bot process. Each worker runs one job at a time. Extraction
+# has its own slots so quality menus never wait behind long downloads.
+class YtDlpPool:
+    CANCEL_GRACE = 10
+    EXTRACT_WORKERS = 2
+    LINE_LIMIT = 256 * 1024 * 1024
+    _idle = []
+    _workers = set()
+    _slots = {}
+    _running = {}
+    _sizes = {}
+
+    @classmethod
+    def _size(cls, action):
+        if action == "extract":
+            return cls.EXTRACT_WORKERS
+        return max(
+            Config.YT_DLP_WORKERS or 1,
+            Config.QUEUE_DOWNLOAD or Config.QUEUE_ALL or 0,
+        )
+
+    # Running jobs are counted against the current size, so a resize at
+    # runtime takes effect without handing out permits beyond the new limit.
+    @classmethod
+    def _limit(cls, action):
+        size = cls._size(action)
+        if action not in cls._slots:
+            cls._slots[action] = Condition()
+            cls._running[action] = 0
+        if size != cls._sizes.get(action):
+            if size > cls._sizes.get(action, size):
+                bot_loop.create_task(cls._wake(action))
+            cls._sizes[action] = size
+            while len(cls._idle) > sum(cls._sizes.values()):
+                worker = cls._idle.pop()
+                worker.kill()
+                cls._workers.discard(worker)
+        return size
+
+    @classmethod
+    def is_full(cls, action):
+        size = cls._limit(action)
+        return cls._running[action] >= size
+
+    @classmethod
+    async def _wake(cls, action):
+        async with cls._slots[action]:
+            cls._slots[action].notify_all()
+
+    @classmethod
+    @asynccontextmanager
+    async def _slot(cls, action):
+        cls._limit(action)
+        slots = cls._slots[action]
+        async with slots:
+            await slots.wait_for(
+                lambda: cls._running[action] < cls._limit(action)
+            )
+            cls._running[action] += 1
+        try:
+            yield
+        finally:
+            async with slots:
+                cls._running[action] -= 1
+                slots.notify_all()
+
+    @classmethod
+    async def run(cls, job):
+        action = job.payload["action"]
+        async with cls._slot(action):
+            if job.on_start is not None:
+                await job.on_start()
+            if job.cancelled:
+                raise ValueError("Cancelling...")
+            worker = cls._idle.pop() if cls._idle else _Worker()
+            if not worker.alive:
+                await worker.start()
+            cls._workers.add(worker)
+            job.worker = worker
+            try:
+                return await worker.run(job)
+            finally:
+                job.worker = None
+                # A job that didn't end with a result or error leaves the
+                # worker mid-stream, so it can't be handed to the next job.
+                if (
+                    worker.job is None
+                    and worker.alive
+                    and len(cls._idle) < sum(cls._sizes.values())
+                ):
+                    cls._idle.append(worker)
+                else:
+                    worker.job = None
+                    worker.kill()
+                    cls._workers.discard(worker)
+
+    @classmethod
+    def close_all(cls):
+        for worker in cls._workers:
+            worker.kill()
+        cls._workers.clear()
+        cls._idle.clear()
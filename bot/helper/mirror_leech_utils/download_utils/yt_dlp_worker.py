@@ -0,0 +1,108 @@
+# Standalone yt-dlp worker started by YtDlpPool. It is run as a script so it
+# never imports the bot package. Jobs arrive as JSON lines on stdin; progress,
+# log lines and results go back as JSON lines on the original stdout, while
+# anything yt-dlp or its subprocesses print lands on stderr.
+from json import dumps, loads
+from os import dup, dup2, fdopen
+from queue import Queue
+from sys import stdin
+from threading import Event, Lock, Thread
+from time import time
+from yt_dlp import YoutubeDL
+
+PROGRESS_INTERVAL = 0.5
+PROGRESS_KEYS = (
+    "status",
+    "downloaded_bytes",
+    "total_bytes",
+    "total_bytes_estimate",
+    "speed",
+    "eta",
+)
+
+_out = fdopen(dup(1), "w")
+dup2(2, 1)
+_out_lock = Lock()
+_cancel = Event()
+_last_progress = 0
+
+
+def _send(**message):
+    with _out_lock:
+        _out.write(dumps(message, default=repr) + "\n")
+        _out.flush()
+
+
+class _Logger:
+    @staticmethod
+    def debug(msg):
+        if msg.startswith(("[Merger]", "[ExtractAudio]")):
+            _send(type="log", level="debug", msg=msg)
+
+    @staticmethod
+    def warning(msg):
+        _send(type="log", level="warning", msg=msg)
+
+    @staticmethod
+    def error(msg):
+        _send(type="log", level="error", msg=msg)
+
+
+def _on_progress(d):
+    global _last_progress
+    if _cancel.is_set():
+        raise ValueError("Cancelling...")
+    if d["status"] == "downloading" and time() - _last_progress < PROGRESS_INTERVAL:
+        return
+    _last_progress = time()
+    _send(type="progress", **{key: d.get(key) for key in PROGRESS_KEYS})
+
+
+def _options(opts):
+    opts["logger"] = _Logger
+    opts["progress_hooks"] = [_on_progress]
+    if retry := opts.get("retry_sleep_functions"):
+        opts["retry_sleep_functions"] = {
+            key: lambda n, delay=delay: delay for key, delay in retry.items()
+        }
+    if isinstance(ranges := opts.get("download_ranges"), list):
+        opts["download_ranges"] = lambda info, ytdl: ranges
+    return opts
+
+
+def _run(job):
+    with YoutubeDL(_options(job["opts"])) as ydl:
+        if job["action"] == "extract":
+            result = ydl.extract_info(job["link"], download=False)
+            if result is None:
+                raise ValueError("Info result is None")
+            return ydl.sanitize_info(result)
+        if job.get("info") is not None:
+            ydl.process_ie_result(job["info"], download=True)
+        else:
+            ydl.download([job["link"]])
+
+
+def _read_jobs(jobs):
+    for line in stdin:
+        message = loads(line)
+        if message["action"] == "cancel":
+            _cancel.set()
+        else:
+            _cancel.clear()
+            jobs.put(message)
+    jobs.put(None)
+
+
+def main():
+    jobs = Queue()
+    Thread(target=_read_jobs, args=(jobs,), daemon=True).start()
+    while (job := jobs.get()) is not None:
+        try:
+            _send(type="result", info=_run(job))
+        except Exception as e:
+            _send(type="error", msg=str(e))
+
+
+if __name__ == "__main__":
+    main()
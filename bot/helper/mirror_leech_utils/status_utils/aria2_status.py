@@ -9,7 +9,9 @@ from ...ext_utils.status_utils import (
 )
 
 
-async def get_download(gid, old_info=None):
+async def get_download(gid, old_info=None, fresh=False):
+    if not fresh and (res := TorrentManager.get_cached(gid)):
+        return res
     try:
         res = await TorrentManager.aria2.tellStatus(gid)
         return res or old_info
@@ -28,11 +30,11 @@ class Aria2Status:
         self.seeding = seeding
         self.tool = "aria2"
 
-    async def update(self):
-        self._download = await get_download(self._gid, self._download)
+    async def update(self, fresh=False):
+        self._download = await get_download(self._gid, self._download, fresh)
         if self._download.get("followedBy", []):
             self._gid = self._download["followedBy"][0]
-            self._download = await get_download(self._gid)
+            self._download = await get_download(self._gid, fresh=fresh)
 
     def progress(self):
         try:
@@ -115,7 +117,7 @@ class Aria2Status:
 
     async def cancel_task(self):
         self.listener.is_cancelled = True
-        await self.update()
+        await self.update(True)
         await TorrentManager.aria2_remove(self._download)
         if self._download.get("seeder", "") == "true" and self.seeding:
             LOGGER.info(f"Cancelling Seed: {self.name()}")
@@ -1,4 +1,4 @@
-from .... import LOGGER
+from .... import LOGGER, queued_dl, queued_up
 from ...ext_utils.status_utils import get_readable_file_size, MirrorStatus
 
 
@@ -24,6 +24,10 @@ class QueueStatus:
             return MirrorStatus.STATUS_QUEUEDL
         return MirrorStatus.STATUS_QUEUEUP
 
+    def queue_position(self):
+        queue = queued_dl if self._status == "dl" else queued_up
+        return queue.position(self.listener.mid)
+
     def processed_bytes(self):
         return 0
 
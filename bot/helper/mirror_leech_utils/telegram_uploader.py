@@ -5,7 +5,7 @@ import PTN
 import imgbbpy
 from PIL import Image
 from aioshutil import rmtree
-from asyncio import sleep
+from asyncio import Event, Queue, create_task, gather, sleep
 from logging import getLogger
 from natsort import natsorted
 from os import walk, path as ospath
@@ -27,18 +27,23 @@ from tenacity import (
     wait_exponential,
     stop_after_attempt,
     retry_if_exception_type,
+    retry_if_not_exception_type,
     RetryError,
 )
 
 from ... import intervals
 from ...core.config_manager import Config
 from ...core.telegram_manager import TgClient
+from ...core.upload_resume import UploadResume
 from ..ext_utils.bot_utils import sync_to_async
-from ..ext_utils.files_utils import is_archive, get_base_name
+from ..ext_utils.files_utils import is_archive, get_base_name, get_file_parts
 from ..telegram_helper.message_utils import delete_message
+from ..telegram_helper.chat_pacer import ChatPacer
+from ..telegram_helper.status_ticker import StatusTicker
 from ..ext_utils.media_utils import (
     get_media_info,
     get_document_type,
+    invalidate_media_info,
     get_video_thumbnail,
     get_audio_thumbnail,
     get_multiple_frames_thumbnail,
@@ -70,10 +75,10 @@ class TelegramUploader:
         self._thumb = self._listener.thumb or f"thumbnails/{listener.user_id}.jpg"
         self._msgs_dict = {}
         self._corrupted = 0
-        self._is_corrupted = False
+        self._active_uploads = {False: 0, True: 0}
+        self._reply_msgs = {}
         self._media_dict = {"videos": {}, "documents": {}}
         self._last_msg_in_group = False
-        self._up_path = ""
         self._lprefix = ""
         self._media_group = False
         self._is_private = False
@@ -81,6 +86,8 @@ class TelegramUploader:
         self._user_session = self._listener.user_transmission
         self._error = ""
         self._user_dump = ""
+        self._parts_left = {}
+        self._dump_pending = {}
 
     async def get_custom_thumb(self, thumb):
         photo_dir = await download_image_url(thumb)
@@ -95,14 +102,14 @@ class TelegramUploader:
             return des_dir
         return None     
 
-    async def _upload_progress(self, current, _):
+    async def _upload_progress(self, current, _, state):
         if self._listener.is_cancelled:
-            if self._user_session:
+            if state["user_session"]:
                 TgClient.user.stop_transmission()
             else:
                 self._listener.client.stop_transmission()
-        chunk_size = current - self._last_uploaded
-        self._last_uploaded = current
+        chunk_size = current - state["last_uploaded"]
+        state["last_uploaded"] = current
         self._processed_bytes += chunk_size
 
     async def _user_settings(self):
@@ -163,13 +170,11 @@ class TelegramUploader:
             self._sent_msg = self._listener.message
         return True
 
-    async def _prepare_file(self, file_, dirpath):
+    async def _prepare_file(self, file_, dirpath, state):
         if self._lprefix:
             cap_mono = f"{self._lprefix} <b>{file_}</b>"
             self._lprefix = re_sub("<.*?>", "", self._lprefix)
-            new_path = ospath.join(dirpath, f"{self._lprefix} {file_}")
-            await rename(self._up_path, new_path)
-            self._up_path = new_path
+            await self._rename_upload(state, dirpath, f"{self._lprefix} {file_}")
         else:
             cap_mono = f"<b>{file_}</b>"
         if len(file_) > 60:
@@ -188,11 +193,17 @@ class TelegramUploader:
             extn = len(ext)
             remain = 60 - extn
             name = name[:remain]
-            new_path = ospath.join(dirpath, f"{name}{ext}")
-            await rename(self._up_path, new_path)
-            self._up_path = new_path
+            await self._rename_upload(state, dirpath, f"{name}{ext}")
         return cap_mono
 
+    async def _rename_upload(self, state, dirpath, name):
+        if part := state["part"]:
+            part.name = name
+            return
+        new_path = ospath.join(dirpath, name)
+        await rename(state["up_path"], new_path)
+        state["up_path"] = new_path
+
     def _get_input_media(self, subkey, key):
         rlist = []
         for msg in self._media_dict[key][subkey]:
@@ -223,21 +234,30 @@ class TelegramUploader:
             )[-1]
 
     async def _send_media_group(self, subkey, key, msgs):
-        for index, msg in enumerate(msgs):
-            if self._listener.hybrid_leech or not self._user_session:
-                msgs[index] = await self._listener.client.get_messages(
-                    chat_id=msg[0], message_ids=msg[1]
-                )
-            else:
-                msgs[index] = await TgClient.user.get_messages(
-                    chat_id=msg[0], message_ids=msg[1]
-                )
-        msgs_list = await msgs[0].reply_to_message.reply_media_group(
-            media=self._get_input_media(subkey, key),
-            quote=True,
-            disable_notification=True,
+        user_session = not (
+            self._listener.hybrid_leech or not self._listener.user_transmission
+        )
+        client = TgClient.user if user_session else self._listener.client
+        messages = await client.get_messages(
+            chat_id=msgs[0][0], message_ids=[msg[1] for msg in msgs]
         )
-        for msg in msgs:
+        reply_to = messages[0].reply_to_message
+        retries = 3
+        for attempt in range(retries):
+            await ChatPacer.wait(user_session, reply_to.chat.id)
+            try:
+                msgs_list = await reply_to.reply_media_group(
+                    media=self._get_input_media(subkey, key),
+                    quote=True,
+                    disable_notification=True,
+                )
+                break
+            except FloodWait as f:
+                LOGGER.warning(str(f))
+                ChatPacer.on_flood(user_session, reply_to.chat.id, f.value)
+                if attempt == retries - 1:
+                    raise
+        for msg in messages:
             if msg.link in self._msgs_dict:
                 del self._msgs_dict[msg.link]
             await delete_message(msg)
@@ -246,116 +266,42 @@ class TelegramUploader:
             for m in msgs_list:
                 self._msgs_dict[m.link] = m.caption
         self._sent_msg = msgs_list[-1]
+        if pending := self._dump_pending.pop((key, subkey), None):
+            cpy_msgs = await self._copy_group(msgs_list)
+            for index, (file_, _, imgbb_thumb) in enumerate(pending):
+                cpy_msg = cpy_msgs[index] if index < len(cpy_msgs) else None
+                await self._finish_dump(file_, cpy_msg, imgbb_thumb)
+
+    async def _get_reply_msg(self, user_session):
+        if user_session not in self._reply_msgs:
+            client = TgClient.user if user_session else self._listener.client
+            self._reply_msgs[user_session] = await client.get_messages(
+                chat_id=self._sent_msg.chat.id,
+                message_ids=self._sent_msg.id,
+            )
+        return self._reply_msgs[user_session]
+
+    def _pick_session(self, f_size):
+        if not (self._listener.hybrid_leech and self._listener.user_transmission):
+            return self._listener.user_transmission
+        if f_size > 2097152000:
+            return True
+        return self._active_uploads[True] < self._active_uploads[False]
 
-    async def upload(self):
+    async def upload(self, feed=None):
         await self._user_settings()
         res = await self._msg_to_reply()
         if not res:
             return
-        for dirpath, _, files in natsorted(await sync_to_async(walk, self._path)):
-            if dirpath.strip().endswith("/yt-dlp-thumb"):
-                continue
-            if dirpath.strip().endswith("_mltbss"):
-                await self._send_screenshots(dirpath, files)
-                await rmtree(dirpath, ignore_errors=True)
-                continue
-            for file_ in natsorted(files):
-                self._error = ""
-                self._up_path = f_path = ospath.join(dirpath, file_)
-                if not await aiopath.exists(self._up_path):
-                    if intervals["stopAll"]:
-                        return
-                    LOGGER.error(f"{self._up_path} not exists! Continue uploading!")
-                    continue
-
-                # --- Check if file name exists in DB ---
-                if db is not None:
-                    no_ext = await remove_extension(re.sub(r"[',]", "", file_.replace("&", "and")))
-                    existing = await files_col.find_one({"file_name": no_ext})
-                    if existing:
-                        LOGGER.info(
-                            f"File '{file_}' already exists in DB. Proceeding with imgbb upload."
-                        )
-                        if 'poster_delete_url' in existing:
-                            poster_url = existing['poster_delete_url']
-                            await self._sent_msg.reply_text(
-                                f"An old ImgBB poster for this file was found. Please delete it manually: {poster_url}",
-                                disable_web_page_preview=True,
-                            )
-                        if self._listener.user_dict.get("IMGBB_UPLOAD") and self._listener.thumbnail_layout:
-                            imgbb_thumb = await get_multiple_frames_thumbnail(
-                                self._up_path,
-                                self._listener.thumbnail_layout,
-                                self._listener.screen_shots,
-                            )
-                        else:
-                            imgbb_thumb = await get_video_thumbnail(self._up_path, None)
-                        await self._upload_to_imgbb(imgbb_thumb, file_, existing)
-                        await self.cancel_task()
-                        return
-                # --- End check ---
-
-                try:
-                    f_size = await aiopath.getsize(self._up_path)
-                    self._total_files += 1
-                    if f_size == 0:
-                        LOGGER.error(
-                            f"{self._up_path} size is zero, telegram don't upload zero size files"
-                        )
-                        self._corrupted += 1
-                        continue
-                    if self._listener.is_cancelled:
-                        return
-                    cap_mono = await self._prepare_file(file_, dirpath)
-                    if self._last_msg_in_group:
-                        group_lists = [
-                            x for v in self._media_dict.values() for x in v.keys()
-                        ]
-                        match = re_match(r".+(?=\.0*\d+$)|.+(?=\.part\d+\..+$)", f_path)
-                        if not match or match and match.group(0) not in group_lists:
-                            for key, value in list(self._media_dict.items()):
-                                for subkey, msgs in list(value.items()):
-                                    if len(msgs) > 1:
-                                        await self._send_media_group(subkey, key, msgs)
-                    if self._listener.hybrid_leech and self._listener.user_transmission:
-                        self._user_session = f_size > 2097152000
-                        if self._user_session:
-                            self._sent_msg = await TgClient.user.get_messages(
-                                chat_id=self._sent_msg.chat.id,
-                                message_ids=self._sent_msg.id,
-                            )
-                        else:
-                            self._sent_msg = await self._listener.client.get_messages(
-                                chat_id=self._sent_msg.chat.id,
-                                message_ids=self._sent_msg.id,
-                            )
-                    self._last_msg_in_group = False
-                    self._last_uploaded = 0
-                    await self._upload_file(cap_mono, file_, f_path)
-                    if self._listener.is_cancelled:
-                        return
-                    if (
-                        not self._is_corrupted
-                        and (self._listener.is_super_chat or self._listener.up_dest)
-                        and not self._is_private
-                    ):
-                        self._msgs_dict[self._sent_msg.link] = file_
-                    await sleep(1)
-                except Exception as err:
-                    if isinstance(err, RetryError):
-                        LOGGER.info(
-                            f"Total Attempts: {err.last_attempt.attempt_number}"
-                        )
-                        err = err.last_attempt.exception()
-                    LOGGER.error(f"{err}. Path: {self._up_path}")
-                    self._error = str(err)
-                    self._corrupted += 1
-                    if self._listener.is_cancelled:
-                        return
-                if not self._listener.is_cancelled and await aiopath.exists(
-                    self._up_path
-                ):
-                    await remove(self._up_path)
+        if feed is None:
+            feed = Queue()
+            for dirpath, _, files_ in natsorted(await sync_to_async(walk, self._path)):
+                feed.put_nowait((dirpath, files_))
+            feed.put_nowait(None)
+        self._reply_msgs = {self._user_session: self._sent_msg}
+        await self._upload_files(feed)
+        if intervals["stopAll"]:
+            return
         for key, value in list(self._media_dict.items()):
             for subkey, msgs in list(value.items()):
                 if len(msgs) > 1:
@@ -365,6 +311,13 @@ class TelegramUploader:
                         LOGGER.info(
                             f"While sending media group at the end of task. Error: {e}"
                         )
+        for pending in list(self._dump_pending.values()):
+            for file_, sent_msg, imgbb_thumb in pending:
+                cpy_msg = None
+                if not self._listener.is_cancelled:
+                    cpy_msg = await self._copy_message(sent_msg)
+                await self._finish_dump(file_, cpy_msg, imgbb_thumb)
+        self._dump_pending.clear()
         if self._listener.is_cancelled:
             return
         if self._total_files == 0:
@@ -383,12 +336,262 @@ class TelegramUploader:
         )
         return
 
+    async def _upload_files(self, feed):
+        items = Queue()
+        results = {}
+        done = {}
+        total = None
+
+        def _done(index):
+            return done.setdefault(index, Event())
+
+        async def _dispatcher():
+            nonlocal total
+            count = 0
+            try:
+                while (entry := await feed.get()) is not None:
+                    dirpath, files_ = entry
+                    if dirpath.strip().endswith("/yt-dlp-thumb"):
+                        continue
+                    if dirpath.strip().endswith("_mltbss"):
+                        if not self._listener.is_cancelled:
+                            await self._send_screenshots(dirpath, files_)
+                            self._reply_msgs[self._user_session] = self._sent_msg
+                        await rmtree(dirpath, ignore_errors=True)
+                        continue
+                    for file_ in natsorted(files_):
+                        f_path = ospath.join(dirpath, file_)
+                        if split := self._listener.virtual_splits.get(f_path):
+                            parts = get_file_parts(f_path, *split)
+                            self._parts_left[f_path] = len(parts)
+                            for part in parts:
+                                items.put_nowait((count, dirpath, part.name, part))
+                                count += 1
+                        else:
+                            items.put_nowait((count, dirpath, file_, None))
+                            count += 1
+            finally:
+                total = count
+                _done(count).set()
+                items.put_nowait(None)
+
+        async def _worker():
+            while (item := await items.get()) is not None:
+                index, dirpath, file_, part = item
+                job = None
+                try:
+                    if not self._listener.is_cancelled:
+                        job = await self._upload_one(dirpath, file_, part)
+                finally:
+                    results[index] = (job, part)
+                    _done(index).set()
+            items.put_nowait(None)
+
+        # Uploads finish in any order, but their messages are sent here in
+        # file order so the chat, captions and media groups stay deterministic.
+        async def _committer():
+            index = 0
+            while True:
+                await _done(index).wait()
+                if total is not None and index >= total:
+                    break
+                job, part = results.pop(index, (None, None))
+                try:
+                    if job is not None:
+                        result = await self._send_one(*job)
+                        if result is not None and not self._listener.is_cancelled:
+                            try:
+                                await self._commit_upload(*result)
+                            except Exception as e:
+                                LOGGER.error(f"{e}. Path: {result[1]}")
+                finally:
+                    if part is not None:
+                        part.close()
+                index += 1
+
+        workers = Config.LEECH_UPLOAD_WORKERS or 1
+        if self._listener.hybrid_leech and self._listener.user_transmission:
+            workers *= 2
+        tasks = [
+            create_task(_dispatcher()),
+            create_task(_committer()),
+            *(create_task(_worker()) for _ in range(workers)),
+        ]
+        try:
+            await gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await gather(*tasks, return_exceptions=True)
+            for _, part in results.values():
+                if part is not None:
+                    part.close()
+
+    async def _upload_one(self, dirpath, file_, part=None):
+        f_path = ospath.join(dirpath, file_)
+        state = {
+            "up_path": part.path if part else f_path,
+            "part": part,
+            "user_session": False,
+            "last_uploaded": 0,
+        }
+        if not await aiopath.exists(state["up_path"]):
+            if intervals["stopAll"]:
+                return None
+            LOGGER.error(f"{state['up_path']} not exists! Continue uploading!")
+            return None
+
+        # --- Check if file name exists in DB ---
+        if db is not None:
+            no_ext = await remove_extension(re.sub(r"[',]", "", file_.replace("&", "and")))
+            existing = await files_col.find_one({"file_name": no_ext})
+            if existing:
+                LOGGER.info(
+                    f"File '{file_}' already exists in DB. Proceeding with imgbb upload."
+                )
+                if 'poster_delete_url' in existing:
+                    poster_url = existing['poster_delete_url']
+                    await self._sent_msg.reply_text(
+                        f"An old ImgBB poster for this file was found. Please delete it manually: {poster_url}",
+                        disable_web_page_preview=True,
+                    )
+                if self._listener.user_dict.get("IMGBB_UPLOAD") and self._listener.thumbnail_layout:
+                    imgbb_thumb = await get_multiple_frames_thumbnail(
+                        state["up_path"],
+                        self._listener.thumbnail_layout,
+                        self._listener.screen_shots,
+                    )
+                else:
+                    imgbb_thumb = await get_video_thumbnail(state["up_path"], None)
+                await self._upload_to_imgbb(imgbb_thumb, file_, existing)
+                await self.cancel_task()
+                return None
+        # --- End check ---
+
+        try:
+            f_size = part.length if part else await aiopath.getsize(f_path)
+            self._total_files += 1
+            if f_size == 0:
+                LOGGER.error(
+                    f"{f_path} size is zero, telegram don't upload zero size files"
+                )
+                self._corrupted += 1
+                return None
+            if self._listener.is_cancelled:
+                return None
+            cap_mono = await self._prepare_file(file_, dirpath, state)
+            state["user_session"] = self._pick_session(f_size)
+            self._active_uploads[state["user_session"]] += 1
+            try:
+                state["reply_to"] = await self._get_reply_msg(state["user_session"])
+                try:
+                    await state["reply_to"]._client.preupload(
+                        part or state["up_path"],
+                        progress=self._upload_progress,
+                        progress_args=(state,),
+                    )
+                except FloodWait as f:
+                    # The send uploads the file again and handles the wait.
+                    LOGGER.warning(str(f))
+            finally:
+                self._active_uploads[state["user_session"]] -= 1
+            return cap_mono, file_, f_path, state
+        except Exception as err:
+            LOGGER.error(f"{err}. Path: {state['up_path']}")
+            self._error = str(err)
+            self._corrupted += 1
+            if self._listener.is_cancelled:
+                return None
+        return await self._finish_file(state, None)
+
+    async def _send_one(self, cap_mono, file_, f_path, state):
+        result = None
+        try:
+            if self._listener.is_cancelled:
+                return None
+            sent_msg, imgbb_thumb = await self._upload_file(
+                cap_mono, file_, f_path, state
+            )
+            if self._listener.is_cancelled or sent_msg is None:
+                if imgbb_thumb and await aiopath.exists(imgbb_thumb):
+                    await remove(imgbb_thumb)
+                return None
+            result = (file_, f_path, sent_msg, imgbb_thumb)
+        except Exception as err:
+            if isinstance(err, RetryError):
+                LOGGER.info(f"Total Attempts: {err.last_attempt.attempt_number}")
+                err = err.last_attempt.exception()
+            LOGGER.error(f"{err}. Path: {state['up_path']}")
+            self._error = str(err)
+            self._corrupted += 1
+            if self._listener.is_cancelled:
+                return None
+        finally:
+            state["reply_to"]._client.forget_preupload(
+                state["part"] or state["up_path"]
+            )
+        return await self._finish_file(state, result)
+
+    async def _finish_file(self, state, result):
+        if part := state["part"]:
+            self._parts_left[part.path] -= 1
+            if self._parts_left[part.path]:
+                return result
+        if not self._listener.is_cancelled and await aiopath.exists(state["up_path"]):
+            await remove(state["up_path"])
+        invalidate_media_info(state["up_path"])
+        return result
+
+    async def _commit_upload(self, file_, o_path, sent_msg, imgbb_thumb):
+        if self._last_msg_in_group:
+            group_lists = [x for v in self._media_dict.values() for x in v.keys()]
+            match = re_match(r".+(?=\.0*\d+$)|.+(?=\.part\d+\..+$)", o_path)
+            if not match or match and match.group(0) not in group_lists:
+                for key, value in list(self._media_dict.items()):
+                    for subkey, msgs in list(value.items()):
+                        if len(msgs) > 1:
+                            await self._send_media_group(subkey, key, msgs)
+        self._last_msg_in_group = False
+        match = None
+        if self._media_group and (sent_msg.video or sent_msg.document):
+            key = "documents" if sent_msg.document else "videos"
+            match = re_match(r".+(?=\.0*\d+$)|.+(?=\.part\d+\..+$)", o_path)
+        if match and self._user_dump:
+            self._dump_pending.setdefault((key, match.group(0)), []).append(
+                (file_, sent_msg, imgbb_thumb)
+            )
+        else:
+            cpy_msg = None
+            if not self._listener.is_cancelled:
+                cpy_msg = await self._copy_message(sent_msg)
+            await self._finish_dump(file_, cpy_msg, imgbb_thumb)
+        if self._listener.is_cancelled:
+            return
+        if (
+            self._listener.is_super_chat or self._listener.up_dest
+        ) and not self._is_private:
+            self._msgs_dict[sent_msg.link] = file_
+        if match:
+            pname = match.group(0)
+            if pname in self._media_dict[key].keys():
+                self._media_dict[key][pname].append([sent_msg.chat.id, sent_msg.id])
+            else:
+                self._media_dict[key][pname] = [[sent_msg.chat.id, sent_msg.id]]
+            msgs = self._media_dict[key][pname]
+            if len(msgs) == 10:
+                await self._send_media_group(pname, key, msgs)
+            else:
+                self._last_msg_in_group = True
+
     @retry(
         wait=wait_exponential(multiplier=2, min=4, max=8),
         stop=stop_after_attempt(3),
-        retry=retry_if_exception_type(Exception),
+        retry=retry_if_exception_type(Exception)
+        & retry_if_not_exception_type(FloodWait),
     )
-    async def _upload_file(self, cap_mono, file, o_path, force_document=False):
+    async def _upload_file(
+        self, cap_mono, file, o_path, state, force_document=False, floods=0
+    ):
         if (
             self._thumb is not None
             and not await aiopath.exists(self._thumb)
@@ -396,11 +599,13 @@ class TelegramUploader:
         ):
             self._thumb = None
         thumb = self._thumb
-        self._is_corrupted = False
+        up_path = state["up_path"]
+        part = state["part"]
+        reply_to = state["reply_to"]
+        imgbb_thumb = None
         try:
-            imgbb_thumb = None
             tmdb_poster_url = None
-            is_video, is_audio, is_image = await get_document_type(self._up_path)
+            is_video, is_audio, is_image = await get_document_type(up_path)
 
             if not is_image and thumb is None:
                 file_name = ospath.splitext(file)[0]
@@ -410,17 +615,17 @@ class TelegramUploader:
                 elif await aiopath.isfile(thumb_path.replace("/yt-dlp-thumb", "")):
                     thumb = thumb_path.replace("/yt-dlp-thumb", "")
                 elif is_audio and not is_video:
-                    thumb = await get_audio_thumbnail(self._up_path)
+                    thumb = await get_audio_thumbnail(up_path)
                     
-            if db is not None and is_video:
+            if db is not None and is_video and not part:
                 if self._listener.user_dict.get("IMGBB_UPLOAD") and self._listener.thumbnail_layout:
                     imgbb_thumb = await get_multiple_frames_thumbnail(
-                        self._up_path,
+                        up_path,
                         self._listener.thumbnail_layout,
                         self._listener.screen_shots,
                     )
                 else:
-                    imgbb_thumb = await get_video_thumbnail(self._up_path, None)
+                    imgbb_thumb = await get_video_thumbnail(up_path, None)
 
             if Config.TMDB_API_KEY and is_video:
                 title = remove_redandent(ospath.splitext(file)[0])
@@ -437,10 +642,12 @@ class TelegramUploader:
                     tmdb_poster_url = await get_tv_poster(title, year)
                 else:
                     tmdb_poster_url = await get_movie_poster(title, year)
-                
+
+            await ChatPacer.wait(state["user_session"], reply_to.chat.id)
             if (
                 self._listener.as_doc
                 or force_document
+                or part
                 or (not is_video and not is_audio and not is_image)
             ):
                 key = "documents"
@@ -449,24 +656,25 @@ class TelegramUploader:
                     LOGGER.info("Got the poster")
 
                 if is_video and thumb is None:
-                    thumb = await get_video_thumbnail(self._up_path, None)
+                    thumb = await get_video_thumbnail(up_path, None)
 
                 if self._listener.is_cancelled:
-                    return
+                    return None, imgbb_thumb
                 if thumb == "none":
                     thumb = None
-                self._sent_msg = await self._sent_msg.reply_document(
-                    document=self._up_path,
+                sent_msg = await reply_to.reply_document(
+                    document=part or up_path,
                     quote=True,
                     thumb=thumb,
                     caption=cap_mono,
                     force_document=True,
                     disable_notification=True,
                     progress=self._upload_progress,
+                    progress_args=(state,),
                 )
             elif is_video:
                 key = "videos"
-                duration = (await get_media_info(self._up_path))[0]
+                duration = (await get_media_info(up_path))[0]
 
                 if tmdb_poster_url and thumb is None:
                     thumb =  await self.get_custom_thumb(tmdb_poster_url)
@@ -474,13 +682,13 @@ class TelegramUploader:
 
                 if thumb is None and self._listener.thumbnail_layout:
                     thumb = await get_multiple_frames_thumbnail(
-                        self._up_path,
+                        up_path,
                         self._listener.thumbnail_layout,
                         self._listener.screen_shots,
                     )
 
                 if thumb is None:
-                    thumb = await get_video_thumbnail(self._up_path, duration)
+                    thumb = await get_video_thumbnail(up_path, duration)
 
                 if thumb is not None and thumb != "none":
                     with Image.open(thumb) as img:
@@ -489,11 +697,11 @@ class TelegramUploader:
                     width = 480
                     height = 320
                 if self._listener.is_cancelled:
-                    return
+                    return None, imgbb_thumb
                 if thumb == "none":
                     thumb = None
-                self._sent_msg = await self._sent_msg.reply_video(
-                    video=self._up_path,
+                sent_msg = await reply_to.reply_video(
+                    video=up_path,
                     quote=True,
                     caption=cap_mono,
                     duration=duration,
@@ -503,16 +711,17 @@ class TelegramUploader:
                     supports_streaming=True,
                     disable_notification=True,
                     progress=self._upload_progress,
+                    progress_args=(state,),
                 )
             elif is_audio:
                 key = "audios"
-                duration, artist, title = await get_media_info(self._up_path)
+                duration, artist, title = await get_media_info(up_path)
                 if self._listener.is_cancelled:
-                    return
+                    return None, imgbb_thumb
                 if thumb == "none":
                     thumb = None
-                self._sent_msg = await self._sent_msg.reply_audio(
-                    audio=self._up_path,
+                sent_msg = await reply_to.reply_audio(
+                    audio=up_path,
                     quote=True,
                     caption=cap_mono,
                     duration=duration,
@@ -521,62 +730,52 @@ class TelegramUploader:
                     thumb=thumb,
                     disable_notification=True,
                     progress=self._upload_progress,
+                    progress_args=(state,),
                 )
             else:
                 key = "photos"
                 if self._listener.is_cancelled:
-                    return
-                self._sent_msg = await self._sent_msg.reply_photo(
-                    photo=self._up_path,
+                    return None, imgbb_thumb
+                sent_msg = await reply_to.reply_photo(
+                    photo=up_path,
                     quote=True,
                     caption=cap_mono,
                     disable_notification=True,
                     progress=self._upload_progress,
+                    progress_args=(state,),
                 )
 
-            cpy_msg = await self._copy_message()
-
-            if imgbb_thumb:
-                await self._upload_to_imgbb(imgbb_thumb, file, cpy_msg)
-
-            if (
-                not self._listener.is_cancelled
-                and self._media_group
-                and (self._sent_msg.video or self._sent_msg.document)
-            ):
-                key = "documents" if self._sent_msg.document else "videos"
-                if match := re_match(r".+(?=\.0*\d+$)|.+(?=\.part\d+\..+$)", o_path):
-                    pname = match.group(0)
-                    if pname in self._media_dict[key].keys():
-                        self._media_dict[key][pname].append(
-                            [self._sent_msg.chat.id, self._sent_msg.id]
-                        )
-                    else:
-                        self._media_dict[key][pname] = [
-                            [self._sent_msg.chat.id, self._sent_msg.id]
-                        ]
-                    msgs = self._media_dict[key][pname]
-                    if len(msgs) == 10:
-                        await self._send_media_group(pname, key, msgs)
-                    else:
-                        self._last_msg_in_group = True
-
+            if key != "photos":
+                await UploadResume.finish(
+                    reply_to._client,
+                    part.name if part else ospath.basename(up_path),
+                    part.length if part else await aiopath.getsize(up_path),
+                )
             if (
                 self._thumb is None
                 and thumb is not None
                 and await aiopath.exists(thumb)
             ):
                 await remove(thumb)
+            return sent_msg, imgbb_thumb
         except (FloodWait) as f:
             LOGGER.warning(str(f))
-            await sleep(f.value * 1.3)
+            StatusTicker.hold(f.value * 1.3)
+            ChatPacer.on_flood(state["user_session"], reply_to.chat.id, f.value * 1.3)
             if (
                 self._thumb is None
                 and thumb is not None
                 and await aiopath.exists(thumb)
             ):
                 await remove(thumb)
-            return await self._upload_file(cap_mono, file, o_path)
+            if imgbb_thumb and await aiopath.exists(imgbb_thumb):
+                await remove(imgbb_thumb)
+            if floods + 1 >= 3:
+                raise
+            await sleep(f.value * 1.3)
+            return await self._upload_file(
+                cap_mono, file, o_path, state, force_document, floods + 1
+            )
         except Exception as err:
             if (
                 self._thumb is None
@@ -584,15 +783,16 @@ class TelegramUploader:
                 and await aiopath.exists(thumb)
             ):
                 await remove(thumb)
+            if imgbb_thumb and await aiopath.exists(imgbb_thumb):
+                await remove(imgbb_thumb)
             err_type = "RPCError: " if isinstance(err, RPCError) else ""
-            LOGGER.error(f"{err_type}{err}. Path: {self._up_path}")
+            LOGGER.error(f"{err_type}{err}. Path: {up_path}")
             if isinstance(err, BadRequest) and key != "documents":
-                LOGGER.error(f"Retrying As Document. Path: {self._up_path}")
-                return await self._upload_file(cap_mono, file, o_path, True)
+                LOGGER.error(f"Retrying As Document. Path: {up_path}")
+                return await self._upload_file(
+                    cap_mono, file, o_path, state, True, floods
+                )
             raise err
-        finally:
-            if imgbb_thumb and await aiopath.exists(imgbb_thumb):
-                await remove(imgbb_thumb)
 
 
     async def _upload_to_imgbb(self, imgbb_thumb, file, cpy_msg):
@@ -632,21 +832,68 @@ class TelegramUploader:
             await self.cancel_task()
             await self._sent_msg.reply_text(f"Error uploading to imgbb or MongoDB: {e}")
 
-    async def _copy_message(self):
-        await sleep(1)
+    async def _finish_dump(self, file_, cpy_msg, imgbb_thumb):
+        try:
+            if imgbb_thumb and not self._listener.is_cancelled:
+                await self._upload_to_imgbb(imgbb_thumb, file_, cpy_msg)
+        finally:
+            if imgbb_thumb and await aiopath.exists(imgbb_thumb):
+                await remove(imgbb_thumb)
 
+    @staticmethod
+    def _is_dump_media(msg):
+        return bool(
+            msg
+            and msg.document
+            and (
+                msg.document.mime_type.startswith("video/")
+                or msg.document.file_name.lower().endswith(".srt")
+            )
+        )
+
+    async def _copy_group(self, msgs_list):
+        if not self._user_dump:
+            return []
+        target = int(self._user_dump)
+        try:
+            msgs = await TgClient.bot.get_messages(
+                msgs_list[0].chat.id, [m.id for m in msgs_list]
+            )
+        except Exception as e:
+            LOGGER.error(f"Failed to fetch media group for dump copy: {e}")
+            return []
+        if not all(self._is_dump_media(msg) for msg in msgs):
+            return [await self._copy_message(msg) for msg in msgs]
+        for _ in range(3):
+            await ChatPacer.wait(False, target)
+            try:
+                return await TgClient.bot.copy_media_group(
+                    target, msgs[0].chat.id, msgs[0].id
+                )
+            except FloodWait as f:
+                LOGGER.warning(str(f))
+                ChatPacer.on_flood(False, target, f.value)
+            except Exception as e:
+                LOGGER.error(f"Failed to copy media group to dump: {e}")
+                break
+        return [await self._copy_message(msg) for msg in msgs]
+
+    async def _copy_message(self, sent_msg):
         async def _copy(target, retries=3):
             cpy_msg = None
             for attempt in range(retries):
                 try:
                     msg = await TgClient.bot.get_messages(
-                        self._sent_msg.chat.id,
-                        self._sent_msg.id,
+                        sent_msg.chat.id,
+                        sent_msg.id,
                     )
-                    if msg and (msg.document.mime_type.startswith("video/") 
-                                or msg.document.file_name.lower().endswith(".srt")):
+                    if self._is_dump_media(msg):
+                        await ChatPacer.wait(False, target)
                         cpy_msg = await msg.copy(target)
                     return cpy_msg
+                except FloodWait as f:
+                    LOGGER.warning(str(f))
+                    ChatPacer.on_flood(False, target, f.value)
                 except Exception as e:
                     LOGGER.error(f"Attempt {attempt + 1} failed: {e} {msg.id}")
                     if attempt < retries - 1:
@@ -673,4 +920,12 @@ class TelegramUploader:
     async def cancel_task(self):
         self._listener.is_cancelled = True
         LOGGER.info(f"Cancelling Upload: {self._listener.name}")
+        if (
+            self._listener.subproc is not None
+            and self._listener.subproc.returncode is None
+        ):
+            try:
+                self._listener.subproc.kill()
+            except:
+                pass
         await self._listener.on_upload_error("your upload has been stopped!")
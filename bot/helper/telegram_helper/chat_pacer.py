@@ -0,0 +1,80 @@
+from asyncio import sleep
+from time import time
+
+
+class _Bucket:
+    def __init__(self, rate, burst, slow_rate):
+        self.base = rate
+        self.rate = rate
+        self.burst = burst
+        self.slow_rate = slow_rate
+        self.tokens = burst
+        self.refilled = time()
+        self.held_until = 0
+        self.flooded_at = 0
+
+    def delay(self):
+        now = time()
+        if self.rate < self.base and now - self.flooded_at > ChatPacer.RECOVER_AFTER:
+            self.rate = min(self.base, self.rate * 2)
+            self.flooded_at = now
+        if now < self.held_until:
+            self.refilled = now
+            return self.held_until - now
+        # No bursts while slowed down after a FloodWait.
+        burst = self.burst if self.rate >= self.base else 1
+        self.tokens = min(burst, self.tokens + (now - self.refilled) * self.rate)
+        self.refilled = now
+        if self.tokens >= 1:
+            return 0
+        return (1 - self.tokens) / self.rate
+
+
+# Token buckets per session and per destination chat. Sends wait for both.
+# Chats start at the session rate; a FloodWait drops the chat that raised it
+# to Telegram's per-chat limit (halving again on repeats) until it has gone a
+# while without being throttled. Idle buckets are forgotten after BUCKET_TTL.
+class ChatPacer:
+    SESSION_RATE = 20
+    PRIVATE_RATE = 1
+    GROUP_RATE = 20 / 60
+    MIN_RATE = 1 / 30
+    RECOVER_AFTER = 60
+    BUCKET_TTL = 600
+    _buckets = {}
+
+    @classmethod
+    def _prune(cls):
+        now = time()
+        for key, bucket in list(cls._buckets.items()):
+            if now - bucket.refilled > cls.BUCKET_TTL and now > bucket.held_until:
+                del cls._buckets[key]
+
+    @classmethod
+    def _bucket(cls, user_session, chat_id=None):
+        key = (user_session, chat_id)
+        if key not in cls._buckets:
+            cls._prune()
+            if chat_id is None:
+                slow_rate = cls.SESSION_RATE
+            elif int(chat_id) < 0:
+                slow_rate = cls.GROUP_RATE
+            else:
+                slow_rate = cls.PRIVATE_RATE
+            cls._buckets[key] = _Bucket(cls.SESSION_RATE, cls.SESSION_RATE, slow_rate)
+        return cls._buckets[key]
+
+    @classmethod
+    async def wait(cls, user_session, chat_id):
+        for bucket in (cls._bucket(user_session), cls._bucket(user_session, chat_id)):
+            while (delay := bucket.delay()) > 0:
+                await sleep(delay)
+            bucket.tokens -= 1
+
+    @classmethod
+    def on_flood(cls, user_session, chat_id, seconds):
+        bucket = cls._bucket(user_session, chat_id)
+        bucket.held_until = max(bucket.held_until, time() + seconds)
+        bucket.rate = max(cls.MIN_RATE, min(bucket.slow_rate, bucket.rate / 2))
+        bucket.tokens = 0
+        bucket.flooded_at = time()
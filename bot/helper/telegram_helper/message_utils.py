@@ -6,7 +6,7 @@ from time import time
 from ... import LOGGER, status_dict, task_dict_lock, intervals, DOWNLOAD_DIR
 from ...core.config_manager import Config
 from ...core.telegram_manager import TgClient
-from ..ext_utils.bot_utils import SetInterval
+from .status_ticker import StatusTicker
 from ..ext_utils.exceptions import TgLinkException
 from ..ext_utils.status_utils import get_readable_message
 
@@ -39,6 +39,7 @@ async def edit_message(message, text, buttons=None, block=True):
     except FloodWait as f:
         LOGGER.warning(str(f))
         if not block:
+            StatusTicker.on_flood(message.chat.id, f.value)
             return str(f)
         await sleep(f.value * 1.2)
         return await edit_message(message, text, buttons)
@@ -96,12 +97,13 @@ async def auto_delete_message(cmd_message=None, bot_message=None):
 
 async def delete_status():
     async with task_dict_lock:
-        for key, data in list(status_dict.items()):
-            try:
-                await delete_message(data["message"])
-                del status_dict[key]
-            except Exception as e:
-                LOGGER.error(str(e))
+        messages = [data["message"] for data in status_dict.values()]
+        status_dict.clear()
+    for message in messages:
+        try:
+            await delete_message(message)
+        except Exception as e:
+            LOGGER.error(str(e))
 
 
 async def get_tg_link_message(link):
@@ -177,14 +179,22 @@ async def temp_download(msg):
     return await msg.download(file_name=f"{path}/")
 
 
+def _drop_status(sid, message=None):
+    if sid in status_dict and (
+        message is None or status_dict[sid]["message"] is message
+    ):
+        del status_dict[sid]
+    if obj := intervals["status"].get(sid):
+        obj.cancel()
+        del intervals["status"][sid]
+
+
 async def update_status_message(sid, force=False):
     if intervals["stopAll"]:
         return
     async with task_dict_lock:
         if not status_dict.get(sid):
-            if obj := intervals["status"].get(sid):
-                obj.cancel()
-                del intervals["status"][sid]
+            _drop_status(sid)
             return
         if not force and time() - status_dict[sid]["time"] < 3:
             return
@@ -193,32 +203,33 @@ async def update_status_message(sid, force=False):
         status = status_dict[sid]["status"]
         is_user = status_dict[sid]["is_user"]
         page_step = status_dict[sid]["page_step"]
-        text, buttons = await get_readable_message(
-            sid, is_user, page_no, status, page_step
-        )
-        if text is None:
-            del status_dict[sid]
-            if obj := intervals["status"].get(sid):
-                obj.cancel()
-                del intervals["status"][sid]
+        old_message = status_dict[sid]["message"]
+        text_hash = status_dict[sid].get("hash")
+    text, buttons = await get_readable_message(
+        sid, is_user, page_no, status, page_step
+    )
+    if text is None:
+        async with task_dict_lock:
+            _drop_status(sid, old_message)
+        return
+    if hash(text) != text_hash:
+        if not force and not StatusTicker.take():
             return
-        if text != status_dict[sid]["message"].text:
-            message = await edit_message(
-                status_dict[sid]["message"], text, buttons, block=False
-            )
-            if isinstance(message, str):
-                if message.startswith("Telegram says: [40"):
-                    del status_dict[sid]
-                    if obj := intervals["status"].get(sid):
-                        obj.cancel()
-                        del intervals["status"][sid]
-                else:
-                    LOGGER.error(
-                        f"Status with id: {sid} haven't been updated. Error: {message}"
-                    )
-                return
-            status_dict[sid]["message"].text = text
-            status_dict[sid]["time"] = time()
+        message = await edit_message(old_message, text, buttons, block=False)
+        if isinstance(message, str):
+            if message.startswith("Telegram says: [40"):
+                async with task_dict_lock:
+                    _drop_status(sid, old_message)
+            else:
+                LOGGER.error(
+                    f"Status with id: {sid} haven't been updated. Error: {message}"
+                )
+            return
+        StatusTicker.on_edit(sid)
+        async with task_dict_lock:
+            if sid in status_dict and status_dict[sid]["message"] is old_message:
+                status_dict[sid]["hash"] = hash(text)
+                status_dict[sid]["time"] = time()
 
 
 async def send_status_message(msg, user_id=0):
@@ -231,38 +242,30 @@ async def send_status_message(msg, user_id=0):
             page_no = status_dict[sid]["page_no"]
             status = status_dict[sid]["status"]
             page_step = status_dict[sid]["page_step"]
-            text, buttons = await get_readable_message(
-                sid, is_user, page_no, status, page_step
-            )
-            if text is None:
-                del status_dict[sid]
-                if obj := intervals["status"].get(sid):
-                    obj.cancel()
-                    del intervals["status"][sid]
-                return
+        else:
+            page_no, status, page_step = 1, "All", 1
+    text, buttons = await get_readable_message(
+        sid, is_user, page_no, status, page_step
+    )
+    if text is None:
+        async with task_dict_lock:
+            _drop_status(sid)
+        return
+    message = await send_message(msg, text, buttons, block=False)
+    if isinstance(message, str):
+        LOGGER.error(f"Status with id: {sid} haven't been sent. Error: {message}")
+        return
+    old_message = None
+    async with task_dict_lock:
+        if sid in status_dict:
             old_message = status_dict[sid]["message"]
-            message = await send_message(msg, text, buttons, block=False)
-            if isinstance(message, str):
-                LOGGER.error(
-                    f"Status with id: {sid} haven't been sent. Error: {message}"
-                )
-                return
-            await delete_message(old_message)
-            message.text = text
-            status_dict[sid].update({"message": message, "time": time()})
+            status_dict[sid].update(
+                {"message": message, "hash": hash(text), "time": time()}
+            )
         else:
-            text, buttons = await get_readable_message(sid, is_user)
-            if text is None:
-                return
-            message = await send_message(msg, text, buttons, block=False)
-            if isinstance(message, str):
-                LOGGER.error(
-                    f"Status with id: {sid} haven't been sent. Error: {message}"
-                )
-                return
-            message.text = text
             status_dict[sid] = {
                 "message": message,
+                "hash": hash(text),
                 "time": time(),
                 "page_no": 1,
                 "page_step": 1,
@@ -270,6 +273,8 @@ async def send_status_message(msg, user_id=0):
                 "is_user": is_user,
             }
         if not intervals["status"].get(sid) and not is_user:
-            intervals["status"][sid] = SetInterval(
+            intervals["status"][sid] = StatusTicker(
                 Config.STATUS_UPDATE_INTERVAL, update_status_message, sid
             )
+    if old_message is not None:
+        await delete_message(old_message)
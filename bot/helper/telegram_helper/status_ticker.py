@@ -0,0 +1,85 @@
+from asyncio import sleep
+from time import time
+
+from ... import LOGGER, bot_loop
+
+
+# One ticker drives every live status message. Edits share a bot-wide budget,
+# back off per chat after FloodWait and pause entirely while uploads are
+# being rate limited.
+class StatusTicker:
+    EDITS_PER_MINUTE = 60
+    MAX_INTERVAL = 120
+    _chats = {}
+    _runner = None
+    _tokens = EDITS_PER_MINUTE / 60
+    _refilled = 0
+    _held_until = 0
+
+    def __init__(self, interval, action, sid):
+        self.interval = interval
+        self.current = interval
+        self.action = action
+        self.sid = sid
+        self.due = time() + interval
+        StatusTicker._chats[sid] = self
+        StatusTicker._start()
+
+    def cancel(self):
+        if StatusTicker._chats.get(self.sid) is self:
+            del StatusTicker._chats[self.sid]
+
+    @classmethod
+    def _start(cls):
+        if cls._runner is None or cls._runner.done():
+            cls._refilled = time()
+            cls._runner = bot_loop.create_task(cls._run())
+
+    @classmethod
+    async def _run(cls):
+        while cls._chats:
+            await sleep(1)
+            now = time()
+            if now < cls._held_until:
+                continue
+            for chat in sorted(cls._chats.values(), key=lambda c: c.due):
+                if chat.due > now:
+                    break
+                chat.due = now + chat.current
+                try:
+                    await chat.action(chat.sid)
+                except Exception as e:
+                    LOGGER.error(f"Status ticker error for {chat.sid}: {e}")
+                if time() < cls._held_until:
+                    break
+
+    @classmethod
+    def take(cls):
+        now = time()
+        rate = cls.EDITS_PER_MINUTE / 60
+        cls._tokens = min(
+            cls.EDITS_PER_MINUTE / 6, cls._tokens + (now - cls._refilled) * rate
+        )
+        cls._refilled = now
+        if now < cls._held_until or cls._tokens < 1:
+            return False
+        cls._tokens -= 1
+        return True
+
+    @classmethod
+    def hold(cls, seconds):
+        cls._held_until = max(cls._held_until, time() + seconds)
+
+    @classmethod
+    def on_flood(cls, sid, seconds):
+        cls.hold(seconds)
+        if chat := cls._chats.get(sid):
+            chat.current = min(
+                cls.MAX_INTERVAL, max(chat.current * 2, seconds + chat.interval)
+            )
+            chat.due = time() + chat.current
+
+    @classmethod
+    def on_edit(cls, sid):
+        if chat := cls._chats.get(sid):
+            chat.current = max(chat.interval, chat.current - chat.interval)
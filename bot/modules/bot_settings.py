@@ -28,10 +28,7 @@ from .. import (
     auth_chats,
     sudo_users,
 )
-from ..helper.ext_utils.bot_utils import (
-    SetInterval,
-    new_task,
-)
+from ..helper.ext_utils.bot_utils import new_task
 from ..core.config_manager import Config
 from ..core.telegram_manager import TgClient
 from ..core.torrent_manager import TorrentManager
@@ -41,6 +38,7 @@ from ..core.jdownloader_booter import jdownloader
 from ..helper.ext_utils.task_manager import start_from_queued
 from ..helper.mirror_leech_utils.rclone_utils.serve import rclone_serve_booter
 from ..helper.telegram_helper.button_build import ButtonMaker
+from ..helper.telegram_helper.status_ticker import StatusTicker
 from ..helper.telegram_helper.message_utils import (
     send_message,
     send_file,
@@ -55,6 +53,10 @@ state = "view"
 handler_dict = {}
 DEFAULT_VALUES = {
     "LEECH_SPLIT_SIZE": TgClient.MAX_SPLIT_SIZE,
+    "LEECH_UPLOAD_WORKERS": 3,
+    "DIRECT_DOWNLOAD_WORKERS": 4,
+    "YT_DLP_WORKERS": 2,
+    "TG_DOWNLOAD_CONNECTIONS": 4,
     "RSS_DELAY": 600,
     "STATUS_UPDATE_INTERVAL": 15,
     "SEARCH_LIMIT": 0,
@@ -165,7 +167,7 @@ async def edit_variable(_, message, pre_message, key):
         if len(task_dict) != 0 and (st := intervals["status"]):
             for cid, intvl in list(st.items()):
                 intvl.cancel()
-                intervals["status"][cid] = SetInterval(
+                intervals["status"][cid] = StatusTicker(
                     value, update_status_message, cid
                 )
     elif key == "TORRENT_TIMEOUT":
@@ -229,7 +231,12 @@ async def edit_variable(_, message, pre_message, key):
     await update_buttons(pre_message, "var")
     await delete_message(message)
     await database.update_config({key: value})
-    if key in ["QUEUE_ALL", "QUEUE_DOWNLOAD", "QUEUE_UPLOAD"]:
+    if key in [
+        "QUEUE_ALL",
+        "QUEUE_DOWNLOAD",
+        "QUEUE_UPLOAD",
+        "QUEUE_USER_LIMIT",
+    ]:
         await start_from_queued()
     elif key in [
         "RCLONE_SERVE_URL",
@@ -427,7 +434,7 @@ async def edit_bot_settings(client, query):
             ):
                 for key, intvl in list(st.items()):
                     intvl.cancel()
-                    intervals["status"][key] = SetInterval(
+                    intervals["status"][key] = StatusTicker(
                         value, update_status_message, key
                     )
         elif data[2] == "RSS_SIZE_LIMIT":
@@ -474,7 +481,12 @@ async def edit_bot_settings(client, query):
         await database.update_config({data[2]: value})
         if data[2] in ["SEARCH_PLUGINS", "SEARCH_API_LINK"]:
             await initiate_search_tools()
-        elif data[2] in ["QUEUE_ALL", "QUEUE_DOWNLOAD", "QUEUE_UPLOAD"]:
+        elif data[2] in [
+            "QUEUE_ALL",
+            "QUEUE_DOWNLOAD",
+            "QUEUE_UPLOAD",
+            "QUEUE_USER_LIMIT",
+        ]:
             await start_from_queued()
         elif data[2] in [
             "RCLONE_SERVE_URL",
@@ -586,7 +598,7 @@ async def load_config():
     if len(task_dict) != 0 and (st := intervals["status"]):
         for key, intvl in list(st.items()):
             intvl.cancel()
-            intervals["status"][key] = SetInterval(
+            intervals["status"][key] = StatusTicker(
                 Config.STATUS_UPDATE_INTERVAL, update_status_message, key
             )
 
@@ -20,7 +20,7 @@ from ..helper.ext_utils.links_utils import (
 from ..helper.ext_utils.task_manager import stop_duplicate_check
 from ..helper.listeners.task_listener import TaskListener
 from ..helper.mirror_leech_utils.download_utils.direct_link_generator import (
-    direct_link_generator,
+    resolve_direct_link,
 )
 from ..helper.mirror_leech_utils.gdrive_utils.clone import GoogleDriveClone
 from ..helper.mirror_leech_utils.gdrive_utils.count import GoogleDriveCount
@@ -124,7 +124,7 @@ class Clone(TaskListener):
     async def _proceed_to_clone(self, sync):
         if is_share_link(self.link):
             try:
-                self.link = await sync_to_async(direct_link_generator, self.link)
+                self.link = await resolve_direct_link(self.link)
                 LOGGER.info(f"Generated link: {self.link}")
             except DirectDownloadLinkException as e:
                 LOGGER.error(str(e))
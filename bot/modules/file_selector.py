@@ -74,7 +74,7 @@ async def select(_, message):
 
     try:
         if not task.queued:
-            await task.update()
+            await task.update(True)
             id_ = task.gid()
             try:
                 await TorrentManager.aria2.forcePause(id_)
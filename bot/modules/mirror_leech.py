@@ -5,7 +5,6 @@ from re import match as re_match
 from .. import LOGGER, bot_loop, task_dict_lock, DOWNLOAD_DIR
 from ..helper.ext_utils.bot_utils import (
     get_content_type,
-    sync_to_async,
     arg_parser,
     COMMAND_USAGE,
 )
@@ -26,7 +25,7 @@ from ..helper.mirror_leech_utils.download_utils.direct_downloader import (
     add_direct_download,
 )
 from ..helper.mirror_leech_utils.download_utils.direct_link_generator import (
-    direct_link_generator,
+    resolve_direct_link,
 )
 from ..helper.mirror_leech_utils.download_utils.gd_download import add_gd_download
 from ..helper.mirror_leech_utils.download_utils.jd_download import add_jd_download
@@ -316,7 +315,7 @@ class Mirror(TaskListener):
             content_type = await get_content_type(self.link)
             if content_type is None or re_match(r"text/html|text/plain", content_type):
                 try:
-                    self.link = await sync_to_async(direct_link_generator, self.link)
+                    self.link = await resolve_direct_link(self.link)
                     if isinstance(self.link, tuple):
                         self.link, headers = self.link
                     elif isinstance(self.link, str):
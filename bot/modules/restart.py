@@ -12,11 +12,13 @@ from ..helper.telegram_helper.message_utils import (
 )
 from ..helper.ext_utils.db_handler import database
 from ..helper.ext_utils.files_utils import clean_all
+from ..helper.ext_utils.http_clients import HttpClients
 from ..helper.telegram_helper.button_build import ButtonMaker
 from ..core.telegram_manager import TgClient
 from ..core.config_manager import Config
 from ..core.jdownloader_booter import jdownloader
 from ..core.torrent_manager import TorrentManager
+from ..helper.mirror_leech_utils.download_utils.yt_dlp_pool import YtDlpPool
 
 
 @new_task
@@ -98,6 +100,8 @@ async def confirm_restart(_, query):
                 intvl.cancel()
         await clean_all()
         await TorrentManager.close_all()
+        await HttpClients.close_all()
+        YtDlpPool.close_all()
         if jdownloader.is_connected:
             await gather(
                 jdownloader.device.downloadcontroller.stop_downloads(),
@@ -1,4 +1,3 @@
-from httpx import AsyncClient
 from apscheduler.triggers.interval import IntervalTrigger
 from asyncio import Lock, sleep
 from datetime import datetime, timedelta
@@ -15,6 +14,7 @@ from ..core.config_manager import Config
 from ..helper.ext_utils.bot_utils import new_task, arg_parser, get_size_bytes
 from ..helper.ext_utils.status_utils import get_readable_file_size
 from ..helper.ext_utils.db_handler import database
+from ..helper.ext_utils.http_clients import HttpClients
 from ..helper.ext_utils.exceptions import RssShutdownException
 from ..helper.ext_utils.help_messages import RSS_HELP_MESSAGE
 from ..helper.telegram_helper.button_build import ButtonMaker
@@ -133,10 +133,11 @@ async def rss_sub(_, message, pre_event):
             cmd = None
             stv = False
         try:
-            async with AsyncClient(
-                headers=headers, follow_redirects=True, timeout=60, verify=False
-            ) as client:
-                res = await client.get(feed_link)
+            # Feeds are user supplied and often self-signed, so they have
+            # never been verified.
+            res = await HttpClients.get("rss", verify=False).get(
+                feed_link, headers=headers
+            )
             html = res.text
             rss_d = feed_parse(html)
             last_title = rss_d.entries[0]["title"]
@@ -346,10 +347,10 @@ async def rss_get(_, message, pre_event):
                 msg = await send_message(
                     message, f"Getting the last <b>{count}</b> item(s) from {title}"
                 )
-                async with AsyncClient(
-                    headers=headers, follow_redirects=True, timeout=60, verify=False
-                ) as client:
-                    res = await client.get(data["link"])
+                # Feeds are user supplied and often self-signed.
+                res = await HttpClients.get("rss", verify=False).get(
+                    data["link"], headers=headers
+                )
                 html = res.text
                 rss_d = feed_parse(html)
                 item_info = ""
@@ -689,13 +690,10 @@ async def rss_monitor():
                 tries = 0
                 while True:
                     try:
-                        async with AsyncClient(
-                            headers=headers,
-                            follow_redirects=True,
-                            timeout=60,
-                            verify=False,
-                        ) as client:
-                            res = await client.get(data["link"])
+                        # Feeds are user supplied and often self-signed.
+                        res = await HttpClients.get("rss", verify=False).get(
+                            data["link"], headers=headers
+                        )
                         html = res.text
                         break
                     except:
@@ -2,19 +2,13 @@ from time import time
 from re import search as research
 from asyncio import gather
 from aiofiles.os import path as aiopath
-from psutil import (
-    disk_usage,
-    cpu_percent,
-    swap_memory,
-    cpu_count,
-    virtual_memory,
-    net_io_counters,
-    boot_time,
-)
-
-from .. import bot_start_time
+from psutil import cpu_count, boot_time
+
+from .. import bot_start_time, cpu_slots
 from ..helper.ext_utils.status_utils import get_readable_file_size, get_readable_time
 from ..helper.ext_utils.bot_utils import cmd_exec, new_task
+from ..helper.ext_utils.http_clients import HttpClients
+from ..helper.ext_utils.system_stats import SystemStats
 from ..helper.telegram_helper.message_utils import send_message
 
 commands = {
@@ -29,11 +23,14 @@ commands = {
 
 @new_task
 async def bot_stats(_, message):
-    total, used, free, disk = disk_usage("/")
-    swap = swap_memory()
-    memory = virtual_memory()
-    per_cpu = cpu_percent(interval=1, percpu=True)
+    sample = SystemStats.get()
+    total, used, free, disk = sample["disks"]["/"]
+    swap = sample["swap"]
+    memory = sample["memory"]
+    net = sample["net"]
+    per_cpu = sample["per_cpu"]
     per_cpu_str = " | ".join([f"CPU{i+1}: {round(p)}%" for i, p in enumerate(per_cpu)])
+    slot_jobs = ", ".join(f"{k}: {v}" for k, v in cpu_slots.jobs.items()) or "None"
     stats = f"""
 <b>Commit Date:</b> {commands["commit"]}
 
@@ -43,12 +40,17 @@ async def bot_stats(_, message):
 <b>Total Disk Space:</b> {get_readable_file_size(total)}
 <b>Used:</b> {get_readable_file_size(used)} | <b>Free:</b> {get_readable_file_size(free)}
 
-<b>Upload:</b> {get_readable_file_size(net_io_counters().bytes_sent)}
-<b>Download:</b> {get_readable_file_size(net_io_counters().bytes_recv)}
+<b>Upload:</b> {get_readable_file_size(net.bytes_sent)}
+<b>Download:</b> {get_readable_file_size(net.bytes_recv)}
 
-<b>CPU:</b> {cpu_percent(interval=1)}%
+<b>CPU:</b> {sample["cpu"]}%
+<b>CPU Avg (1/5/15m):</b> {SystemStats.average(1)}% | {SystemStats.average(5)}% | {SystemStats.average(15)}%
+<b>RAM Avg (1/5/15m):</b> {SystemStats.average(1, "memory")}% | {SystemStats.average(5, "memory")}% | {SystemStats.average(15, "memory")}%
 <b>CPU Cores:</b>
 {per_cpu_str}
+<b>CPU Slots:</b> {cpu_slots.used}/{cpu_slots.total} | <b>Waiting:</b> {cpu_slots.waiting}
+<b>Slot Jobs:</b> {slot_jobs}
+<b>HTTP:</b> {HttpClients.summary() or "None"}
 
 <b>RAM:</b> {memory.percent}%
 <b>DISK:</b> {disk}%
@@ -1,6 +1,5 @@
-from psutil import cpu_percent, virtual_memory, disk_usage
 from time import time
-from asyncio import gather, iscoroutinefunction
+from asyncio import gather
 
 from .. import (
     task_dict_lock,
@@ -8,7 +7,6 @@ from .. import (
     task_dict,
     bot_start_time,
     intervals,
-    DOWNLOAD_DIR,
 )
 from ..core.torrent_manager import TorrentManager
 from ..core.jdownloader_booter import jdownloader
@@ -18,7 +16,9 @@ from ..helper.ext_utils.status_utils import (
     get_readable_file_size,
     get_readable_time,
     speed_string_to_bytes,
+    get_task_status,
 )
+from ..helper.ext_utils.system_stats import SystemStats
 from ..helper.telegram_helper.bot_commands import BotCommands
 from ..helper.telegram_helper.message_utils import (
     send_message,
@@ -37,11 +37,12 @@ async def task_status(_, message):
         count = len(task_dict)
     if count == 0:
         currentTime = get_readable_time(time() - bot_start_time)
-        free = get_readable_file_size(disk_usage(DOWNLOAD_DIR).free)
+        stats = SystemStats.get()
+        free = get_readable_file_size(SystemStats.free())
         msg = f"No Active Tasks!\nEach user can get status for his tasks by adding me or user_id after cmd: /{BotCommands.StatusCommand} me"
         msg += (
-            f"\n<b>CPU:</b> {cpu_percent()}% | <b>FREE:</b> {free}"
-            f"\n<b>RAM:</b> {virtual_memory().percent}% | <b>UPTIME:</b> {currentTime}"
+            f"\n<b>CPU:</b> {stats['cpu']}% | <b>FREE:</b> {free}"
+            f"\n<b>RAM:</b> {stats['memory'].percent}% | <b>UPTIME:</b> {currentTime}"
         )
         reply_message = await send_message(message, msg)
         await auto_delete_message(message, reply_message)
@@ -59,22 +60,15 @@ async def task_status(_, message):
         await delete_message(message)
 
 
-async def get_download_status(download):
-    tool = download.tool
-    if tool in [
+def get_download_speed(download):
+    if download.tool in [
         "telegram",
         "yt-dlp",
         "rclone",
         "gDriveApi",
     ]:
-        speed = download.speed()
-    else:
-        speed = 0
-    return (
-        await download.status()
-        if iscoroutinefunction(download.status)
-        else download.status()
-    ), speed
+        return download.speed()
+    return 0
 
 
 @new_task
@@ -125,45 +119,54 @@ async def status_pages(_, query):
         dl_speed = ds
         up_speed = 0
         seed_speed = ss
-        async with task_dict_lock:
-            status_results = await gather(
-                *(get_download_status(download) for download in task_dict.values())
+        downloads = task_dict.snapshot()
+        await gather(
+            *(
+                get_task_status(download)
+                for download in downloads
+                if task_dict.is_stale(download)
             )
-            for status, speed in status_results:
-                match status:
-                    case MirrorStatus.STATUS_DOWNLOAD:
-                        tasks["Download"] += 1
-                        if speed:
-                            dl_speed += speed_string_to_bytes(speed)
-                    case MirrorStatus.STATUS_UPLOAD:
-                        tasks["Upload"] += 1
-                        up_speed += speed_string_to_bytes(speed)
-                    case MirrorStatus.STATUS_SEED:
-                        tasks["Seed"] += 1
-                    case MirrorStatus.STATUS_ARCHIVE:
-                        tasks["Archive"] += 1
-                    case MirrorStatus.STATUS_EXTRACT:
-                        tasks["Extract"] += 1
-                    case MirrorStatus.STATUS_SPLIT:
-                        tasks["Split"] += 1
-                    case MirrorStatus.STATUS_QUEUEDL:
-                        tasks["QueueDl"] += 1
-                    case MirrorStatus.STATUS_QUEUEUP:
-                        tasks["QueueUp"] += 1
-                    case MirrorStatus.STATUS_CLONE:
-                        tasks["Clone"] += 1
-                    case MirrorStatus.STATUS_CHECK:
-                        tasks["CheckUp"] += 1
-                    case MirrorStatus.STATUS_PAUSED:
-                        tasks["Pause"] += 1
-                    case MirrorStatus.STATUS_SAMVID:
-                        tasks["SamVid"] += 1
-                    case MirrorStatus.STATUS_CONVERT:
-                        tasks["ConvertMedia"] += 1
-                    case MirrorStatus.STATUS_FFMPEG:
-                        tasks["FFmpeg"] += 1
-                    case _:
-                        tasks["Download"] += 1
+        )
+        for download in downloads:
+            status = task_dict.statuses.get(download.listener.mid)
+            if status == MirrorStatus.STATUS_UPLOAD:
+                up_speed += speed_string_to_bytes(get_download_speed(download) or "0")
+            elif status == MirrorStatus.STATUS_DOWNLOAD and (
+                speed := get_download_speed(download)
+            ):
+                dl_speed += speed_string_to_bytes(speed)
+        for status, count in list(task_dict.status_counts.items()):
+            match status:
+                case MirrorStatus.STATUS_DOWNLOAD:
+                    tasks["Download"] += count
+                case MirrorStatus.STATUS_UPLOAD:
+                    tasks["Upload"] += count
+                case MirrorStatus.STATUS_SEED:
+                    tasks["Seed"] += count
+                case MirrorStatus.STATUS_ARCHIVE:
+                    tasks["Archive"] += count
+                case MirrorStatus.STATUS_EXTRACT:
+                    tasks["Extract"] += count
+                case MirrorStatus.STATUS_SPLIT:
+                    tasks["Split"] += count
+                case MirrorStatus.STATUS_QUEUEDL:
+                    tasks["QueueDl"] += count
+                case MirrorStatus.STATUS_QUEUEUP:
+                    tasks["QueueUp"] += count
+                case MirrorStatus.STATUS_CLONE:
+                    tasks["Clone"] += count
+                case MirrorStatus.STATUS_CHECK:
+                    tasks["CheckUp"] += count
+                case MirrorStatus.STATUS_PAUSED:
+                    tasks["Pause"] += count
+                case MirrorStatus.STATUS_SAMVID:
+                    tasks["SamVid"] += count
+                case MirrorStatus.STATUS_CONVERT:
+                    tasks["ConvertMedia"] += count
+                case MirrorStatus.STATUS_FFMPEG:
+                    tasks["FFmpeg"] += count
+                case _:
+                    tasks["Download"] += count
 
         msg = f"""<b>DL:</b> {tasks['Download']} | <b>UP:</b> {tasks['Upload']} | <b>SD:</b> {tasks['Seed']} | <b>AR:</b> {tasks['Archive']}
 <b>EX:</b> {tasks['Extract']} | <b>SP:</b> {tasks['Split']} | <b>QD:</b> {tasks['QueueDl']} | <b>QU:</b> {tasks['QueueUp']}
@@ -1,23 +1,24 @@
-from httpx import AsyncClient
 from asyncio import wait_for, Event
 from functools import partial
 from pyrogram.filters import regex, user
 from pyrogram.handlers import CallbackQueryHandler
 from time import time
-from yt_dlp import YoutubeDL
 
 from .. import LOGGER, bot_loop, task_dict_lock, DOWNLOAD_DIR
 from ..core.config_manager import Config
 from ..helper.ext_utils.bot_utils import (
     new_task,
-    sync_to_async,
     arg_parser,
     COMMAND_USAGE,
 )
+from ..helper.ext_utils.http_clients import HttpClients
 from ..helper.ext_utils.links_utils import is_url
 from ..helper.ext_utils.status_utils import get_readable_file_size, get_readable_time
 from ..helper.listeners.task_listener import TaskListener
-from ..helper.mirror_leech_utils.download_utils.yt_dlp_download import YoutubeDLHelper
+from ..helper.mirror_leech_utils.download_utils.yt_dlp_download import (
+    YoutubeDLHelper,
+    YtInfoCache,
+)
 from ..helper.telegram_helper.button_build import ButtonMaker
 from ..helper.telegram_helper.message_utils import (
     send_message,
@@ -230,20 +231,13 @@ class YtSelection:
         await edit_message(self._reply_to, msg, subbuttons)
 
 
-def extract_info(link, options):
-    with YoutubeDL(options) as ydl:
-        result = ydl.extract_info(link, download=False)
-        if result is None:
-            raise ValueError("Info result is None")
-        return result
-
-
 async def _mdisk(link, name):
     key = link.split("/")[-1]
-    async with AsyncClient(verify=False) as client:
-        resp = await client.get(
-            f"https://diskuploader.entertainvideo.com/v1/file/cdnurl?param={key}"
-        )
+    # Skips verification as the old per-call client did, so mdisk links that
+    # resolved before keep resolving.
+    resp = await HttpClients.get("ytdlp", verify=False).get(
+        f"https://diskuploader.entertainvideo.com/v1/file/cdnurl?param={key}"
+    )
     if resp.status_code == 200:
         resp_json = resp.json()
         link = resp_json["source"]
@@ -443,9 +437,8 @@ class YtDlp(TaskListener):
                     else:
                         qual = value
                 options[key] = value
-        options["playlist_items"] = "0"
         try:
-            result = await sync_to_async(extract_info, self.link, options)
+            result = await YtInfoCache.extract(self.link, options)
         except Exception as e:
             msg = str(e).replace("<", " ").replace(">", " ")
             await send_message(self.message, f"{self.tag} {msg}")
@@ -5,6 +5,7 @@ TELEGRAM_API = 0
 TELEGRAM_HASH = ""
 # OPTIONAL CONFIG
 TG_PROXY = {}
+TG_DOWNLOAD_CONNECTIONS = 4
 USER_SESSION_STRING = ""
 CMD_SUFFIX = ""
 AUTHORIZED_CHATS = ""
@@ -19,6 +20,7 @@ EXCLUDED_EXTENSIONS = ""
 INCLUDED_EXTENSIONS = ""
 INCOMPLETE_TASK_NOTIFIER = False
 YT_DLP_OPTIONS = ""
+YT_DLP_WORKERS = 2
 USE_SERVICE_ACCOUNTS = False
 NAME_SUBSTITUTE = ""
 FFMPEG_CMDS = {}
@@ -67,6 +69,8 @@ UPSTREAM_REPO = ""
 UPSTREAM_BRANCH = "master"
 # Leech
 LEECH_SPLIT_SIZE = 0
+LEECH_UPLOAD_WORKERS = 3
+LEECH_VIRTUAL_SPLIT = True
 AS_DOCUMENT = False
 EQUAL_SPLITS = False
 MEDIA_GROUP = False
@@ -77,6 +81,7 @@ LEECH_DUMP_CHAT = ""
 THUMBNAIL_LAYOUT = ""
 # qBittorrent/Aria2c
 TORRENT_TIMEOUT = 0
+DIRECT_DOWNLOAD_WORKERS = 4
 BASE_URL = ""
 BASE_URL_PORT = 0
 WEB_PINCODE = False
@@ -84,6 +89,7 @@ WEB_PINCODE = False
 QUEUE_ALL = 0
 QUEUE_DOWNLOAD = 0
 QUEUE_UPLOAD = 0
+QUEUE_USER_LIMIT = 0
 # RSS
 RSS_DELAY = 600
 RSS_CHAT = ""